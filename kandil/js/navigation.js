@@ -262,6 +262,11 @@ var app = {
   table2.find("td").slice(1).append(qs[1].input);
   kandil.$.modpanel.prepend(table2);
 
+  // The search index is shared and loaded on the first search.
+  qs[0].index = qs[1].index = new SearchIndex("search");
+  Object.getter(qs[0], "moduleFQN", function(){return kandil.moduleFQN});
+  qs[1].moduleFQN = "";
+
   qs[0].input.tag_selector = "#apipanel .tview";
   Object.getter(qs[0].input, "symbols", function(){return kandil.symbolTree});
   $.extend(qs[1].input,
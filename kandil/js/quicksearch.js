@@ -60,6 +60,8 @@ function QuickSearch(id, options)
     var terms = this.str.split(/\s+/); // Split by whitespace.
     var query = {terms: [], attr_terms: [], fqn_terms: []};
     var qterms = query.terms;
+    // The name terms which can be looked up in the search index.
+    var index_terms = [];
     try
     {
       for (var i = 0, len = terms.length; i < len; i++)
@@ -70,18 +72,23 @@ function QuickSearch(id, options)
         //else if (term[0] == '/')
         //  qterms.push(RegExp(term.slice(1,-1), "i"));
         else if (/\.\.$/.test(term))
-          qterms.push(new LevenTerm(term));
+          qterms.push(new LevenTerm(term)),
+          index_terms && index_terms.push(term);
         else if (term.indexOf(".") != -1)
           query.fqn_terms.push(makeRegExp(term));
         else if (term.indexOf("*") != -1)
-          qterms.push(makeRegExp(term));
+          qterms.push(makeRegExp(term)), (index_terms = null);
         else
-          qterms.push(RegExp(RegExp.escape(term), "i"));
+          qterms.push(RegExp(RegExp.escape(term), "i")),
+          index_terms && index_terms.push(term);
       }
     }
     catch(e) {
       return false;
     }
+    // Look up the names in the index instead of matching every symbol.
+    if (this.index && index_terms && index_terms.length)
+      query.name_matches = this.index.matches(index_terms);
     this.query = query;
     return terms.length != 0;
   };
@@ -110,6 +117,163 @@ function LevenTerm(term)
   return this;
 }
 
+/// Constructs a SearchIndex object. Loads the index shards
+/// written by scripts/searchindex.py from the folder url when needed.
+function SearchIndex(url)
+{
+  this.url = url;
+  this.meta = undefined; // The contents of index.json, or null.
+  this.shards = {}; // Entry shards by shard ID.
+  this.gram_shards = {}; // N-gram shards by shard ID.
+  return this;
+}
+
+SearchIndex.prototype = {
+  /// Loads and parses a JSON file. Returns null on failure.
+  load: function(file) {
+    try {
+      var xhr = $.ajax({
+        url: this.url+"/"+file, dataType: "text", async: false
+      });
+      return JSON.parse(xhr.responseText);
+    }
+    catch(e) {
+      return null;
+    }
+  },
+  /// Returns true if the index exists.
+  ready: function() {
+    if (this.meta === undefined)
+      this.meta = this.load("index.json");
+    return this.meta != null;
+  },
+  /// Returns the shard ID of a lower-case name or n-gram.
+  shardID: function(key) {
+    key = key.replace(/^\^+/, "");
+    return key ? key.charCodeAt(0).toString(16) : "0";
+  },
+  /// Returns the entry with the index i:
+  /// [name, fqn, kind ID, module index].
+  entry: function(i) {
+    var shards = this.meta.shards;
+    for (var id in shards)
+    {
+      var range = shards[id];
+      if (range[0] <= i && i < range[0] + range[1])
+      {
+        if (!this.shards[id])
+          this.shards[id] = this.load("s_"+id+".json") || [];
+        return this.shards[id][i - range[0]];
+      }
+    }
+  },
+  /// Returns the sorted indices of the entries which contain a n-gram.
+  gramList: function(gram) {
+    var id = this.shardID(gram), shard = this.gram_shards[id];
+    if (!shard)
+      shard = this.gram_shards[id] = this.load("g_"+id+".json") || {};
+    var list = shard["."+gram];
+    if (!list)
+    { // Decode the differences of the indices.
+      var deltas = shard[gram] || [], n = 0;
+      list = shard["."+gram] = [];
+      for (var i = 0, len = deltas.length; i < len; i++)
+        list.push(n += deltas[i]);
+    }
+    return list;
+  },
+  /// Returns the distinct n-grams of a text. If padded is true,
+  /// the text is padded with n-1 "^" and "$" like in the index.
+  grams: function(text, padded) {
+    var n = this.meta.ngram_size, grams = [], seen = {};
+    if (padded)
+      text = Array(n).join("^") + text + Array(n).join("$");
+    for (var i = 0; i + n <= text.length; i++)
+    {
+      var gram = text.slice(i, i+n);
+      if (!seen["."+gram])
+        (seen["."+gram] = true), grams.push(gram);
+    }
+    return grams;
+  },
+  /// Returns the entries whose names contain text,
+  /// or null if text is shorter than a n-gram.
+  contains: function(text) {
+    text = text.toLowerCase();
+    var grams = this.grams(text);
+    if (!grams.length)
+      return null;
+    var count = {}, result = [];
+    for (var i = 0, len = grams.length; i < len; i++)
+    {
+      var list = this.gramList(grams[i]);
+      for (var j = 0, len2 = list.length; j < len2; j++)
+        count[list[j]] = (count[list[j]] || 0) + 1;
+    }
+    for (var k in count)
+      if (count[k] == grams.length)
+      {
+        var e = this.entry(+k);
+        if (e[0].toLowerCase().indexOf(text) != -1)
+          result.push(e);
+      }
+    return result;
+  },
+  /// Returns the entries whose names are at most max edits away from text,
+  /// or null if text is too short to narrow down the candidates.
+  fuzzy: function(text, max) {
+    text = text.toLowerCase();
+    var grams = this.grams(text, true);
+    // An edit removes at most n of the n-grams of a text.
+    var min_shared = grams.length - max * this.meta.ngram_size;
+    if (min_shared <= 0)
+      return null;
+    var count = {}, result = [];
+    for (var i = 0, len = grams.length; i < len; i++)
+    {
+      var list = this.gramList(grams[i]);
+      for (var j = 0, len2 = list.length; j < len2; j++)
+        count[list[j]] = (count[list[j]] || 0) + 1;
+    }
+    for (var k in count)
+      if (count[k] >= min_shared)
+      {
+        var e = this.entry(+k);
+        if (levenshtein_distance(text, e[0].toLowerCase()) <= max)
+          result.push(e);
+      }
+    return result;
+  },
+  /// Returns a dictionary of the keys (see matchKey()) of the entries
+  /// matching any of the terms, or null if a term can't be looked up.
+  matches: function(terms) {
+    if (!this.ready())
+      return null;
+    var dict = new Symbol.dict();
+    for (var i = 0, len = terms.length; i < len; i++)
+    {
+      var term = terms[i], m = term.match(/^(.+?)(\.+)$/);
+      var entries = m ? this.fuzzy(m[1], m[2].length) : this.contains(term);
+      if (!entries)
+        return null;
+      for (var j = 0, len2 = entries.length; j < len2; j++)
+      {
+        var e = entries[j], module = this.meta.modules[e[3]];
+        dict.set(SearchIndex.matchKey(e[1], SymbolKind.toStr[e[2]],
+          module), true);
+      }
+    }
+    return dict;
+  },
+};
+
+/// Returns the key of a symbol in the dictionary returned by matches().
+/// Packages and modules have unique FQNs; other symbols are prefixed
+/// with the FQN of their module.
+SearchIndex.matchKey = function(fqn, kind, moduleFQN) {
+  return (kind == "package" || kind == "module") ? fqn : moduleFQN+":"+fqn;
+};
+
 /// Prepares symbols for the search algorithm.
 function extendSymbols(ul, symbolTree)
 {
@@ -153,6 +317,8 @@ function quick_search(qs, symbols)
   var hasUnmatched = false; // Whether any item in the tree didn't match.
   // List of query terms.
   var tlist = [qs.query.terms, qs.query.fqn_terms, qs.query.attr_terms];
+  // The names found in the search index, if it could be used.
+  var name_matches = qs.query.name_matches;
   for (var i = 0, len = symbols.length; i < len; i++)
   {
     if (qs.cancelSearch) // Did the user cancel?
@@ -164,8 +330,11 @@ function quick_search(qs, symbols)
     li.removeClass("match|parent_of_match|has_hidden|show_hidden");
     // Do the actual text searching:
     var texts = [symbol.name, symbol.fqn, symbol.qs_attrs];
+    if (name_matches && name_matches.get(SearchIndex.matchKey(symbol.fqn,
+          symbol.kind, qs.moduleFQN)))
+      itemMatched = true;
   SearchLoop:
-    for (var j = 0; j < 3; j++)
+    for (var j = name_matches ? 1 : 0; j < 3 && !itemMatched; j++)
     {
       var text = texts[j], terms = tlist[j];
       for (var k = 0, len2 = terms.length; k < len2; k++)
@@ -12,15 +12,16 @@ class Command:
     self.exe = exe
   def args(self):
     return []
-  def call(self):
-    """ Executes the compiler executable. """
+  def call(self, **kwargs):
+    """ Executes the compiler executable.
+      kwargs are passed to subprocess.call(). """
     args = self.args()
     exe = self.exe
     if self.use_wine:
       args = [exe] + args
       exe = "wine"
     try:
-      subprocess.call([exe] + args)
+      return subprocess.call([exe] + args, **kwargs)
     except OSError as e:
       e.exe = exe
       raise e
@@ -92,6 +93,158 @@ class LDCCommand(DMDCommand):
   def __init__(self, files, out_exe, exe=cmd, **kwargs):
     DMDCommand.__init__(self, files, out_exe, exe=exe, **kwargs)
 
+rx_import = re.compile(r"\bimport\s+([^;]+);")
+rx_module_name = re.compile(r"(?:\w+\s*=\s*)?(\w+(?:\s*\.\s*\w+)*)")
+
+def find_imports(path):
+  """ Returns the FQNs of the modules imported by a D source file.
+    (May contain a few false positives, e.g. from comments.) """
+  imports = set()
+  for m in rx_import.finditer(path.open().read()):
+    names = m.group(1).split(":")[0] # Strip the selective imports.
+    for name in names.split(","):
+      name = rx_module_name.match(name.strip())
+      if name:
+        imports.add(re.sub(r"\s+", "", name.group(1)))
+  return imports
+
+def find_packages(src, files):
+  """ Groups the source files by package.
+    Returns a dict of package names to lists of files, and a dict of
+    package names to the names of the packages they import. """
+  fqns = dict((get_module_fqn(src, f), f) for f in files)
+  package_of = lambda f: get_module_fqn(src, f.folder) or "_"
+  packages, imports = {}, {}
+  for f in files:
+    packages.setdefault(package_of(f), []).append(f)
+  for name, pfiles in packages.items():
+    imported = set()
+    for f in pfiles:
+      imported.update(package_of(fqns[m]) for m in find_imports(f)
+                      if m in fqns)
+    imported.discard(name)
+    imports[name] = sorted(imported)
+  return packages, imports
+
+def import_closure(imports):
+  """ Returns a dict of package names to the sorted names of all packages
+    they import directly or indirectly. """
+  closure = {}
+  for name in imports:
+    seen, stack = set(), list(imports[name])
+    while stack:
+      dep = stack.pop()
+      if dep not in seen:
+        seen.add(dep)
+        stack.extend(imports.get(dep, ()))
+    seen.discard(name)
+    closure[name] = sorted(seen)
+  return closure
+
+def compiler_version(exe, use_wine=False):
+  """ Returns the first line the compiler prints when it's called
+    with --version (dmd and ldc print their version), or exe itself
+    if it can't be run. """
+  args = (["wine"] if use_wine else []) + [exe, "--version"]
+  try:
+    p = subprocess.Popen(args, stdout=subprocess.PIPE,
+                         stderr=subprocess.STDOUT)
+    output = p.communicate()[0]
+  except OSError:
+    return exe
+  lines = output.decode("u8", "replace").strip().splitlines()
+  return lines[0] if lines else exe
+
+def build_dil_incremental(Command, FILES, exe_dest, use_wine, cmd_kwargs,
+                          jobs=None):
+  """ Compiles each package of dil into its own folder in obj/ and
+    links the objects. A package's folder is named after the hash of
+    its sources, the sources of all packages it imports (directly or
+    indirectly), the compiler's version and the compiler flags.
+    Packages with an existing folder are not recompiled, and dil isn't
+    relinked if no package changed. """
+  from multiprocessing.pool import ThreadPool
+  import hashlib
+  OBJ = Path(cmd_kwargs.pop("objdir", "obj"))
+  OBJ.mkdir()
+  # Packages are compiled separately, so they need src/ to find
+  # the modules they import.
+  cmd_kwargs = dict(cmd_kwargs,
+    includes=cmd_kwargs.get("includes", []) + ["src"])
+  other = [a for a in cmd_kwargs.get("other", []) if a != "-c"]
+  flags = Command([], None, objdir=None, **dict(cmd_kwargs, other=other))
+  flags = "\n".join([compiler_version(flags.exe, use_wine),
+                     " ".join([flags.exe] + flags.args())])
+
+  packages, imports = find_packages(Path("src"), FILES)
+  imports = import_closure(imports)
+  src_hashes = {} # Hashes of the sources of each package.
+  for name, files in packages.items():
+    h = hashlib.sha1()
+    for f in sorted(files):
+      h.update(f.encode("u8") + b"\n")
+      hash_file(f, h)
+    src_hashes[name] = h.hexdigest()
+  keys = {} # The object folders of the packages.
+  for name in packages:
+    h = hashlib.sha1(flags.encode("u8") + b"\n")
+    for dep in [name] + imports[name]:
+      h.update(src_hashes[dep].encode("u8"))
+    keys[name] = OBJ/("%s-%s" % (name, h.hexdigest()[:16]))
+
+  def compile(name):
+    """ Compiles the files of a package into a temporary folder,
+      which is renamed when the compiler succeeded. """
+    dest = keys[name]
+    tmp = dest + ".tmp"
+    tmp.rmtree()
+    cmd = Command(packages[name], None, objdir=tmp,
+                  **dict(cmd_kwargs, other=other + ["-c"]))
+    cmd.use_wine = use_wine
+    print(cmd)
+    if cmd.call() != 0:
+      return False
+    tmp.rename(dest)
+    return True
+  stale = sorted(name for name in packages if not keys[name].exists)
+  pool = ThreadPool(jobs or None)
+  try:
+    results = pool.map(compile, stale)
+  finally:
+    pool.close()
+  if not all(results):
+    return print("Error: failed to compile: " +
+      ", ".join(n for n, ok in zip(stale, results) if not ok))
+
+  # Remove the object folders of older builds.
+  current = set(keys.values())
+  for folder in OBJ.glob("*-*"):
+    if folder not in current and re.search("-[0-9a-f]{16}$", folder):
+      folder.rmtree()
+
+  if exe_dest == None:
+    return
+  # Relink only if the set of object folders or the flags changed.
+  link_key = hashlib.sha1(flags.encode("u8") + "".join(
+    sorted(current)).encode("u8")).hexdigest()
+  link_key_file = OBJ/"link.key"
+  # Under wine, exe_dest has backslashes for the command line only.
+  exe_path = Path(exe_dest.replace("\\", "/") if use_wine else exe_dest)
+  if exe_path.exists and link_key_file.exists and \
+     link_key_file.open().read() == link_key:
+    return print("dil is up to date.")
+  objects = []
+  for folder in sorted(current):
+    for root, dirs, files in folder.walk():
+      objects += [Path(root)/f for f in files
+                  if Path(f).ext in (".o", ".obj")]
+  cmd = Command(objects, exe_dest, objdir=None, **dict(cmd_kwargs,
+                other=other))
+  cmd.use_wine = use_wine
+  print(cmd)
+  if cmd.call() == 0:
+    link_key_file.open("w").write(link_key)
+
 def build_dil(cmd_kwargs):
   """ Collects D source files and calls the compiler. """
   BIN = Path("bin")
@@ -104,6 +257,8 @@ def build_dil(cmd_kwargs):
   # Pick a compiler class.
   Command = cmd_kwargs.get("CMDCLASS", DMDCommand)
   use_wine = cmd_kwargs.get("wine", False)
+  incremental = cmd_kwargs.pop("incremental", False)
+  jobs = cmd_kwargs.pop("jobs", None)
   del cmd_kwargs["CMDCLASS"]
   del cmd_kwargs["wine"]
   # Run the compiler.
@@ -112,10 +267,13 @@ def build_dil(cmd_kwargs):
     exe_dest = (exe_dest+".exe").replace("/", "\\")
   if "-c" in cmd_kwargs["other"]: # Only compile objects?
     exe_dest = None
-  cmd = Command(FILES, exe_dest, **cmd_kwargs)
-  cmd.use_wine = use_wine
-  print(cmd)
   try:
+    if incremental:
+      return build_dil_incremental(Command, FILES, exe_dest, use_wine,
+                                   cmd_kwargs, jobs)
+    cmd = Command(FILES, exe_dest, **cmd_kwargs)
+    cmd.use_wine = use_wine
+    print(cmd)
     cmd.call()
   except OSError as e:
     if e.errno == 2:
@@ -154,6 +312,11 @@ def main():
     help="build unit tests (recommended for first run)")
   parser.add_option("--wine", dest="wine", action="store_true", default=False,
     help="use wine to build a Windows binary on Linux")
+  parser.add_option("-i", "--incremental", dest="incremental",
+    action="store_true", default=False,
+    help="compile the packages separately and reuse unchanged objects")
+  parser.add_option("-j", "--jobs", dest="jobs", metavar="N", default=None,
+    type="int", help="compile N packages in parallel (with -i)")
 
   args, other_args = sys.uargv[1:], []
   try:
@@ -178,7 +341,8 @@ def main():
   build_func = (build_dil_release, build_dil_debug)[options.debug]
   # Call the compiler with the provided options.
   build_func(CMDCLASS=command, wine=options.wine, versions=versions,
-    lnk_args=lnk_args, other=other_args)
+    lnk_args=lnk_args, other=other_args, incremental=options.incremental,
+    jobs=options.jobs)
 
 if __name__ == '__main__':
   main()
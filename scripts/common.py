@@ -3,6 +3,7 @@
 # License: zlib/libpng
 from __future__ import unicode_literals, print_function
 import os, re, sys
+import hashlib
 import subprocess
 from path import Path
 
@@ -102,8 +103,6 @@ def generate_modules_js(modlist, dest_path, max_line_len=80):
   if not len(modlist):
     raise Exception("modlist must not be empty")
   from symbols import Module, PackageTree
-  # Create a new PackageTree.
-  package_tree = PackageTree()
   # Open the file and begin writing to it.
   f = open(dest_path, "w")
   f.write('var g_moduleList = [\n ') # Write a flat list of FQNs.
@@ -116,11 +115,11 @@ def generate_modules_js(modlist, dest_path, max_line_len=80):
       line_len = len(line)+1 # +1 for the space in "\n ".
       line = "\n " + line
     f.write(line)
-
-    # Construct the package tree with modules as leafs.
-    package_tree.addModule(Module(mod))
   f.write('\n];\n\n') # Closing ].
 
+  # Construct the sorted package tree with modules as leafs.
+  package_tree = PackageTree.from_modules(Module(m['fqn']) for m in modlist)
+
   def writePackage(package, indent='  '):
     """ Writes the sub-packages and sub-modules of a package to the disk. """
     for p in package.packages:
@@ -130,8 +129,6 @@ def generate_modules_js(modlist, dest_path, max_line_len=80):
     for m in package.modules:
       f.write("%sM('%s'),\n" % (indent, m.fqn))
 
-  # Sort the tree.
-  package_tree.sortTree()
   # Write the packages and modules as JavaScript objects.
   f.write("var g_packageTree = new PackageTree(P('', [\n");
   writePackage(package_tree.root)
@@ -143,6 +140,19 @@ def generate_modules_js(modlist, dest_path, max_line_len=80):
 
   f.close()
 
+def generate_search_index(dest, modlist):
+  """ Writes the sharded search index of the symbols in dest/symbols/
+      into dest/search/, which kandil's quick search loads. """
+  from symbols import ModuleJSON, PackageTree
+  from searchindex import SearchIndex
+  dest = doc_path(dest)
+  package_tree = PackageTree.from_modules(
+    ModuleJSON(dest.SYMBOLS, m['fqn'], categorize=False) for m in modlist
+    if (dest.SYMBOLS/(m['fqn']+".json")).exists)
+  index = SearchIndex.from_tree(package_tree)
+  (dest/"search").rmtree()
+  index.save_shards(dest/"search")
+
 def generate_docs(dil_exe, dest, modlist, files,
                   versions=[], options=[], cwd=None):
   """ Generates documenation files. """
@@ -150,28 +160,227 @@ def generate_docs(dil_exe, dest, modlist, files,
   args = ["ddoc", dest, "-m="+modlist] + options + versions + files
   return subprocess.call([dil_exe] + args, cwd=cwd)
 
+def hash_file(path, h=None):
+  """ Returns the SHA-1 hex digest of a file's content. """
+  h = h or hashlib.sha1()
+  f = open(path, "rb")
+  for chunk in iter(lambda: f.read(1 << 16), b""):
+    h.update(chunk)
+  f.close()
+  return h.hexdigest()
+
+def split_shards(files, n, getsize=os.path.getsize):
+  """ Splits files into at most n lists of about the same total size.
+      The files keep their relative order in each list. """
+  shards = [[] for i in range(min(n, len(files)))]
+  sizes = [0] * len(shards)
+  file_sizes = map(getsize, files)
+  order = sorted(range(len(files)), key=lambda i: -file_sizes[i])
+  for i in order: # Add the largest files first, to the smallest shard.
+    s = sizes.index(min(sizes))
+    shards[s].append(i)
+    sizes[s] += file_sizes[i]
+  return [[files[i] for i in sorted(shard)] for shard in shards]
+
+def generate_docs_parallel(dil_exe, dest, modlist, files,
+                           versions=[], options=[], cwd=None,
+                           jobs=None, manifest=None):
+  """ Like generate_docs(), but shards the D files across several
+      'dil ddoc' processes (default: one per CPU) and merges their module
+      lists into modlist. Macro files (*.ddoc) are passed to every process.
+      If manifest is the path of a JSON file, the content hashes of the
+      inputs are recorded in it, and the files that didn't change since
+      the last run (including the macro files, versions, options and dil
+      itself) are skipped.
+      Returns the highest return code and the module list entries
+      (as returned by read_modules_list()) of the regenerated files. """
+  import json, multiprocessing, tempfile
+  dest = Path(dest)
+  jobs = jobs or multiprocessing.cpu_count()
+  macro_files = [f for f in files if Path(f).ext.lower() == ".ddoc"]
+  src_files = [f for f in files if Path(f).ext.lower() != ".ddoc"]
+  join = lambda path: Path(cwd)/path if cwd else Path(path)
+
+  # Everything that affects all files goes into the configuration hash.
+  h = hashlib.sha1()
+  # dil_exe may be a command name that is found in PATH.
+  exe = join(dil_exe)
+  exe = exe if exe.exists else locate_command(dil_exe)
+  if exe:
+    exe = os.stat(exe)
+    h.update(("%s %d %d\n" % (dil_exe, exe.st_size, exe.st_mtime)).encode("u8"))
+  else: # Unknown; subprocess reports the error below.
+    h.update(dil_exe.encode("u8") + b"\n")
+  h.update(" ".join([dest] + options + versions).encode("u8") + b"\n")
+  for f in macro_files:
+    h.update(f.encode("u8") + b"\n")
+    hash_file(join(f), h)
+  config = h.hexdigest()
+
+  # Find the files that have to be (re)generated.
+  old = {"config": None, "files": {}}
+  if manifest and Path(manifest).exists:
+    try:
+      old = json.load(open(manifest))
+    except ValueError:
+      pass # A corrupt manifest regenerates everything.
+  old_files = old["files"] if old["config"] == config else {}
+  hashes = dict((f, hash_file(join(f))) for f in src_files)
+  ext = ".xml" if "--xml" in options else ".html"
+  def is_stale(f):
+    return f not in old_files or old_files[f]["hash"] != hashes[f] or \
+      not (join(dest)/(old_files[f]["fqn"] + ext)).exists
+  stale = filter(is_stale, src_files)
+
+  # Run one 'dil ddoc' process per shard.
+  versions_ = ["-version="+v for v in versions]
+  tmp = Path(tempfile.mkdtemp(prefix="ddoc"))
+  procs = []
+  for i, shard in enumerate(split_shards(stale, jobs,
+                                         lambda f: os.path.getsize(join(f)))):
+    shard_list = tmp/("modules%d.txt" % i)
+    args = ["ddoc", dest, "-m="+shard_list] + options + versions_ + \
+      macro_files + shard
+    procs.append((subprocess.Popen([dil_exe] + args, cwd=cwd), shard_list))
+  retcode = 0
+  updated = []
+  for p, shard_list in procs:
+    retcode = max(retcode, p.wait())
+    if shard_list.exists:
+      updated += read_modules_list(shard_list)
+  tmp.rmtree()
+
+  # Merge the module lists in the order of the files.
+  entries = dict((m['path'], m) for m in updated)
+  for f in src_files:
+    if f not in stale and f in old_files:
+      entries.setdefault(f, {'path': f, 'fqn': old_files[f]["fqn"]})
+  modules = [entries[f] for f in src_files if f in entries]
+  src_set = set(src_files) # Add the entries that dil listed differently.
+  modules += [m for m in updated if m['path'] not in src_set]
+  f = open(join(modlist), "w")
+  for m in modules:
+    f.write("%s, %s\n" % (m['path'], m['fqn']))
+  f.close()
+  if "--kandil" in options and modules:
+    # Each process wrote only the modules of its shard to modules.js.
+    generate_modules_js(modules, join(dest)/"js"/"modules.js")
+
+  if manifest:
+    # Files that failed to be processed aren't recorded, so they are retried.
+    json.dump({"config": config, "files": dict(
+      (m['path'], {"hash": hashes[m['path']], "fqn": m['fqn']})
+      for m in modules if m['path'] in hashes)}, open(manifest, "w"),
+      indent=1, sort_keys=True)
+  return retcode, updated
+
 def generate_pymodules(dil_exe, dest, files, options=[], cwd=None):
   """ Generates Python source files. """
   subprocess.call([dil_exe, "py", dest] + options + files, cwd=cwd)
 
+def tar_archiver(path, mode):
+  """ Returns the functions add(arcname, stat, data) and close(),
+      which write a tar archive with the compression mode ("gz", "bz2"). """
+  import tarfile
+  from cStringIO import StringIO
+  tar = tarfile.open(path, "w:" + mode)
+  def add(arcname, st, data):
+    info = tarfile.TarInfo(arcname.encode("utf-8"))
+    info.mode = st.st_mode & 0o7777
+    info.mtime = st.st_mtime
+    info.uid = info.gid = 0 # Like 'tar --owner root --group root'.
+    info.uname = info.gname = b"root"
+    if data == None:
+      info.type = tarfile.DIRTYPE
+      return tar.addfile(info)
+    info.size = len(data)
+    tar.addfile(info, StringIO(data))
+  return add, tar.close
+
+def zip_archiver(path):
+  """ Like tar_archiver(), but writes a zip archive. """
+  import zipfile, time
+  z = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+  def add(arcname, st, data):
+    if data == None:
+      arcname += "/"
+    info = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    info.external_attr = (st.st_mode & 0xFFFF) << 16
+    info.compress_type = zipfile.ZIP_DEFLATED if data else zipfile.ZIP_STORED
+    z.writestr(info, data or b"")
+  return add, z.close
+
+def walk_archive(src, cwd=None):
+  """ Yields (arcname, stat, data) for the folder src and everything in it.
+      data is None for folders. The arcnames are relative to cwd. """
+  root = Path(cwd)/src if cwd else Path(src)
+  for folder, dirs, files in os.walk(root, followlinks=True):
+    dirs.sort()
+    arcfolder = Path(src)/folder[len(root):].lstrip(os.sep)
+    yield arcfolder.rstrip(os.sep), os.stat(folder), None
+    for name in sorted(files):
+      path = Path(folder)/name
+      yield arcfolder/name, os.stat(path), open(path, "rb").read()
+
 def create_archives(opts, src, dest, cwd):
-  """ Calls archiving programs to archive the src folder. """
+  """ Archives the src folder in all formats requested in opts.
+      The tar.gz, tar.bz2 and zip archives are written in-process by
+      one thread each, from a single pass over the files. (The compressors
+      release the GIL, so the archives are compressed in parallel.)
+      The 7z archive is created by '7zr' at the same time. """
+  import threading, Queue
   cwd = cwd or None # Causes exception in call() if empty string.
-  for which, cmd in zip(
-    ('tar_gz', 'tar_bz2', 'zip', '_7z'),
-    ("tar --owner root --group root -czf %(name)s.tar.gz",
-     "tar --owner root --group root --bzip2 -cf %(name)s.tar.bz2",
-     "zip -q -9 -r %(name)s.zip",
-     "7zr a %(name)s.7z")):
-    if not getattr(opts, which, False): continue
-    cmd = cmd.split(' ') # Split into array as call() requires it.
+  join = lambda path: Path(cwd)/path if cwd else Path(path)
+  archivers = []
+  for which, ext, make in (
+      ('tar_gz', ".tar.gz", lambda p: tar_archiver(p, "gz")),
+      ('tar_bz2', ".tar.bz2", lambda p: tar_archiver(p, "bz2")),
+      ('zip', ".zip", zip_archiver)):
+    if getattr(opts, which, False):
+      print("\n", "Writing %s" % (dest + ext))
+      archivers.append(make(join(dest + ext)))
+
+  process = None
+  if getattr(opts, '_7z', False):
+    cmd = ["7zr", "a", dest + ".7z", src]
     if not locate_command(cmd[0]):
       print("Error: the utility '%s' is not in your PATH." % cmd[0])
-      continue
-    cmd[-1] = cmd[-1] % {'name':dest} # Format the destination parameter.
-    cmd += [src] # Append the src parameter.
-    print("\n", " ".join(cmd))
-    subprocess.call(cmd, cwd=cwd) # Call the program.
+    else:
+      print("\n", " ".join(cmd))
+      process = subprocess.Popen(cmd, cwd=cwd)
+
+  errors = []
+  def consume(queue, add, close):
+    """ Runs in a thread per archive. """
+    done = False # Whether the end of the queue was reached.
+    try:
+      for item in iter(queue.get, None):
+        add(*item)
+      done = True
+      close()
+    except Exception as e:
+      errors.append(e)
+      if not done: # Don't block the producer.
+        for item in iter(queue.get, None): pass
+  queues = [Queue.Queue(maxsize=16) for a in archivers]
+  threads = [threading.Thread(target=consume, args=(q,) + a)
+             for q, a in zip(queues, archivers)]
+  for t in threads:
+    t.start()
+  try:
+    if archivers:
+      for item in walk_archive(src, cwd): # Read the files only once.
+        for q in queues:
+          q.put(item)
+  finally:
+    for q in queues:
+      q.put(None)
+    for t in threads:
+      t.join()
+    if process:
+      process.wait()
+  for e in errors:
+    print("Error: couldn't create archive: %s" % e)
 
 def load_pymodules(folder):
   """ Loads all python modules (names matching 'd_*.py') from a folder. """
@@ -183,6 +392,78 @@ def load_pymodules(folder):
   sys.path = sys.path[1:]
   return modules
 
+def pack_pymodule(path):
+  """ Imports a d_*.py module and returns it in the binary module format.
+      Runs in the worker processes of load_pymodules_parallel(). """
+  import dil.token
+  from dil.binmodule import pack_module
+  dil.token.compact_tokens = True # Avoid creating a Token per lexeme.
+  sys.path = [path.folder] + sys.path
+  try:
+    module = __import__(path.namebase, level=0)
+    del sys.modules[path.namebase] # Free the memory in the worker.
+  finally:
+    sys.path = sys.path[1:]
+  return pack_module(module.module)
+
+def load_pymodules_parallel(folder, processes=None, progress=None,
+                            cache=None, **kwargs):
+  """ Loads all python modules (names matching 'd_*.py') from a folder,
+      using a pool of worker processes (default: one per CPU.)
+      Returns a list of dil.module.Module objects sorted by file name.
+      progress(done, total, path) is called after each loaded module.
+      Modules are looked up in and added to cache (a dil.cache.ModuleCache)
+      if given. Other kwargs are passed to dil.binmodule.unpack_module(). """
+  from multiprocessing import Pool
+  from dil.binmodule import unpack_module
+  files = sorted(folder.glob("d_*.py"))
+  modules = [None] * len(files)
+  keys = [cache.hash_file(f) for f in files] if cache else []
+  missing = [] # Indices of the modules that have to be imported.
+  done = 0
+  for i, f in enumerate(files):
+    modules[i] = cache and cache.get(keys[i], **kwargs)
+    if not modules[i]:
+      missing.append(i)
+      continue
+    done += 1
+    if progress:
+      progress(done, len(files), f)
+  if not missing:
+    return modules
+  pool = Pool(processes)
+  try:
+    results = pool.imap(pack_pymodule, [files[i] for i in missing])
+    for i, data in zip(missing, results):
+      if cache:
+        cache.put(keys[i], data)
+      modules[i] = unpack_module(data, path=files[i], **kwargs)
+      done += 1
+      if progress:
+        progress(done, len(files), files[i])
+    pool.close()
+  except:
+    pool.terminate()
+    raise
+  finally:
+    pool.join()
+  if cache:
+    cache.prune()
+  return modules
+
+def write_binmodules(modules, dest):
+  """ Writes modules returned by load_pymodules() to binary files,
+      which can be loaded much faster with load_binmodules(). """
+  from dil.binmodule import write_module, FILE_EXT
+  for m in modules:
+    write_module(m.module, dest/(m.__name__ + FILE_EXT))
+
+def load_binmodules(folder, **kwargs):
+  """ Loads all binary modules (names matching 'd_*.dilb') from a folder.
+      Returns a list of dil.module.Module objects. """
+  from dil.binmodule import load_module, FILE_EXT
+  return [load_module(f, **kwargs) for f in folder.glob("d_*" + FILE_EXT)]
+
 def locate_command(command):
   """ Locates a command using the PATH environment variable. """
   if 'PATH' in os.environ:
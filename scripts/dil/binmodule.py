@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from dil.token import TokenArray, token_index_func
+from dil.module import Module
+from dil.visitor import iter_subnodes
+import dil.nodes
+from array import array
+import mmap, struct, sys
+
+# Layout of a binary module file (all numbers are little-endian):
+#
+#   Header: magic, version, and the number of strings, tokens,
+#           whitespace strings, nodes and argument codes.
+#   Strings: (n_strings+1) uint32 offsets followed by a UTF-8 blob.
+#            The first two strings are the module's FQN and extension,
+#            followed by the whitespace strings and the token texts.
+#   Tokens: the TokenArray columns (kinds, linnums, ws_idx, text_idx).
+#   Nodes: kinds, (n_nodes+1) offsets into the argument codes,
+#          and (begin, end) token indices. Nodes are stored in post-order,
+#          so that a node's sub-nodes always have lower indices.
+#   Args: int32 codes. The lower 3 bits are a tag, the rest is a payload.
+#
+# Every section is aligned to 4 bytes.
+
+MAGIC = b"DILB"
+VERSION = 1
+FILE_EXT = ".dilb"
+header = struct.Struct(b"<4sHHIIIII")
+
+# Argument code tags.
+ARG_NONE, ARG_TOKEN, ARG_NODE, ARG_TUPLE, ARG_INT = range(5)
+
+swap_bytes = sys.byteorder != "little"
+
+def align4(n):
+  return (n + 3) & ~3
+
+def pack_array(a):
+  """ Returns an array in little-endian byte order, padded to 4 bytes. """
+  if swap_bytes:
+    a = array(a.typecode, a)
+    a.byteswap()
+  data = a.tostring()
+  return data + b"\0" * (align4(len(data)) - len(data))
+
+def write_module(module, path):
+  """ Writes a dil.module.Module to a binary file. """
+  f = open(path, "wb")
+  f.write(pack_module(module))
+  f.close()
+
+def pack_module(module):
+  """ Returns a dil.module.Module in the binary format as a byte string. """
+  tokens = module.tokens
+  token_index = token_index_func(tokens)
+  if not isinstance(tokens, TokenArray):
+    tokens = TokenArray.from_tokens(tokens)
+  elif tokens.is_interned: # Don't write the whole shared table.
+    tokens = tokens.local_copy()
+
+  # Number the nodes in post-order and encode their arguments.
+  node_kinds, arg_offsets, positions = array(b'H'), array(b'I'), array(b'I')
+  args = array(b'i')
+  node_index = {}
+  def encode(value):
+    if value == None:
+      args.append(ARG_NONE)
+    elif isinstance(value, (tuple, list)):
+      args.append(len(value) << 3 | ARG_TUPLE)
+      for v in value:
+        encode(v)
+    elif isinstance(value, int):
+      args.append(value << 3 | ARG_INT)
+    elif isinstance(value, dil.nodes.Node):
+      args.append(node_index[id(value)] << 3 | ARG_NODE)
+    else:
+      args.append(token_index(value) << 3 | ARG_TOKEN)
+  stack = [(module.root, False)] if module.root else []
+  while stack:
+    node, visited = stack.pop()
+    if not visited: # Visit the sub-nodes first.
+      stack.append((node, True))
+      stack.extend((n, False) for n in reversed(list(iter_subnodes(node))))
+      continue
+    node_index[id(node)] = len(node_kinds)
+    node_kinds.append(node.kind)
+    arg_offsets.append(len(args))
+    positions.extend((token_index(node.pos[0]), token_index(node.pos[1])))
+    for value in node.m:
+      encode(value)
+  arg_offsets.append(len(args))
+
+  # Build the string table.
+  strings = [module.fqn, module.ext] + tokens.ws_list + tokens.str_list
+  blob = [s.encode("utf-8") for s in strings]
+  str_offsets = array(b'I', [0])
+  for b in blob:
+    str_offsets.append(str_offsets[-1] + len(b))
+  blob = b"".join(blob)
+  blob += b"\0" * (align4(len(blob)) - len(blob))
+
+  data = [header.pack(MAGIC, VERSION, 0, len(strings), len(tokens),
+    len(tokens.ws_list), len(node_kinds), len(args))]
+  data += [pack_array(str_offsets), blob]
+  data += map(pack_array, (tokens.kinds, tokens.linnums, tokens.ws_idx,
+    tokens.text_idx, node_kinds, arg_offsets, positions, args))
+  return b"".join(data)
+
+def load_module(path, compact=True, nodes=True, interned=False):
+  """ Memory-maps a binary module file and returns a dil.module.Module.
+    The tokens are a TokenArray unless compact is False.
+    The syntax tree is not built if nodes is False.
+    The token texts are moved to dil.token.string_table if interned. """
+  f = open(path, "rb")
+  try:
+    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+  finally:
+    f.close()
+  try:
+    return unpack_module(buf, compact, nodes, interned, path)
+  finally:
+    buf.close()
+
+def unpack_module(buf, compact=True, nodes=True, interned=False,
+                  path="<buffer>"):
+  """ Like load_module(), but reads from a byte string or buffer. """
+  magic, version, _, n_strings, n_tokens, n_ws, n_nodes, n_args = \
+    header.unpack_from(buf)
+  if magic != MAGIC or version != VERSION:
+    raise Exception("'%s' is not a binary module file of version %d" %
+                    (path, VERSION))
+  pos = [header.size]
+  def read_array(typecode, count):
+    a = array(typecode)
+    end = pos[0] + count * a.itemsize
+    a.fromstring(buf[pos[0]:end])
+    if swap_bytes:
+      a.byteswap()
+    pos[0] = align4(end)
+    return a
+
+  str_offsets = read_array(b'I', n_strings + 1)
+  start = pos[0]
+  blob = buf[start:start + str_offsets[-1]]
+  pos[0] = align4(start + str_offsets[-1])
+  strings = [blob[str_offsets[i]:str_offsets[i+1]].decode("utf-8")
+             for i in xrange(n_strings)]
+
+  tokens = TokenArray(strings[2 + n_ws:])
+  tokens.ws_list = strings[2:2 + n_ws]
+  tokens.ws_dict = dict((ws, i) for i, ws in enumerate(tokens.ws_list))
+  tokens.kinds = read_array(b'H', n_tokens)
+  tokens.linnums = read_array(b'I', n_tokens)
+  tokens.ws_idx = read_array(b'I', n_tokens)
+  tokens.text_idx = read_array(b'i', n_tokens)
+  if not nodes:
+    n_nodes = n_args = 0
+  node_kinds = read_array(b'H', n_nodes)
+  arg_offsets = read_array(b'I', n_nodes + 1 if n_nodes else 0)
+  positions = read_array(b'I', 2 * n_nodes)
+  args = read_array(b'i', n_args)
+
+  if interned:
+    tokens.intern()
+  if not compact:
+    tokens = tokens.to_list()
+  built = [None] * n_nodes
+  def decode(i):
+    """ Decodes the value at args[i]. Returns the value and the next index. """
+    code = args[i]
+    tag, payload = code & 7, code >> 3
+    i += 1
+    if tag == ARG_TOKEN:
+      return tokens[payload], i
+    if tag == ARG_NODE:
+      return built[payload], i
+    if tag == ARG_TUPLE:
+      values = [None] * payload
+      for j in xrange(payload):
+        values[j], i = decode(i)
+      return tuple(values), i
+    if tag == ARG_INT:
+      return payload, i
+    return None, i
+  for n in xrange(n_nodes):
+    values = []
+    i, end = arg_offsets[n], arg_offsets[n+1]
+    while i < end:
+      value, i = decode(i)
+      values.append(value)
+    values.append((tokens[positions[2*n]], tokens[positions[2*n+1]]))
+    built[n] = dil.nodes.NodeClasses[node_kinds[n]](*values)
+
+  return Module(fqn=strings[0], tokens=tokens, ext=strings[1],
+                root=built[-1] if built else None)
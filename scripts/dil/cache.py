@@ -0,0 +1,121 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+from dil.binmodule import load_module, FILE_EXT, VERSION
+from path import Path
+import hashlib, os
+
+class ModuleCache:
+  """ A folder of binary modules keyed by the hash of their d_*.py files.
+    The least recently used entries are evicted when the total size
+    of the folder exceeds max_size (in bytes.) """
+  def __init__(self, folder, max_size=256*1024*1024):
+    self.folder = Path(folder).makedirs()
+    self.max_size = max_size
+
+  @staticmethod
+  def hash_file(path):
+    """ Returns the key for a d_*.py or source file. """
+    # Include the format version, so that old entries aren't loaded.
+    h = hashlib.sha1(b"dil.binmodule %d\n" % VERSION)
+    f = open(path, "rb")
+    for chunk in iter(lambda: f.read(1 << 16), b""):
+      h.update(chunk)
+    f.close()
+    return h.hexdigest()
+
+  def path(self, key):
+    return self.folder/(key + FILE_EXT)
+
+  def get(self, key, **kwargs):
+    """ Returns the cached dil.module.Module or None.
+      kwargs are passed to dil.binmodule.load_module(). """
+    path = self.path(key)
+    if not path.exists:
+      return None
+    try:
+      module = load_module(path, **kwargs)
+    except Exception:
+      path.rm() # Remove corrupt entries.
+      return None
+    os.utime(path, None) # Mark the entry as recently used.
+    return module
+
+  def put(self, key, data):
+    """ Stores a module packed with dil.binmodule.pack_module(). """
+    path = self.path(key)
+    tmp = path + ".tmp%d" % os.getpid()
+    f = open(tmp, "wb")
+    f.write(data)
+    f.close()
+    tmp.rename(path) # Readers never see half-written entries.
+
+  def entries(self):
+    """ Returns (path, size, mtime) tuples, most recently used first. """
+    entries = []
+    for path in self.folder.glob("*" + FILE_EXT):
+      try:
+        stat = os.stat(path)
+      except OSError:
+        continue # Removed by another process.
+      entries.append((path, stat.st_size, stat.st_mtime))
+    entries.sort(key=lambda e: e[2], reverse=True)
+    return entries
+
+  @property
+  def size(self):
+    return sum(e[1] for e in self.entries())
+
+  def prune(self, max_size=None):
+    """ Removes the least recently used entries until the cache
+      takes up at most max_size bytes. Returns the removed paths. """
+    if max_size == None:
+      max_size = self.max_size
+    removed = []
+    total = 0
+    for path, size, mtime in self.entries():
+      total += size
+      if total > max_size:
+        try:
+          path.rm()
+          removed.append(path)
+        except OSError:
+          pass
+    return removed
+
+  def clear(self):
+    return self.prune(0)
+
+def main():
+  from optparse import OptionParser
+  import time
+
+  usage = "Usage: python -m dil.cache CACHE_DIR [Options]"
+  parser = OptionParser(usage=usage)
+  parser.add_option("--prune", dest="prune", metavar="SIZE", default=None,
+    type="int", help="remove the least recently used entries until the cache"
+                     " is at most SIZE bytes large")
+  parser.add_option("--clear", dest="clear", action="store_true",
+    default=False, help="remove all entries")
+  parser.add_option("-l", "--list", dest="list", action="store_true",
+    default=False, help="list the entries")
+
+  (options, args) = parser.parse_args()
+  if len(args) < 1:
+    return parser.print_help()
+
+  cache = ModuleCache(args[0])
+  if options.clear:
+    cache.clear()
+  elif options.prune != None:
+    for path in cache.prune(options.prune):
+      print("Removed %s" % path.name)
+  entries = cache.entries()
+  if options.list:
+    for path, size, mtime in entries:
+      print("%s %10d %s" % (path.namebase, size,
+        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime))))
+  print("%d entries, %d bytes" % (len(entries), sum(e[1] for e in entries)))
+
+if __name__ == '__main__':
+  main()
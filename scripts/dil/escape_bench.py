@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+from dil.token import rx_escape, escape_table, decode_escapes
+import timeit
+
+# Compares the single-pass escape decoder with the previous
+# implementation (a regular expression and a callback per escape.)
+
+def old_escape2char(s):
+  from htmlentitydefs import name2codepoint
+  c = s[1]
+  if c in 'xuU':    c = int(s[2:], 16)
+  elif c.isdigit(): c = int(s[1:], 8)
+  elif c == '&':    c = name2codepoint.get(s[2:-1], 0xFFFD)
+  else:             c = escape_table.get(c, 0xFFFD)
+  return unichr(c)
+
+def old_decode_escapes(s):
+  return rx_escape.sub(lambda m: old_escape2char(m.group()), s)
+
+# Note: r"\u" is still an escape sequence in Python 2 unicode literals.
+samples = {
+  "plain": "Hello world, this string has no escape sequences at all.",
+  "mixed": 'Line 1\\nLine 2\\t\\"quoted\\" äöü \\&amp; \\101\\u0042',
+  "dense": '\\n\\t\\r\\0\\\\\\"A\\U0001F600\\&lt;\\&gt;\\177' * 4,
+}
+
+def main():
+  from optparse import OptionParser
+
+  usage = "Usage: python -m dil.escape_bench [Options]"
+  parser = OptionParser(usage=usage)
+  parser.add_option("-n", dest="number", metavar="N", default=20000,
+    type="int", help="the number of calls per sample (default: 20000)")
+  parser.add_option("-r", dest="repeat", metavar="R", default=3,
+    type="int", help="the number of repetitions (default: 3)")
+
+  (options, args) = parser.parse_args()
+
+  print("%-8s %10s %10s %8s" % ("sample", "old (s)", "new (s)", "speedup"))
+  for name in sorted(samples):
+    s = samples[name]
+    assert old_decode_escapes(s) == decode_escapes(s)
+    times = []
+    for func in (old_decode_escapes, decode_escapes):
+      t = timeit.Timer(lambda: func(s))
+      times.append(min(t.repeat(options.repeat, options.number)))
+    print("%-8s %10.4f %10.4f %7.1fx" %
+          (name, times[0], times[1], times[0] / times[1]))
+
+if __name__ == '__main__':
+  main()
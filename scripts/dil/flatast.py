@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from dil.token import token_index_func
+from dil.visitor import iter_subnodes
+from dil.nodes import NodeClasses
+from array import array
+from bisect import bisect_left
+from heapq import merge
+
+def kind_of(kind):
+  """ Accepts a node kind or a node class. """
+  return getattr(kind, "kind", kind)
+
+class FlatTree(object):
+  """ A syntax tree flattened into parallel array columns.
+    The nodes are numbered in pre-order, so the descendants of node i
+    are exactly the nodes i+1 to sub_end[i]-1.
+  kinds = The kinds of the nodes.
+  parents = The parent indices (-1 for the root.)
+  first_child = The index of the first sub-node, or -1.
+  next_sibling = The index of the next sibling, or -1.
+  sub_end = One past the index of the last descendant.
+  begins, ends = The token span (token indices) of the nodes.
+  kind_index = The sorted node indices of every kind, indexed by kind.
+  nodes = The original node objects, if they were kept.
+  """
+  def __init__(self):
+    self.kinds = array(b'H')
+    self.parents = array(b'i')
+    self.first_child = array(b'i')
+    self.next_sibling = array(b'i')
+    self.sub_end = array(b'I')
+    self.begins = array(b'I')
+    self.ends = array(b'I')
+    self.kind_index = [array(b'I') for cls in NodeClasses]
+    self.nodes = None
+
+  @classmethod
+  def from_module(cls, module, keep_nodes=False):
+    return cls.from_tree(module.root, module.tokens, keep_nodes)
+
+  @classmethod
+  def from_tree(cls, root, tokens, keep_nodes=False):
+    """ Flattens the tree of a module with the token list tokens. """
+    self = cls()
+    token_index = token_index_func(tokens)
+    kinds, parents, first_child, next_sibling, begins, ends = \
+      self.kinds, self.parents, self.first_child, self.next_sibling, \
+      self.begins, self.ends
+    kind_index = self.kind_index
+    nodes = self.nodes = [] if keep_nodes else None
+    last_child = array(b'i') # Temporary column.
+    stack = [(root, -1)] if root else []
+    while stack:
+      node, parent = stack.pop()
+      i = len(kinds)
+      kinds.append(node.kind)
+      parents.append(parent)
+      first_child.append(-1)
+      next_sibling.append(-1)
+      last_child.append(-1)
+      begins.append(token_index(node.pos[0]))
+      ends.append(token_index(node.pos[1]))
+      kind_index[node.kind].append(i)
+      if nodes != None:
+        nodes.append(node)
+      if parent != -1: # Link to the parent or the previous sibling.
+        prev = last_child[parent]
+        if prev == -1:
+          first_child[parent] = i
+        else:
+          next_sibling[prev] = i
+        last_child[parent] = i
+      stack.extend((n, i) for n in reversed(list(iter_subnodes(node))))
+    # Compute the subtree ends bottom-up.
+    sub_end = self.sub_end
+    sub_end.extend(xrange(1, len(kinds) + 1))
+    for i in xrange(len(kinds) - 1, -1, -1):
+      if last_child[i] != -1:
+        sub_end[i] = sub_end[last_child[i]]
+    return self
+
+  def __len__(self):
+    return len(self.kinds)
+
+  def of_kind(self, *kinds):
+    """ Returns the sorted indices of all nodes of the given kinds. """
+    if len(kinds) == 1:
+      return self.kind_index[kind_of(kinds[0])]
+    return list(merge(*[self.kind_index[kind_of(k)] for k in kinds]))
+
+  def kind_counts(self):
+    """ Returns a list with the number of nodes of every kind. """
+    return [len(a) for a in self.kind_index]
+
+  def children(self, i):
+    """ Yields the indices of the sub-nodes of node i. """
+    i = self.first_child[i]
+    while i != -1:
+      yield i
+      i = self.next_sibling[i]
+
+  def ancestors(self, i):
+    """ Yields the indices of the ancestors of node i, innermost first. """
+    i = self.parents[i]
+    while i != -1:
+      yield i
+      i = self.parents[i]
+
+  def is_ancestor(self, a, d):
+    """ Returns True if node a is an ancestor of node d. """
+    return a < d < self.sub_end[a]
+
+  def descendants(self, i, *kinds):
+    """ Returns the indices of the descendants of node i,
+      only those of the given kinds if any. O(log n + result). """
+    beg, end = i + 1, self.sub_end[i]
+    if not kinds:
+      return range(beg, end)
+    result = []
+    for k in kinds:
+      a = self.kind_index[kind_of(k)]
+      j = bisect_left(a, beg)
+      while j < len(a) and a[j] < end:
+        result.append(a[j])
+        j += 1
+    if len(kinds) > 1:
+      result.sort()
+    return result
+
+  def span(self, i):
+    """ Returns the (begin, end) token indices of node i. """
+    return self.begins[i], self.ends[i]
+
+  def class_of(self, i):
+    return NodeClasses[self.kinds[i]]
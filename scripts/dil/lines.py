@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from dil.token import TOK, TokenArray, rx_newline, token_index_func
+from array import array
+from bisect import bisect_left, bisect_right
+
+def iter_token_texts(tokens):
+  """ Yields (kind, ws, text) for a list of Tokens or a TokenArray. """
+  if isinstance(tokens, TokenArray):
+    kinds, ws_idx, ws_list = tokens.kinds, tokens.ws_idx, tokens.ws_list
+    for i in xrange(len(tokens)):
+      yield kinds[i], ws_list[ws_idx[i]], tokens.text(i)
+  else:
+    for t in tokens:
+      yield t.kind, t.ws, t.text
+
+class LineIndex(object):
+  """ Maps source offsets and token indices to lines and columns
+    with binary searches. Offsets count the characters of the token texts,
+    where a Newline token counts as one character. Lines and columns
+    start at 1.
+  line_starts = The offsets at which the lines begin.
+  token_starts = The offsets of the tokens' texts (after their whitespace.)
+  token_ends = The offsets after the tokens' texts.
+  """
+  # Tokens that may contain line breaks, besides Newline tokens.
+  multiline_kinds = (TOK.Comment, TOK.String, TOK.Illegal)
+
+  def __init__(self, tokens):
+    self.tokens = tokens
+    self.line_starts = line_starts = array(b'i', [0])
+    self.token_starts = token_starts = array(b'i')
+    self.token_ends = token_ends = array(b'i')
+    multiline_kinds = self.multiline_kinds
+    offset = 0
+    for kind, ws, text in iter_token_texts(tokens):
+      offset += len(ws)
+      token_starts.append(offset)
+      if kind == TOK.EOF:
+        token_ends.append(offset)
+        continue
+      if kind == TOK.Newline:
+        line_starts.append(offset + len(text))
+      elif kind in multiline_kinds:
+        for m in rx_newline.finditer(text):
+          line_starts.append(offset + m.end())
+      offset += len(text)
+      token_ends.append(offset)
+    self.length = offset
+    self.token_index = None
+
+  def __len__(self):
+    """ Returns the number of lines. """
+    return len(self.line_starts)
+
+  def line_of(self, offset):
+    """ Returns the line of a source offset. """
+    return bisect_right(self.line_starts, offset)
+
+  def location(self, offset):
+    """ Returns the (line, column) of a source offset. """
+    line = bisect_right(self.line_starts, offset)
+    return line, offset - self.line_starts[line-1] + 1
+
+  def offset_of(self, line, column=1):
+    """ Returns the source offset of a line and column. """
+    if not 1 <= line <= len(self.line_starts):
+      raise IndexError("line %d out of range" % line)
+    return self.line_starts[line-1] + column - 1
+
+  def line_span(self, line):
+    """ Returns the (begin, end) offsets of a line,
+      including its line break. """
+    begin = self.offset_of(line)
+    if line < len(self.line_starts):
+      return begin, self.line_starts[line]
+    return begin, self.length
+
+  def token_location(self, i):
+    """ Returns the (line, column) of the i-th token. """
+    return self.location(self.token_starts[i])
+
+  def token_line(self, i):
+    """ Returns the line on which the i-th token starts.
+      Note: this differs from Token.linnum, which is counted by
+      dil.token.create_tokens() with the Newline tokens only. A Newline
+      token is on the line that it ends here, but Token.linnum already
+      counts it to the next line. Line breaks in comments and strings
+      aren't counted by Token.linnum at all. """
+    return bisect_right(self.line_starts, self.token_starts[i])
+
+  def token_at(self, offset):
+    """ Returns the index of the token whose span
+      (including its whitespace) contains offset. """
+    return min(bisect_right(self.token_ends, offset),
+               len(self.token_ends) - 1)
+
+  def line_tokens(self, line):
+    """ Returns the (first, end) indices of the tokens
+      that start on a line. """
+    begin, end = self.line_span(line)
+    starts = self.token_starts
+    return bisect_left(starts, begin), bisect_left(starts, end)
+
+  def locate(self, token):
+    """ Returns the (line, column) of a token object. """
+    if self.token_index == None:
+      self.token_index = token_index_func(self.tokens)
+    return self.token_location(self.token_index(token))
@@ -8,3 +8,12 @@ class Module(Symbol):
     self.fqn = fqn
     self.ext = ext
     self.root = root
+    self._line_index = None
+
+  @property
+  def line_index(self):
+    """ The dil.lines.LineIndex of the tokens. Built on first access. """
+    if self._line_index == None:
+      from dil.lines import LineIndex
+      self._line_index = LineIndex(self.tokens)
+    return self._line_index
@@ -1,749 +1,1657 @@
 # -*- coding: utf-8 -*-
 # Author: Aziz Köksal
+# Generated by nodes_gen.py. Don't edit.
 
-class Node:
+class Node(object):
+  __slots__ = ("pos",)
   kind = None
+  fields = () # The names of the members in the order of the constructor args.
   def __init__(self, *args):
-    self.m = args[:-1]
+    """ Assigns args[:-1] to the fields and args[-1] to pos.
+      Missing members are set to None. """
+    for i, name in enumerate(self.fields):
+      setattr(self, name, args[i] if i < len(args) - 1 else None)
     self.pos = args[-1]
 
+  @property
+  def m(self):
+    """ Returns the members as a tuple. """
+    return tuple([getattr(self, name) for name in self.fields])
+
 class CompoundDeclaration(Node):
+  __slots__ = fields = ("decls",)
   kind = 0
+  def __init__(self, decls, pos):
+    self.decls = decls
+    self.pos = pos
 N0 = CompoundDeclaration
 
 class EmptyDeclaration(Node):
+  __slots__ = fields = ()
   kind = 1
+  def __init__(self, pos):
+    self.pos = pos
 N1 = EmptyDeclaration
 
 class IllegalDeclaration(Node):
+  __slots__ = fields = ()
   kind = 2
+  def __init__(self, pos):
+    self.pos = pos
 N2 = IllegalDeclaration
 
 class ModuleDeclaration(Node):
+  __slots__ = fields = ("typeIdent", "moduleName", "packages")
   kind = 3
+  def __init__(self, typeIdent, moduleName, packages, pos):
+    self.typeIdent = typeIdent
+    self.moduleName = moduleName
+    self.packages = packages
+    self.pos = pos
 N3 = ModuleDeclaration
 
 class ImportDeclaration(Node):
+  __slots__ = fields = ("moduleFQNs", "moduleAliases", "bindNames", "bindAliases")
   kind = 4
+  def __init__(self, moduleFQNs, moduleAliases, bindNames, bindAliases, pos):
+    self.moduleFQNs = moduleFQNs
+    self.moduleAliases = moduleAliases
+    self.bindNames = bindNames
+    self.bindAliases = bindAliases
+    self.pos = pos
 N4 = ImportDeclaration
 
 class AliasDeclaration(Node):
+  __slots__ = fields = ("decl",)
   kind = 5
+  def __init__(self, decl, pos):
+    self.decl = decl
+    self.pos = pos
 N5 = AliasDeclaration
 
 class AliasThisDeclaration(Node):
+  __slots__ = fields = ("ident",)
   kind = 6
+  def __init__(self, ident, pos):
+    self.ident = ident
+    self.pos = pos
 N6 = AliasThisDeclaration
 
 class TypedefDeclaration(Node):
+  __slots__ = fields = ("decl",)
   kind = 7
+  def __init__(self, decl, pos):
+    self.decl = decl
+    self.pos = pos
 N7 = TypedefDeclaration
 
 class EnumDeclaration(Node):
+  __slots__ = fields = ("name", "baseType", "members")
   kind = 8
+  def __init__(self, name, baseType, members, pos):
+    self.name = name
+    self.baseType = baseType
+    self.members = members
+    self.pos = pos
 N8 = EnumDeclaration
 
 class EnumMemberDeclaration(Node):
+  __slots__ = fields = ("type", "name", "value")
   kind = 9
+  def __init__(self, type, name, value, pos):
+    self.type = type
+    self.name = name
+    self.value = value
+    self.pos = pos
 N9 = EnumMemberDeclaration
 
 class ClassDeclaration(Node):
+  __slots__ = fields = ("name", "bases", "decls")
   kind = 10
+  def __init__(self, name, bases, decls, pos):
+    self.name = name
+    self.bases = bases
+    self.decls = decls
+    self.pos = pos
 N10 = ClassDeclaration
 
 class InterfaceDeclaration(Node):
+  __slots__ = fields = ("name", "bases", "decls")
   kind = 11
+  def __init__(self, name, bases, decls, pos):
+    self.name = name
+    self.bases = bases
+    self.decls = decls
+    self.pos = pos
 N11 = InterfaceDeclaration
 
 class StructDeclaration(Node):
+  __slots__ = fields = ("name", "decls")
   kind = 12
+  def __init__(self, name, decls, pos):
+    self.name = name
+    self.decls = decls
+    self.pos = pos
 N12 = StructDeclaration
 
 class UnionDeclaration(Node):
+  __slots__ = fields = ("name", "decls")
   kind = 13
+  def __init__(self, name, decls, pos):
+    self.name = name
+    self.decls = decls
+    self.pos = pos
 N13 = UnionDeclaration
 
 class ConstructorDeclaration(Node):
+  __slots__ = fields = ("params", "funcBody")
   kind = 14
+  def __init__(self, params, funcBody, pos):
+    self.params = params
+    self.funcBody = funcBody
+    self.pos = pos
 N14 = ConstructorDeclaration
 
 class StaticConstructorDeclaration(Node):
+  __slots__ = fields = ("funcBody",)
   kind = 15
+  def __init__(self, funcBody, pos):
+    self.funcBody = funcBody
+    self.pos = pos
 N15 = StaticConstructorDeclaration
 
 class DestructorDeclaration(Node):
+  __slots__ = fields = ("funcBody",)
   kind = 16
+  def __init__(self, funcBody, pos):
+    self.funcBody = funcBody
+    self.pos = pos
 N16 = DestructorDeclaration
 
 class StaticDestructorDeclaration(Node):
+  __slots__ = fields = ("funcBody",)
   kind = 17
+  def __init__(self, funcBody, pos):
+    self.funcBody = funcBody
+    self.pos = pos
 N17 = StaticDestructorDeclaration
 
 class FunctionDeclaration(Node):
+  __slots__ = fields = ("returnType", "name", "params", "funcBody")
   kind = 18
+  def __init__(self, returnType, name, params, funcBody, pos):
+    self.returnType = returnType
+    self.name = name
+    self.params = params
+    self.funcBody = funcBody
+    self.pos = pos
 N18 = FunctionDeclaration
 
 class VariablesDeclaration(Node):
+  __slots__ = fields = ("typeNode", "names", "inits")
   kind = 19
+  def __init__(self, typeNode, names, inits, pos):
+    self.typeNode = typeNode
+    self.names = names
+    self.inits = inits
+    self.pos = pos
 N19 = VariablesDeclaration
 
 class InvariantDeclaration(Node):
+  __slots__ = fields = ("funcBody",)
   kind = 20
+  def __init__(self, funcBody, pos):
+    self.funcBody = funcBody
+    self.pos = pos
 N20 = InvariantDeclaration
 
 class UnittestDeclaration(Node):
+  __slots__ = fields = ("funcBody",)
   kind = 21
+  def __init__(self, funcBody, pos):
+    self.funcBody = funcBody
+    self.pos = pos
 N21 = UnittestDeclaration
 
 class DebugDeclaration(Node):
+  __slots__ = fields = ("spec", "cond", "decls", "elseDecls")
   kind = 22
+  def __init__(self, spec, cond, decls, elseDecls, pos):
+    self.spec = spec
+    self.cond = cond
+    self.decls = decls
+    self.elseDecls = elseDecls
+    self.pos = pos
 N22 = DebugDeclaration
 
 class VersionDeclaration(Node):
+  __slots__ = fields = ("spec", "cond", "decls", "elseDecls")
   kind = 23
+  def __init__(self, spec, cond, decls, elseDecls, pos):
+    self.spec = spec
+    self.cond = cond
+    self.decls = decls
+    self.elseDecls = elseDecls
+    self.pos = pos
 N23 = VersionDeclaration
 
 class StaticIfDeclaration(Node):
+  __slots__ = fields = ("condition", "ifDecls", "elseDecls")
   kind = 24
+  def __init__(self, condition, ifDecls, elseDecls, pos):
+    self.condition = condition
+    self.ifDecls = ifDecls
+    self.elseDecls = elseDecls
+    self.pos = pos
 N24 = StaticIfDeclaration
 
 class StaticAssertDeclaration(Node):
+  __slots__ = fields = ("condition", "message")
   kind = 25
+  def __init__(self, condition, message, pos):
+    self.condition = condition
+    self.message = message
+    self.pos = pos
 N25 = StaticAssertDeclaration
 
 class TemplateDeclaration(Node):
+  __slots__ = fields = ("name", "tparams", "constraint", "decls")
   kind = 26
+  def __init__(self, name, tparams, constraint, decls, pos):
+    self.name = name
+    self.tparams = tparams
+    self.constraint = constraint
+    self.decls = decls
+    self.pos = pos
 N26 = TemplateDeclaration
 
 class NewDeclaration(Node):
+  __slots__ = fields = ("params", "funcBody")
   kind = 27
+  def __init__(self, params, funcBody, pos):
+    self.params = params
+    self.funcBody = funcBody
+    self.pos = pos
 N27 = NewDeclaration
 
 class DeleteDeclaration(Node):
+  __slots__ = fields = ("params", "funcBody")
   kind = 28
+  def __init__(self, params, funcBody, pos):
+    self.params = params
+    self.funcBody = funcBody
+    self.pos = pos
 N28 = DeleteDeclaration
 
 class ProtectionDeclaration(Node):
+  __slots__ = fields = ("decls",)
   kind = 29
+  def __init__(self, decls, pos):
+    self.decls = decls
+    self.pos = pos
 N29 = ProtectionDeclaration
 
 class StorageClassDeclaration(Node):
+  __slots__ = fields = ("decls",)
   kind = 30
+  def __init__(self, decls, pos):
+    self.decls = decls
+    self.pos = pos
 N30 = StorageClassDeclaration
 
 class LinkageDeclaration(Node):
+  __slots__ = fields = ("decls",)
   kind = 31
+  def __init__(self, decls, pos):
+    self.decls = decls
+    self.pos = pos
 N31 = LinkageDeclaration
 
 class AlignDeclaration(Node):
+  __slots__ = fields = ("sizetok", "decls")
   kind = 32
+  def __init__(self, sizetok, decls, pos):
+    self.sizetok = sizetok
+    self.decls = decls
+    self.pos = pos
 N32 = AlignDeclaration
 
 class PragmaDeclaration(Node):
+  __slots__ = fields = ("ident", "args", "decls")
   kind = 33
+  def __init__(self, ident, args, decls, pos):
+    self.ident = ident
+    self.args = args
+    self.decls = decls
+    self.pos = pos
 N33 = PragmaDeclaration
 
 class MixinDeclaration(Node):
+  __slots__ = fields = ("templateExpr", "argument", "mixinIdent")
   kind = 34
+  def __init__(self, templateExpr, argument, mixinIdent, pos):
+    self.templateExpr = templateExpr
+    self.argument = argument
+    self.mixinIdent = mixinIdent
+    self.pos = pos
 N34 = MixinDeclaration
 
 class CompoundStatement(Node):
+  __slots__ = fields = ("stmnts",)
   kind = 35
+  def __init__(self, stmnts, pos):
+    self.stmnts = stmnts
+    self.pos = pos
 N35 = CompoundStatement
 
 class IllegalStatement(Node):
+  __slots__ = fields = ()
   kind = 36
+  def __init__(self, pos):
+    self.pos = pos
 N36 = IllegalStatement
 
 class EmptyStatement(Node):
+  __slots__ = fields = ()
   kind = 37
+  def __init__(self, pos):
+    self.pos = pos
 N37 = EmptyStatement
 
 class FuncBodyStatement(Node):
+  __slots__ = fields = ("funcBody", "inBody", "outBody", "outIdent")
   kind = 38
+  def __init__(self, funcBody, inBody, outBody, outIdent, pos):
+    self.funcBody = funcBody
+    self.inBody = inBody
+    self.outBody = outBody
+    self.outIdent = outIdent
+    self.pos = pos
 N38 = FuncBodyStatement
 
 class ScopeStatement(Node):
+  __slots__ = fields = ("stmnt",)
   kind = 39
+  def __init__(self, stmnt, pos):
+    self.stmnt = stmnt
+    self.pos = pos
 N39 = ScopeStatement
 
 class LabeledStatement(Node):
+  __slots__ = fields = ("label", "stmnt")
   kind = 40
+  def __init__(self, label, stmnt, pos):
+    self.label = label
+    self.stmnt = stmnt
+    self.pos = pos
 N40 = LabeledStatement
 
 class ExpressionStatement(Node):
+  __slots__ = fields = ("expr",)
   kind = 41
+  def __init__(self, expr, pos):
+    self.expr = expr
+    self.pos = pos
 N41 = ExpressionStatement
 
 class DeclarationStatement(Node):
+  __slots__ = fields = ("decl",)
   kind = 42
+  def __init__(self, decl, pos):
+    self.decl = decl
+    self.pos = pos
 N42 = DeclarationStatement
 
 class IfStatement(Node):
+  __slots__ = fields = ("variable", "condition", "ifBody", "elseBody")
   kind = 43
+  def __init__(self, variable, condition, ifBody, elseBody, pos):
+    self.variable = variable
+    self.condition = condition
+    self.ifBody = ifBody
+    self.elseBody = elseBody
+    self.pos = pos
 N43 = IfStatement
 
 class WhileStatement(Node):
+  __slots__ = fields = ("condition", "whileBody")
   kind = 44
+  def __init__(self, condition, whileBody, pos):
+    self.condition = condition
+    self.whileBody = whileBody
+    self.pos = pos
 N44 = WhileStatement
 
 class DoWhileStatement(Node):
+  __slots__ = fields = ("doBody", "condition")
   kind = 45
+  def __init__(self, doBody, condition, pos):
+    self.doBody = doBody
+    self.condition = condition
+    self.pos = pos
 N45 = DoWhileStatement
 
 class ForStatement(Node):
+  __slots__ = fields = ("init", "condition", "increment", "forBody")
   kind = 46
+  def __init__(self, init, condition, increment, forBody, pos):
+    self.init = init
+    self.condition = condition
+    self.increment = increment
+    self.forBody = forBody
+    self.pos = pos
 N46 = ForStatement
 
 class ForeachStatement(Node):
+  __slots__ = fields = ("params", "aggregate", "forBody")
   kind = 47
+  def __init__(self, params, aggregate, forBody, pos):
+    self.params = params
+    self.aggregate = aggregate
+    self.forBody = forBody
+    self.pos = pos
 N47 = ForeachStatement
 
 class ForeachRangeStatement(Node):
+  __slots__ = fields = ("params", "lower", "upper", "forBody")
   kind = 48
+  def __init__(self, params, lower, upper, forBody, pos):
+    self.params = params
+    self.lower = lower
+    self.upper = upper
+    self.forBody = forBody
+    self.pos = pos
 N48 = ForeachRangeStatement
 
 class SwitchStatement(Node):
+  __slots__ = fields = ("condition", "switchBody")
   kind = 49
+  def __init__(self, condition, switchBody, pos):
+    self.condition = condition
+    self.switchBody = switchBody
+    self.pos = pos
 N49 = SwitchStatement
 
 class CaseStatement(Node):
+  __slots__ = fields = ("values", "caseBody")
   kind = 50
+  def __init__(self, values, caseBody, pos):
+    self.values = values
+    self.caseBody = caseBody
+    self.pos = pos
 N50 = CaseStatement
 
 class DefaultStatement(Node):
+  __slots__ = fields = ("defaultBody",)
   kind = 51
+  def __init__(self, defaultBody, pos):
+    self.defaultBody = defaultBody
+    self.pos = pos
 N51 = DefaultStatement
 
 class ContinueStatement(Node):
+  __slots__ = fields = ("ident",)
   kind = 52
+  def __init__(self, ident, pos):
+    self.ident = ident
+    self.pos = pos
 N52 = ContinueStatement
 
 class BreakStatement(Node):
+  __slots__ = fields = ("ident",)
   kind = 53
+  def __init__(self, ident, pos):
+    self.ident = ident
+    self.pos = pos
 N53 = BreakStatement
 
 class ReturnStatement(Node):
+  __slots__ = fields = ("expr",)
   kind = 54
+  def __init__(self, expr, pos):
+    self.expr = expr
+    self.pos = pos
 N54 = ReturnStatement
 
 class GotoStatement(Node):
+  __slots__ = fields = ("ident", "expr")
   kind = 55
+  def __init__(self, ident, expr, pos):
+    self.ident = ident
+    self.expr = expr
+    self.pos = pos
 N55 = GotoStatement
 
 class WithStatement(Node):
+  __slots__ = fields = ("expr", "withBody")
   kind = 56
+  def __init__(self, expr, withBody, pos):
+    self.expr = expr
+    self.withBody = withBody
+    self.pos = pos
 N56 = WithStatement
 
 class SynchronizedStatement(Node):
+  __slots__ = fields = ("expr", "syncBody")
   kind = 57
+  def __init__(self, expr, syncBody, pos):
+    self.expr = expr
+    self.syncBody = syncBody
+    self.pos = pos
 N57 = SynchronizedStatement
 
 class TryStatement(Node):
+  __slots__ = fields = ("tryBody", "catchBodies", "finallyBody")
   kind = 58
+  def __init__(self, tryBody, catchBodies, finallyBody, pos):
+    self.tryBody = tryBody
+    self.catchBodies = catchBodies
+    self.finallyBody = finallyBody
+    self.pos = pos
 N58 = TryStatement
 
 class CatchStatement(Node):
+  __slots__ = fields = ("param", "catchBody")
   kind = 59
+  def __init__(self, param, catchBody, pos):
+    self.param = param
+    self.catchBody = catchBody
+    self.pos = pos
 N59 = CatchStatement
 
 class FinallyStatement(Node):
+  __slots__ = fields = ("finallyBody",)
   kind = 60
+  def __init__(self, finallyBody, pos):
+    self.finallyBody = finallyBody
+    self.pos = pos
 N60 = FinallyStatement
 
 class ScopeGuardStatement(Node):
+  __slots__ = fields = ("condition", "scopeBody")
   kind = 61
+  def __init__(self, condition, scopeBody, pos):
+    self.condition = condition
+    self.scopeBody = scopeBody
+    self.pos = pos
 N61 = ScopeGuardStatement
 
 class ThrowStatement(Node):
+  __slots__ = fields = ("expr",)
   kind = 62
+  def __init__(self, expr, pos):
+    self.expr = expr
+    self.pos = pos
 N62 = ThrowStatement
 
 class VolatileStatement(Node):
+  __slots__ = fields = ("volatileBody",)
   kind = 63
+  def __init__(self, volatileBody, pos):
+    self.volatileBody = volatileBody
+    self.pos = pos
 N63 = VolatileStatement
 
 class AsmBlockStatement(Node):
+  __slots__ = fields = ("statements",)
   kind = 64
+  def __init__(self, statements, pos):
+    self.statements = statements
+    self.pos = pos
 N64 = AsmBlockStatement
 
 class AsmStatement(Node):
+  __slots__ = fields = ("ident", "operands")
   kind = 65
+  def __init__(self, ident, operands, pos):
+    self.ident = ident
+    self.operands = operands
+    self.pos = pos
 N65 = AsmStatement
 
 class AsmAlignStatement(Node):
+  __slots__ = fields = ("numtok",)
   kind = 66
+  def __init__(self, numtok, pos):
+    self.numtok = numtok
+    self.pos = pos
 N66 = AsmAlignStatement
 
 class IllegalAsmStatement(Node):
+  __slots__ = fields = ()
   kind = 67
+  def __init__(self, pos):
+    self.pos = pos
 N67 = IllegalAsmStatement
 
 class PragmaStatement(Node):
+  __slots__ = fields = ("ident", "args", "pragmaBody")
   kind = 68
+  def __init__(self, ident, args, pragmaBody, pos):
+    self.ident = ident
+    self.args = args
+    self.pragmaBody = pragmaBody
+    self.pos = pos
 N68 = PragmaStatement
 
 class MixinStatement(Node):
+  __slots__ = fields = ("templateExpr", "mixinIdent")
   kind = 69
+  def __init__(self, templateExpr, mixinIdent, pos):
+    self.templateExpr = templateExpr
+    self.mixinIdent = mixinIdent
+    self.pos = pos
 N69 = MixinStatement
 
 class StaticIfStatement(Node):
+  __slots__ = fields = ("condition", "ifBody", "elseBody")
   kind = 70
+  def __init__(self, condition, ifBody, elseBody, pos):
+    self.condition = condition
+    self.ifBody = ifBody
+    self.elseBody = elseBody
+    self.pos = pos
 N70 = StaticIfStatement
 
 class StaticAssertStatement(Node):
+  __slots__ = fields = ("condition", "message")
   kind = 71
+  def __init__(self, condition, message, pos):
+    self.condition = condition
+    self.message = message
+    self.pos = pos
 N71 = StaticAssertStatement
 
 class DebugStatement(Node):
+  __slots__ = fields = ("mainBody", "elseBody")
   kind = 72
+  def __init__(self, mainBody, elseBody, pos):
+    self.mainBody = mainBody
+    self.elseBody = elseBody
+    self.pos = pos
 N72 = DebugStatement
 
 class VersionStatement(Node):
+  __slots__ = fields = ("mainBody", "elseBody")
   kind = 73
+  def __init__(self, mainBody, elseBody, pos):
+    self.mainBody = mainBody
+    self.elseBody = elseBody
+    self.pos = pos
 N73 = VersionStatement
 
 class IllegalExpression(Node):
+  __slots__ = fields = ()
   kind = 74
+  def __init__(self, pos):
+    self.pos = pos
 N74 = IllegalExpression
 
 class CondExpression(Node):
+  __slots__ = fields = ("condition", "lhs", "rhs", "optok", "ctok")
   kind = 75
+  def __init__(self, condition, lhs, rhs, optok, ctok, pos):
+    self.condition = condition
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.ctok = ctok
+    self.pos = pos
 N75 = CondExpression
 
 class CommaExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 76
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N76 = CommaExpression
 
 class OrOrExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 77
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N77 = OrOrExpression
 
 class AndAndExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 78
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N78 = AndAndExpression
 
 class OrExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 79
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N79 = OrExpression
 
 class XorExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 80
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N80 = XorExpression
 
 class AndExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 81
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N81 = AndExpression
 
 class EqualExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 82
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N82 = EqualExpression
 
 class IdentityExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 83
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N83 = IdentityExpression
 
 class RelExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 84
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N84 = RelExpression
 
 class InExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 85
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N85 = InExpression
 
 class LShiftExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 86
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N86 = LShiftExpression
 
 class RShiftExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 87
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N87 = RShiftExpression
 
 class URShiftExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 88
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N88 = URShiftExpression
 
 class PlusExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 89
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N89 = PlusExpression
 
 class MinusExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 90
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N90 = MinusExpression
 
 class CatExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 91
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N91 = CatExpression
 
 class MulExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 92
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N92 = MulExpression
 
 class DivExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 93
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N93 = DivExpression
 
 class ModExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 94
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N94 = ModExpression
 
 class AssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 95
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N95 = AssignExpression
 
 class LShiftAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 96
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N96 = LShiftAssignExpression
 
 class RShiftAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 97
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N97 = RShiftAssignExpression
 
 class URShiftAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 98
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N98 = URShiftAssignExpression
 
 class OrAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 99
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N99 = OrAssignExpression
 
 class AndAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 100
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N100 = AndAssignExpression
 
 class PlusAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 101
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N101 = PlusAssignExpression
 
 class MinusAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 102
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N102 = MinusAssignExpression
 
 class DivAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 103
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N103 = DivAssignExpression
 
 class MulAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 104
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N104 = MulAssignExpression
 
 class ModAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 105
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N105 = ModAssignExpression
 
 class XorAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 106
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N106 = XorAssignExpression
 
 class CatAssignExpression(Node):
+  __slots__ = fields = ("lhs", "rhs", "optok")
   kind = 107
+  def __init__(self, lhs, rhs, optok, pos):
+    self.lhs = lhs
+    self.rhs = rhs
+    self.optok = optok
+    self.pos = pos
 N107 = CatAssignExpression
 
 class AddressExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 108
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N108 = AddressExpression
 
 class PreIncrExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 109
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N109 = PreIncrExpression
 
 class PreDecrExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 110
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N110 = PreDecrExpression
 
 class PostIncrExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 111
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N111 = PostIncrExpression
 
 class PostDecrExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 112
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N112 = PostDecrExpression
 
 class DerefExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 113
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N113 = DerefExpression
 
 class SignExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 114
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N114 = SignExpression
 
 class NotExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 115
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N115 = NotExpression
 
 class CompExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 116
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N116 = CompExpression
 
 class CallExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 117
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N117 = CallExpression
 
 class NewExpression(Node):
+  __slots__ = fields = ("newArgs", "type", "ctorArgs")
   kind = 118
+  def __init__(self, newArgs, type, ctorArgs, pos):
+    self.newArgs = newArgs
+    self.type = type
+    self.ctorArgs = ctorArgs
+    self.pos = pos
 N118 = NewExpression
 
 class NewAnonClassExpression(Node):
+  __slots__ = fields = ("newArgs", "bases", "ctorArgs", "decls")
   kind = 119
+  def __init__(self, newArgs, bases, ctorArgs, decls, pos):
+    self.newArgs = newArgs
+    self.bases = bases
+    self.ctorArgs = ctorArgs
+    self.decls = decls
+    self.pos = pos
 N119 = NewAnonClassExpression
 
 class DeleteExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 120
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N120 = DeleteExpression
 
 class CastExpression(Node):
+  __slots__ = fields = ("type", "una")
   kind = 121
+  def __init__(self, type, una, pos):
+    self.type = type
+    self.una = una
+    self.pos = pos
 N121 = CastExpression
 
 class IndexExpression(Node):
+  __slots__ = fields = ("una", "args")
   kind = 122
+  def __init__(self, una, args, pos):
+    self.una = una
+    self.args = args
+    self.pos = pos
 N122 = IndexExpression
 
 class SliceExpression(Node):
+  __slots__ = fields = ("una", "left", "right")
   kind = 123
+  def __init__(self, una, left, right, pos):
+    self.una = una
+    self.left = left
+    self.right = right
+    self.pos = pos
 N123 = SliceExpression
 
 class ModuleScopeExpression(Node):
+  __slots__ = fields = ()
   kind = 124
+  def __init__(self, pos):
+    self.pos = pos
 N124 = ModuleScopeExpression
 
 class IdentifierExpression(Node):
+  __slots__ = fields = ("idToken",)
   kind = 125
+  def __init__(self, idToken, pos):
+    self.idToken = idToken
+    self.pos = pos
 N125 = IdentifierExpression
 
 class SpecialTokenExpression(Node):
+  __slots__ = fields = ("specialToken",)
   kind = 126
+  def __init__(self, specialToken, pos):
+    self.specialToken = specialToken
+    self.pos = pos
 N126 = SpecialTokenExpression
 
 class DotExpression(Node):
+  __slots__ = fields = ("lhs", "rhs")
   kind = 127
 N127 = DotExpression
 
 class TemplateInstanceExpression(Node):
+  __slots__ = fields = ("idToken", "targs")
   kind = 128
+  def __init__(self, idToken, targs, pos):
+    self.idToken = idToken
+    self.targs = targs
+    self.pos = pos
 N128 = TemplateInstanceExpression
 
 class ThisExpression(Node):
+  __slots__ = fields = ()
   kind = 129
+  def __init__(self, pos):
+    self.pos = pos
 N129 = ThisExpression
 
 class SuperExpression(Node):
+  __slots__ = fields = ()
   kind = 130
+  def __init__(self, pos):
+    self.pos = pos
 N130 = SuperExpression
 
 class NullExpression(Node):
+  __slots__ = fields = ()
   kind = 131
+  def __init__(self, pos):
+    self.pos = pos
 N131 = NullExpression
 
 class DollarExpression(Node):
+  __slots__ = fields = ()
   kind = 132
+  def __init__(self, pos):
+    self.pos = pos
 N132 = DollarExpression
 
 class BoolExpression(Node):
+  __slots__ = fields = ()
   kind = 133
+  def __init__(self, pos):
+    self.pos = pos
 N133 = BoolExpression
 
 class IntExpression(Node):
+  __slots__ = fields = ()
   kind = 134
+  def __init__(self, pos):
+    self.pos = pos
 N134 = IntExpression
 
 class RealExpression(Node):
+  __slots__ = fields = ()
   kind = 135
+  def __init__(self, pos):
+    self.pos = pos
 N135 = RealExpression
 
 class ComplexExpression(Node):
+  __slots__ = fields = ()
   kind = 136
+  def __init__(self, pos):
+    self.pos = pos
 N136 = ComplexExpression
 
 class CharExpression(Node):
+  __slots__ = fields = ()
   kind = 137
+  def __init__(self, pos):
+    self.pos = pos
 N137 = CharExpression
 
 class StringExpression(Node):
+  __slots__ = fields = ()
   kind = 138
+  def __init__(self, pos):
+    self.pos = pos
 N138 = StringExpression
 
 class ArrayLiteralExpression(Node):
+  __slots__ = fields = ("values",)
   kind = 139
+  def __init__(self, values, pos):
+    self.values = values
+    self.pos = pos
 N139 = ArrayLiteralExpression
 
 class AArrayLiteralExpression(Node):
+  __slots__ = fields = ("keys", "values")
   kind = 140
+  def __init__(self, keys, values, pos):
+    self.keys = keys
+    self.values = values
+    self.pos = pos
 N140 = AArrayLiteralExpression
 
 class AssertExpression(Node):
+  __slots__ = fields = ("expr", "msg")
   kind = 141
+  def __init__(self, expr, msg, pos):
+    self.expr = expr
+    self.msg = msg
+    self.pos = pos
 N141 = AssertExpression
 
 class MixinExpression(Node):
+  __slots__ = fields = ("expr",)
   kind = 142
+  def __init__(self, expr, pos):
+    self.expr = expr
+    self.pos = pos
 N142 = MixinExpression
 
 class ImportExpression(Node):
+  __slots__ = fields = ("expr",)
   kind = 143
+  def __init__(self, expr, pos):
+    self.expr = expr
+    self.pos = pos
 N143 = ImportExpression
 
 class TypeofExpression(Node):
+  __slots__ = fields = ("type",)
   kind = 144
+  def __init__(self, type, pos):
+    self.type = type
+    self.pos = pos
 N144 = TypeofExpression
 
 class TypeDotIdExpression(Node):
+  __slots__ = fields = ("type",)
   kind = 145
+  def __init__(self, type, pos):
+    self.type = type
+    self.pos = pos
 N145 = TypeDotIdExpression
 
 class TypeidExpression(Node):
+  __slots__ = fields = ("type",)
   kind = 146
+  def __init__(self, type, pos):
+    self.type = type
+    self.pos = pos
 N146 = TypeidExpression
 
 class IsExpression(Node):
+  __slots__ = fields = ("type", "specType", "tparams")
   kind = 147
+  def __init__(self, type, specType, tparams, pos):
+    self.type = type
+    self.specType = specType
+    self.tparams = tparams
+    self.pos = pos
 N147 = IsExpression
 
 class ParenExpression(Node):
+  __slots__ = fields = ("next",)
   kind = 148
+  def __init__(self, next, pos):
+    self.next = next
+    self.pos = pos
 N148 = ParenExpression
 
 class FunctionLiteralExpression(Node):
+  __slots__ = fields = ("returnType", "params", "funcBody")
   kind = 149
+  def __init__(self, returnType, params, funcBody, pos):
+    self.returnType = returnType
+    self.params = params
+    self.funcBody = funcBody
+    self.pos = pos
 N149 = FunctionLiteralExpression
 
 class TraitsExpression(Node):
+  __slots__ = fields = ("ident", "targs")
   kind = 150
+  def __init__(self, ident, targs, pos):
+    self.ident = ident
+    self.targs = targs
+    self.pos = pos
 N150 = TraitsExpression
 
 class VoidInitExpression(Node):
+  __slots__ = fields = ()
   kind = 151
+  def __init__(self, pos):
+    self.pos = pos
 N151 = VoidInitExpression
 
 class ArrayInitExpression(Node):
+  __slots__ = fields = ("keys", "values")
   kind = 152
+  def __init__(self, keys, values, pos):
+    self.keys = keys
+    self.values = values
+    self.pos = pos
 N152 = ArrayInitExpression
 
 class StructInitExpression(Node):
+  __slots__ = fields = ("idents", "values")
   kind = 153
+  def __init__(self, idents, values, pos):
+    self.idents = idents
+    self.values = values
+    self.pos = pos
 N153 = StructInitExpression
 
 class AsmTypeExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 154
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N154 = AsmTypeExpression
 
 class AsmOffsetExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 155
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N155 = AsmOffsetExpression
 
 class AsmSegExpression(Node):
+  __slots__ = fields = ("una",)
   kind = 156
+  def __init__(self, una, pos):
+    self.una = una
+    self.pos = pos
 N156 = AsmSegExpression
 
 class AsmPostBracketExpression(Node):
+  __slots__ = fields = ("una", "index")
   kind = 157
+  def __init__(self, una, index, pos):
+    self.una = una
+    self.index = index
+    self.pos = pos
 N157 = AsmPostBracketExpression
 
 class AsmBracketExpression(Node):
+  __slots__ = fields = ("expr",)
   kind = 158
+  def __init__(self, expr, pos):
+    self.expr = expr
+    self.pos = pos
 N158 = AsmBracketExpression
 
 class AsmLocalSizeExpression(Node):
+  __slots__ = fields = ()
   kind = 159
+  def __init__(self, pos):
+    self.pos = pos
 N159 = AsmLocalSizeExpression
 
 class AsmRegisterExpression(Node):
+  __slots__ = fields = ("number",)
   kind = 160
+  def __init__(self, number, pos):
+    self.number = number
+    self.pos = pos
 N160 = AsmRegisterExpression
 
 class IllegalType(Node):
+  __slots__ = fields = ()
   kind = 161
+  def __init__(self, pos):
+    self.pos = pos
 N161 = IllegalType
 
 class IntegralType(Node):
+  __slots__ = fields = ("tok",)
   kind = 162
+  def __init__(self, tok, pos):
+    self.tok = tok
+    self.pos = pos
 N162 = IntegralType
 
 class QualifiedType(Node):
+  __slots__ = fields = ("lhs", "rhs")
   kind = 163
 N163 = QualifiedType
 
 class ModuleScopeType(Node):
+  __slots__ = fields = ()
   kind = 164
+  def __init__(self, pos):
+    self.pos = pos
 N164 = ModuleScopeType
 
 class IdentifierType(Node):
+  __slots__ = fields = ("next", "ident")
   kind = 165
+  def __init__(self, next, ident, pos):
+    self.next = next
+    self.ident = ident
+    self.pos = pos
 N165 = IdentifierType
 
 class TypeofType(Node):
+  __slots__ = fields = ("expr",)
   kind = 166
+  def __init__(self, expr, pos):
+    self.expr = expr
+    self.pos = pos
 N166 = TypeofType
 
 class TemplateInstanceType(Node):
+  __slots__ = fields = ("next", "ident", "targs")
   kind = 167
+  def __init__(self, next, ident, targs, pos):
+    self.next = next
+    self.ident = ident
+    self.targs = targs
+    self.pos = pos
 N167 = TemplateInstanceType
 
 class PointerType(Node):
+  __slots__ = fields = ("next",)
   kind = 168
+  def __init__(self, next, pos):
+    self.next = next
+    self.pos = pos
 N168 = PointerType
 
 class ArrayType(Node):
+  __slots__ = fields = ("next", "assocType", "index1", "index2")
   kind = 169
+  def __init__(self, next, assocType, index1, index2, pos):
+    self.next = next
+    self.assocType = assocType
+    self.index1 = index1
+    self.index2 = index2
+    self.pos = pos
 N169 = ArrayType
 
 class FunctionType(Node):
+  __slots__ = fields = ("returnType", "params")
   kind = 170
+  def __init__(self, returnType, params, pos):
+    self.returnType = returnType
+    self.params = params
+    self.pos = pos
 N170 = FunctionType
 
 class DelegateType(Node):
+  __slots__ = fields = ("returnType", "params")
   kind = 171
+  def __init__(self, returnType, params, pos):
+    self.returnType = returnType
+    self.params = params
+    self.pos = pos
 N171 = DelegateType
 
 class CFuncPointerType(Node):
+  __slots__ = fields = ("next", "params")
   kind = 172
+  def __init__(self, next, params, pos):
+    self.next = next
+    self.params = params
+    self.pos = pos
 N172 = CFuncPointerType
 
 class BaseClassType(Node):
+  __slots__ = fields = ("next",)
   kind = 173
+  def __init__(self, next, pos):
+    self.next = next
+    self.pos = pos
 N173 = BaseClassType
 
 class ConstType(Node):
+  __slots__ = fields = ("next",)
   kind = 174
 N174 = ConstType
 
 class InvariantType(Node):
+  __slots__ = fields = ("next",)
   kind = 175
 N175 = InvariantType
 
 class Parameter(Node):
+  __slots__ = fields = ("type", "defValue")
   kind = 176
+  def __init__(self, type, defValue, pos):
+    self.type = type
+    self.defValue = defValue
+    self.pos = pos
 N176 = Parameter
 
 class Parameters(Node):
+  __slots__ = fields = ("children",)
   kind = 177
+  def __init__(self, children, pos):
+    self.children = children
+    self.pos = pos
 N177 = Parameters
 
 class TemplateAliasParameter(Node):
+  __slots__ = fields = ("spec", "def_")
   kind = 178
+  def __init__(self, spec, def_, pos):
+    self.spec = spec
+    self.def_ = def_
+    self.pos = pos
 N178 = TemplateAliasParameter
 
 class TemplateTypeParameter(Node):
+  __slots__ = fields = ("specType", "defType")
   kind = 179
+  def __init__(self, specType, defType, pos):
+    self.specType = specType
+    self.defType = defType
+    self.pos = pos
 N179 = TemplateTypeParameter
 
 class TemplateThisParameter(Node):
+  __slots__ = fields = ("specType", "defType")
   kind = 180
+  def __init__(self, specType, defType, pos):
+    self.specType = specType
+    self.defType = defType
+    self.pos = pos
 N180 = TemplateThisParameter
 
 class TemplateValueParameter(Node):
+  __slots__ = fields = ("valueType", "specValue", "defValue")
   kind = 181
+  def __init__(self, valueType, specValue, defValue, pos):
+    self.valueType = valueType
+    self.specValue = specValue
+    self.defValue = defValue
+    self.pos = pos
 N181 = TemplateValueParameter
 
 class TemplateTupleParameter(Node):
+  __slots__ = fields = ()
   kind = 182
+  def __init__(self, pos):
+    self.pos = pos
 N182 = TemplateTupleParameter
 
 class TemplateParameters(Node):
+  __slots__ = fields = ("children",)
   kind = 183
+  def __init__(self, children, pos):
+    self.children = children
+    self.pos = pos
 N183 = TemplateParameters
 
 class TemplateArguments(Node):
+  __slots__ = fields = ("children",)
   kind = 184
+  def __init__(self, children, pos):
+    self.children = children
+    self.pos = pos
 N184 = TemplateArguments
 
+NodeClasses = (N0,N1,N2,N3,N4,N5,N6,N7,N8,N9,N10,N11,N12,N13,N14,N15,N16,N17,N18,
+  N19,N20,N21,N22,N23,N24,N25,N26,N27,N28,N29,N30,N31,N32,N33,N34,N35,
+  N36,N37,N38,N39,N40,N41,N42,N43,N44,N45,N46,N47,N48,N49,N50,N51,N52,
+  N53,N54,N55,N56,N57,N58,N59,N60,N61,N62,N63,N64,N65,N66,N67,N68,N69,
+  N70,N71,N72,N73,N74,N75,N76,N77,N78,N79,N80,N81,N82,N83,N84,N85,N86,
+  N87,N88,N89,N90,N91,N92,N93,N94,N95,N96,N97,N98,N99,N100,N101,N102,
+  N103,N104,N105,N106,N107,N108,N109,N110,N111,N112,N113,N114,N115,
+  N116,N117,N118,N119,N120,N121,N122,N123,N124,N125,N126,N127,N128,
+  N129,N130,N131,N132,N133,N134,N135,N136,N137,N138,N139,N140,N141,
+  N142,N143,N144,N145,N146,N147,N148,N149,N150,N151,N152,N153,N154,
+  N155,N156,N157,N158,N159,N160,N161,N162,N163,N164,N165,N166,N167,
+  N168,N169,N170,N171,N172,N173,N174,N175,N176,N177,N178,N179,N180,
+  N181,N182,N183,N184,)
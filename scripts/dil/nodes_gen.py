@@ -1,229 +1,270 @@
 #! /usr/bin/env python
 # -*- coding: utf-8 -*-
 # Author: Aziz Köksal
-from future import unicode_literals, print_function
+from __future__ import unicode_literals, print_function
 from common import *
 __file__ = tounicode(__file__)
 
+# The members of the binary and unary expressions.
+binary = ("lhs", "rhs", "optok")
+unary = ("una",)
+
+# (Class name, member names in the order they are emitted by dil.PyTreeEmitter)
 nodes_info = (
   # Declarations:
-  "CompoundDeclaration",
-  "EmptyDeclaration",
-  "IllegalDeclaration",
-  "ModuleDeclaration",
-  "ImportDeclaration",
-  "AliasDeclaration",
-  "AliasThisDeclaration",
-  "TypedefDeclaration",
-  "EnumDeclaration",
-  "EnumMemberDeclaration",
-  "ClassDeclaration",
-  "InterfaceDeclaration",
-  "StructDeclaration",
-  "UnionDeclaration",
-  "ConstructorDeclaration",
-  "StaticConstructorDeclaration",
-  "DestructorDeclaration",
-  "StaticDestructorDeclaration",
-  "FunctionDeclaration",
-  "VariablesDeclaration",
-  "InvariantDeclaration",
-  "UnittestDeclaration",
-  "DebugDeclaration",
-  "VersionDeclaration",
-  "StaticIfDeclaration",
-  "StaticAssertDeclaration",
-  "TemplateDeclaration",
-  "NewDeclaration",
-  "DeleteDeclaration",
-  "ProtectionDeclaration",
-  "StorageClassDeclaration",
-  "LinkageDeclaration",
-  "AlignDeclaration",
-  "PragmaDeclaration",
-  "MixinDeclaration",
+  ("CompoundDeclaration", ("decls",)),
+  ("EmptyDeclaration", ()),
+  ("IllegalDeclaration", ()),
+  ("ModuleDeclaration", ("typeIdent", "moduleName", "packages")),
+  ("ImportDeclaration",
+    ("moduleFQNs", "moduleAliases", "bindNames", "bindAliases")),
+  ("AliasDeclaration", ("decl",)),
+  ("AliasThisDeclaration", ("ident",)),
+  ("TypedefDeclaration", ("decl",)),
+  ("EnumDeclaration", ("name", "baseType", "members")),
+  ("EnumMemberDeclaration", ("type", "name", "value")),
+  ("ClassDeclaration", ("name", "bases", "decls")),
+  ("InterfaceDeclaration", ("name", "bases", "decls")),
+  ("StructDeclaration", ("name", "decls")),
+  ("UnionDeclaration", ("name", "decls")),
+  ("ConstructorDeclaration", ("params", "funcBody")),
+  ("StaticConstructorDeclaration", ("funcBody",)),
+  ("DestructorDeclaration", ("funcBody",)),
+  ("StaticDestructorDeclaration", ("funcBody",)),
+  ("FunctionDeclaration", ("returnType", "name", "params", "funcBody")),
+  ("VariablesDeclaration", ("typeNode", "names", "inits")),
+  ("InvariantDeclaration", ("funcBody",)),
+  ("UnittestDeclaration", ("funcBody",)),
+  ("DebugDeclaration", ("spec", "cond", "decls", "elseDecls")),
+  ("VersionDeclaration", ("spec", "cond", "decls", "elseDecls")),
+  ("StaticIfDeclaration", ("condition", "ifDecls", "elseDecls")),
+  ("StaticAssertDeclaration", ("condition", "message")),
+  ("TemplateDeclaration", ("name", "tparams", "constraint", "decls")),
+  ("NewDeclaration", ("params", "funcBody")),
+  ("DeleteDeclaration", ("params", "funcBody")),
+  ("ProtectionDeclaration", ("decls",)),
+  ("StorageClassDeclaration", ("decls",)),
+  ("LinkageDeclaration", ("decls",)),
+  ("AlignDeclaration", ("sizetok", "decls")),
+  ("PragmaDeclaration", ("ident", "args", "decls")),
+  ("MixinDeclaration", ("templateExpr", "argument", "mixinIdent")),
 
   # Statements:
-  "CompoundStatement",
-  "IllegalStatement",
-  "EmptyStatement",
-  "FuncBodyStatement",
-  "ScopeStatement",
-  "LabeledStatement",
-  "ExpressionStatement",
-  "DeclarationStatement",
-  "IfStatement",
-  "WhileStatement",
-  "DoWhileStatement",
-  "ForStatement",
-  "ForeachStatement",
-  "ForeachRangeStatement", # D2.0
-  "SwitchStatement",
-  "CaseStatement",
-  "DefaultStatement",
-  "ContinueStatement",
-  "BreakStatement",
-  "ReturnStatement",
-  "GotoStatement",
-  "WithStatement",
-  "SynchronizedStatement",
-  "TryStatement",
-  "CatchStatement",
-  "FinallyStatement",
-  "ScopeGuardStatement",
-  "ThrowStatement",
-  "VolatileStatement",
-  "AsmBlockStatement",
-  "AsmStatement",
-  "AsmAlignStatement",
-  "IllegalAsmStatement",
-  "PragmaStatement",
-  "MixinStatement",
-  "StaticIfStatement",
-  "StaticAssertStatement",
-  "DebugStatement",
-  "VersionStatement",
+  ("CompoundStatement", ("stmnts",)),
+  ("IllegalStatement", ()),
+  ("EmptyStatement", ()),
+  ("FuncBodyStatement", ("funcBody", "inBody", "outBody", "outIdent")),
+  ("ScopeStatement", ("stmnt",)),
+  ("LabeledStatement", ("label", "stmnt")),
+  ("ExpressionStatement", ("expr",)),
+  ("DeclarationStatement", ("decl",)),
+  ("IfStatement", ("variable", "condition", "ifBody", "elseBody")),
+  ("WhileStatement", ("condition", "whileBody")),
+  ("DoWhileStatement", ("doBody", "condition")),
+  ("ForStatement", ("init", "condition", "increment", "forBody")),
+  ("ForeachStatement", ("params", "aggregate", "forBody")),
+  ("ForeachRangeStatement", ("params", "lower", "upper", "forBody")), # D2.0
+  ("SwitchStatement", ("condition", "switchBody")),
+  ("CaseStatement", ("values", "caseBody")),
+  ("DefaultStatement", ("defaultBody",)),
+  ("ContinueStatement", ("ident",)),
+  ("BreakStatement", ("ident",)),
+  ("ReturnStatement", ("expr",)),
+  ("GotoStatement", ("ident", "expr")),
+  ("WithStatement", ("expr", "withBody")),
+  ("SynchronizedStatement", ("expr", "syncBody")),
+  ("TryStatement", ("tryBody", "catchBodies", "finallyBody")),
+  ("CatchStatement", ("param", "catchBody")),
+  ("FinallyStatement", ("finallyBody",)),
+  ("ScopeGuardStatement", ("condition", "scopeBody")),
+  ("ThrowStatement", ("expr",)),
+  ("VolatileStatement", ("volatileBody",)),
+  ("AsmBlockStatement", ("statements",)),
+  ("AsmStatement", ("ident", "operands")),
+  ("AsmAlignStatement", ("numtok",)),
+  ("IllegalAsmStatement", ()),
+  ("PragmaStatement", ("ident", "args", "pragmaBody")),
+  ("MixinStatement", ("templateExpr", "mixinIdent")),
+  ("StaticIfStatement", ("condition", "ifBody", "elseBody")),
+  ("StaticAssertStatement", ("condition", "message")),
+  ("DebugStatement", ("mainBody", "elseBody")),
+  ("VersionStatement", ("mainBody", "elseBody")),
 
   # Expressions:
-  "IllegalExpression",
-  "CondExpression",
-  "CommaExpression",
-  "OrOrExpression",
-  "AndAndExpression",
-  "OrExpression",
-  "XorExpression",
-  "AndExpression",
-  "EqualExpression",
-  "IdentityExpression",
-  "RelExpression",
-  "InExpression",
-  "LShiftExpression",
-  "RShiftExpression",
-  "URShiftExpression",
-  "PlusExpression",
-  "MinusExpression",
-  "CatExpression",
-  "MulExpression",
-  "DivExpression",
-  "ModExpression",
-  "AssignExpression",
-  "LShiftAssignExpression",
-  "RShiftAssignExpression",
-  "URShiftAssignExpression",
-  "OrAssignExpression",
-  "AndAssignExpression",
-  "PlusAssignExpression",
-  "MinusAssignExpression",
-  "DivAssignExpression",
-  "MulAssignExpression",
-  "ModAssignExpression",
-  "XorAssignExpression",
-  "CatAssignExpression",
-  "AddressExpression",
-  "PreIncrExpression",
-  "PreDecrExpression",
-  "PostIncrExpression",
-  "PostDecrExpression",
-  "DerefExpression",
-  "SignExpression",
-  "NotExpression",
-  "CompExpression",
-  "CallExpression",
-  "NewExpression",
-  "NewAnonClassExpression",
-  "DeleteExpression",
-  "CastExpression",
-  "IndexExpression",
-  "SliceExpression",
-  "ModuleScopeExpression",
-  "IdentifierExpression",
-  "SpecialTokenExpression",
-  "DotExpression",
-  "TemplateInstanceExpression",
-  "ThisExpression",
-  "SuperExpression",
-  "NullExpression",
-  "DollarExpression",
-  "BoolExpression",
-  "IntExpression",
-  "RealExpression",
-  "ComplexExpression",
-  "CharExpression",
-  "StringExpression",
-  "ArrayLiteralExpression",
-  "AArrayLiteralExpression",
-  "AssertExpression",
-  "MixinExpression",
-  "ImportExpression",
-  "TypeofExpression",
-  "TypeDotIdExpression",
-  "TypeidExpression",
-  "IsExpression",
-  "ParenExpression",
-  "FunctionLiteralExpression",
-  "TraitsExpression", # D2.0
-  "VoidInitExpression",
-  "ArrayInitExpression",
-  "StructInitExpression",
-  "AsmTypeExpression",
-  "AsmOffsetExpression",
-  "AsmSegExpression",
-  "AsmPostBracketExpression",
-  "AsmBracketExpression",
-  "AsmLocalSizeExpression",
-  "AsmRegisterExpression",
+  ("IllegalExpression", ()),
+  ("CondExpression", ("condition", "lhs", "rhs", "optok", "ctok")),
+  ("CommaExpression", binary),
+  ("OrOrExpression", binary),
+  ("AndAndExpression", binary),
+  ("OrExpression", binary),
+  ("XorExpression", binary),
+  ("AndExpression", binary),
+  ("EqualExpression", binary),
+  ("IdentityExpression", binary),
+  ("RelExpression", binary),
+  ("InExpression", binary),
+  ("LShiftExpression", binary),
+  ("RShiftExpression", binary),
+  ("URShiftExpression", binary),
+  ("PlusExpression", binary),
+  ("MinusExpression", binary),
+  ("CatExpression", binary),
+  ("MulExpression", binary),
+  ("DivExpression", binary),
+  ("ModExpression", binary),
+  ("AssignExpression", binary),
+  ("LShiftAssignExpression", binary),
+  ("RShiftAssignExpression", binary),
+  ("URShiftAssignExpression", binary),
+  ("OrAssignExpression", binary),
+  ("AndAssignExpression", binary),
+  ("PlusAssignExpression", binary),
+  ("MinusAssignExpression", binary),
+  ("DivAssignExpression", binary),
+  ("MulAssignExpression", binary),
+  ("ModAssignExpression", binary),
+  ("XorAssignExpression", binary),
+  ("CatAssignExpression", binary),
+  ("AddressExpression", unary),
+  ("PreIncrExpression", unary),
+  ("PreDecrExpression", unary),
+  ("PostIncrExpression", unary),
+  ("PostDecrExpression", unary),
+  ("DerefExpression", unary),
+  ("SignExpression", unary),
+  ("NotExpression", unary),
+  ("CompExpression", unary),
+  ("CallExpression", unary),
+  ("NewExpression", ("newArgs", "type", "ctorArgs")),
+  ("NewAnonClassExpression", ("newArgs", "bases", "ctorArgs", "decls")),
+  ("DeleteExpression", unary),
+  ("CastExpression", ("type", "una")),
+  ("IndexExpression", ("una", "args")),
+  ("SliceExpression", ("una", "left", "right")),
+  ("ModuleScopeExpression", ()),
+  ("IdentifierExpression", ("idToken",)),
+  ("SpecialTokenExpression", ("specialToken",)),
+  ("DotExpression", ("lhs", "rhs")),
+  ("TemplateInstanceExpression", ("idToken", "targs")),
+  ("ThisExpression", ()),
+  ("SuperExpression", ()),
+  ("NullExpression", ()),
+  ("DollarExpression", ()),
+  ("BoolExpression", ()),
+  ("IntExpression", ()),
+  ("RealExpression", ()),
+  ("ComplexExpression", ()),
+  ("CharExpression", ()),
+  ("StringExpression", ()),
+  ("ArrayLiteralExpression", ("values",)),
+  ("AArrayLiteralExpression", ("keys", "values")),
+  ("AssertExpression", ("expr", "msg")),
+  ("MixinExpression", ("expr",)),
+  ("ImportExpression", ("expr",)),
+  ("TypeofExpression", ("type",)),
+  ("TypeDotIdExpression", ("type",)),
+  ("TypeidExpression", ("type",)),
+  ("IsExpression", ("type", "specType", "tparams")),
+  ("ParenExpression", ("next",)),
+  ("FunctionLiteralExpression", ("returnType", "params", "funcBody")),
+  ("TraitsExpression", ("ident", "targs")), # D2.0
+  ("VoidInitExpression", ()),
+  ("ArrayInitExpression", ("keys", "values")),
+  ("StructInitExpression", ("idents", "values")),
+  ("AsmTypeExpression", unary),
+  ("AsmOffsetExpression", unary),
+  ("AsmSegExpression", unary),
+  ("AsmPostBracketExpression", ("una", "index")),
+  ("AsmBracketExpression", ("expr",)),
+  ("AsmLocalSizeExpression", ()),
+  ("AsmRegisterExpression", ("number",)),
 
   # Types:
-  "IllegalType",
-  "IntegralType",
-  "QualifiedType",
-  "ModuleScopeType",
-  "IdentifierType",
-  "TypeofType",
-  "TemplateInstanceType",
-  "PointerType",
-  "ArrayType",
-  "FunctionType",
-  "DelegateType",
-  "CFuncPointerType",
-  "BaseClassType",
-  "ConstType", # D2.0
-  "InvariantType", # D2.0
+  ("IllegalType", ()),
+  ("IntegralType", ("tok",)),
+  ("QualifiedType", ("lhs", "rhs")),
+  ("ModuleScopeType", ()),
+  ("IdentifierType", ("next", "ident")),
+  ("TypeofType", ("expr",)),
+  ("TemplateInstanceType", ("next", "ident", "targs")),
+  ("PointerType", ("next",)),
+  ("ArrayType", ("next", "assocType", "index1", "index2")),
+  ("FunctionType", ("returnType", "params")),
+  ("DelegateType", ("returnType", "params")),
+  ("CFuncPointerType", ("next", "params")),
+  ("BaseClassType", ("next",)),
+  ("ConstType", ("next",)), # D2.0
+  ("InvariantType", ("next",)), # D2.0
 
   # Parameters:
-  "Parameter",
-  "Parameters",
-  "TemplateAliasParameter",
-  "TemplateTypeParameter",
-  "TemplateThisParameter", # D2.0
-  "TemplateValueParameter",
-  "TemplateTupleParameter",
-  "TemplateParameters",
-  "TemplateArguments",
+  ("Parameter", ("type", "defValue")),
+  ("Parameters", ("children",)),
+  ("TemplateAliasParameter", ("spec", "def_")),
+  ("TemplateTypeParameter", ("specType", "defType")),
+  ("TemplateThisParameter", ("specType", "defType")), # D2.0
+  ("TemplateValueParameter", ("valueType", "specValue", "defValue")),
+  ("TemplateTupleParameter", ()),
+  ("TemplateParameters", ("children",)),
+  ("TemplateArguments", ("children",)),
 )
 
+# Nodes that may be emitted with fewer members than listed above.
+# They use the generic Node constructor, which fills in None.
+varargs_nodes = ("QualifiedType", "DotExpression", "ConstType", "InvariantType")
+
 def main():
   this_dir = Path(__file__).folder
   f = (this_dir/"nodes.py").open("w")
 
   f.write("""# -*- coding: utf-8 -*-
 # Author: Aziz Köksal
+# Generated by nodes_gen.py. Don't edit.
 
-class Node:
+class Node(object):
+  __slots__ = ("pos",)
   kind = None
+  fields = () # The names of the members in the order of the constructor args.
   def __init__(self, *args):
-    self.m = args[:-1]
+    \"\"\" Assigns args[:-1] to the fields and args[-1] to pos.
+      Missing members are set to None. \"\"\"
+    for i, name in enumerate(self.fields):
+      setattr(self, name, args[i] if i < len(args) - 1 else None)
     self.pos = args[-1]
 
+  @property
+  def m(self):
+    \"\"\" Returns the members as a tuple. \"\"\"
+    return tuple([getattr(self, name) for name in self.fields])
+
 """)
 
   i = 0
-  for n in nodes_info:
+  for n, fields in nodes_info:
     # Write a class that inherits from Node.
-    f.write("class %s(Node):\n  kind = %d\n" % (n, i))
+    f.write("class %s(Node):\n" % n)
+    fields_str = ", ".join('"%s"' % field for field in fields)
+    if len(fields) == 1:
+      fields_str += "," # Trailing comma for single element tuples.
+    f.write("  __slots__ = fields = (%s)\n" % fields_str)
+    f.write("  kind = %d\n" % i)
+    if n not in varargs_nodes: # Write a faster, specialized constructor.
+      f.write("  def __init__(self, %s):\n" % ", ".join(fields + ("pos",)))
+      for field in fields + ("pos",):
+        f.write("    self.%s = %s\n" % (field, field))
     # Write an alias.
     f.write("N%s = %s\n\n" % (i, n))
     i += 1
 
+  # Write a table of all classes, indexable by kind.
+  f.write("NodeClasses = (")
+  line = ""
+  for i in range(len(nodes_info)):
+    item = "N%d," % i
+    if len(line) + len(item) >= 70:
+      f.write(line + "\n  ")
+      line = ""
+    line += item
+  f.write(line + ")\n")
+
 if __name__ == '__main__':
   main()
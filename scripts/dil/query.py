@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from dil.flatast import FlatTree
+from dil.nodes import Node, NodeClasses
+from fnmatch import fnmatchcase
+import re
+
+# A small selector language for finding nodes in syntax trees.
+#
+#   Selector := Path ("," Path)*
+#   Path := Compound (Combinator Compound)*
+#   Combinator := " " (descendant) | ">" (child)
+#   Compound := NamePattern Attribute* | Attribute+
+#   NamePattern := A node class name with optional wildcards (* and ?).
+#   Attribute := "[" Field "]"         (the field is set)
+#              | "[" Field "=" Text "]"  (token text or node class name)
+#              | "[" Field "~=" Regexp "]"
+#
+# E.g.: "StaticIfDeclaration ImportDeclaration"
+#       "CallExpression > IdentifierExpression[idToken=writefln]"
+#       "*Declaration[name~=^opCmp$]"
+
+rx_selector = re.compile(
+  r"(\s*)(?:(>)|(,)|\[(\w+)(?:(~?=)([^\]]*))?\]|([\w*?]+))")
+
+class Step:
+  """ One compound selector of a path. """
+  def __init__(self, combinator, kinds):
+    self.combinator = combinator # None, " " or ">".
+    self.kinds = kinds # A set of node kinds, or None for any kind.
+    self.tests = [] # Predicates on node objects.
+
+def value_matcher(op, text):
+  """ Returns a predicate for the value of a node field. """
+  if op == None:
+    def match(v):
+      return v != None and v != -1 and v != ()
+    return match
+  if op == "~=":
+    test_text = re.compile(text).search
+  else:
+    test_text = lambda s: s == text
+  def match(v):
+    if isinstance(v, tuple):
+      return any(match(x) for x in v)
+    if isinstance(v, Node):
+      return fnmatchcase(v.__class__.__name__, text)
+    return v != None and v != -1 and bool(test_text(v.text))
+  return match
+
+def field_test(field, op, text):
+  match = value_matcher(op, text)
+  return lambda node: match(getattr(node, field, None))
+
+def compile_selector(selector):
+  """ Parses a selector string into a list of paths (lists of Steps.) """
+  paths, steps = [], []
+  combinator = None
+  pos = 0
+  selector = selector.strip()
+  while pos < len(selector):
+    m = rx_selector.match(selector, pos)
+    if not m or m.end() == pos:
+      raise Exception("invalid selector at %d: '%s'" % (pos, selector))
+    pos = m.end()
+    ws, gt, comma, field, op, text, name = m.groups()
+    if gt:
+      combinator = ">"
+    elif comma:
+      if not steps:
+        raise Exception("empty path in selector '%s'" % selector)
+      paths.append(steps)
+      steps, combinator = [], None
+    elif name or ws or not steps or combinator:
+      # Start a new compound selector.
+      kinds = None
+      if name and name != "*":
+        kinds = set([cls.kind for cls in NodeClasses
+                     if fnmatchcase(cls.__name__, name)])
+        if not kinds:
+          raise Exception("no node class matches '%s'" % name)
+      steps.append(Step(combinator or (" " if steps else None), kinds))
+      combinator = None
+      if field:
+        steps[-1].tests.append(field_test(field, op, text))
+    else: # An attribute of the current compound selector.
+      steps[-1].tests.append(field_test(field, op, text))
+  if combinator or not steps:
+    raise Exception("incomplete selector '%s'" % selector)
+  paths.append(steps)
+  return paths
+
+class Query:
+  """ A compiled selector. Matches right to left: the candidates come
+    from the per-kind index of a FlatTree, and are then checked against
+    their ancestors. Trees that lack a required kind are skipped. """
+  def __init__(self, selector):
+    self.selector = selector
+    self.paths = compile_selector(selector)
+
+  def __repr__(self):
+    return "Query(%r)" % self.selector
+
+  def find(self, tree):
+    """ Returns the sorted indices of the matching nodes in a FlatTree.
+      The tree must keep its nodes if the selector tests fields. """
+    result = set()
+    for steps in self.paths:
+      result.update(self.find_path(tree, steps))
+    return sorted(result)
+
+  def find_path(self, tree, steps):
+    kinds, parents, nodes = tree.kinds, tree.parents, tree.nodes
+    # Prune early: every step must be able to match some node.
+    for step in steps:
+      if step.kinds != None and \
+         not any(len(tree.kind_index[k]) for k in step.kinds):
+        return []
+    def test(step, i):
+      if step.kinds != None and kinds[i] not in step.kinds:
+        return False
+      for t in step.tests:
+        if not t(nodes[i]):
+          return False
+      return True
+    def test_ancestors(i, s):
+      """ Node i matches steps[s]. Checks steps[:s] against its ancestors. """
+      if s == 0:
+        return True
+      step, prev = steps[s], steps[s-1]
+      i = parents[i]
+      while i != -1:
+        if test(prev, i) and test_ancestors(i, s-1):
+          return True
+        if step.combinator == ">":
+          break
+        i = parents[i]
+      return False
+    last = steps[-1]
+    if last.kinds == None:
+      candidates = xrange(len(tree))
+    else:
+      candidates = tree.of_kind(*last.kinds)
+    s = len(steps) - 1
+    return [i for i in candidates if test(last, i) and test_ancestors(i, s)]
+
+  def select(self, module):
+    """ Returns the matching node objects of a module. """
+    tree = FlatTree.from_module(module, keep_nodes=True)
+    return [tree.nodes[i] for i in self.find(tree)]
+
+def select(selector, module):
+  """ Shortcut for Query(selector).select(module). """
+  return Query(selector).select(module)
+
+def query_modules(queries, modules):
+  """ Runs many queries over many modules, flattening each module once.
+    Returns a dictionary that maps each query to a list of
+    (module, node) tuples. """
+  queries = [q if isinstance(q, Query) else Query(q) for q in queries]
+  result = dict((q, []) for q in queries)
+  for module in modules:
+    if not module.root:
+      continue
+    tree = FlatTree.from_module(module, keep_nodes=True)
+    for q in queries:
+      result[q].extend((module, tree.nodes[i]) for i in q.find(tree))
+  return result
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from dil.token import Token, TOK, string_table
+from array import array
+from bisect import bisect_right
+
+def token_length(t):
+  """ Returns the number of source characters of a token,
+    including its preceding whitespace. """
+  if t.kind == TOK.EOF:
+    return len(t.ws)
+  return len(t.ws) + len(t.text)
+
+def token_source(tokens):
+  """ Returns the source text of a sequence of tokens. """
+  return "".join(t.ws if t.kind == TOK.EOF else t.ws + t.text for t in tokens)
+
+class TokenEditor:
+  """ Applies text edits to the Token list of a module in place.
+    Only a window of tokens around an edit is re-lexed and re-linked.
+    The other Token objects are kept, so their identity (and cached values)
+    survive the edit. The offsets and line numbers of the tokens after
+    an edit are recomputed lazily, when they are asked for.
+  tokens = The list of Tokens returned by dil.token.create_tokens().
+  lex = A function that lexes a source text and returns its tokens as
+    (kind, ws, text) tuples, ending with an EOF token. E.g. the result of
+    dil.token.iter_tokens(token_list, tuples=True) for a token_list that
+    was generated from the text.
+  offsets = The source offsets of the tokens (including their whitespace.)
+  valid = The number of leading tokens whose offsets and linnums are
+    up to date.
+  Offsets count the characters of the token texts. (A Newline token
+  counts as one character.)
+  """
+  # The number of tokens whose offsets are computed at a time.
+  update_step = 64
+
+  def __init__(self, tokens, lex):
+    self.tokens = tokens
+    self.lex = lex
+    self.offsets = array(b'I')
+    self.valid = 0
+    self.interned = bool(tokens) and hasattr(tokens[0], "text_id")
+
+  def update(self, n):
+    """ Brings the offsets and linnums of the first n tokens up to date. """
+    tokens, offsets = self.tokens, self.offsets
+    n = min(n, len(tokens))
+    i = self.valid
+    if i >= n:
+      return
+    del offsets[i:]
+    if i:
+      offset = offsets[i-1] + token_length(tokens[i-1])
+      linnum = tokens[i-1].linnum
+    else:
+      offset, linnum = 0, 1
+    for i in xrange(i, n):
+      t = tokens[i]
+      if t.kind == TOK.Newline:
+        linnum += 1
+      t.linnum = linnum
+      offsets.append(offset)
+      offset += token_length(t)
+    self.valid = n
+
+  def flush(self):
+    """ Brings the offsets and linnums of all tokens up to date. """
+    self.update(len(self.tokens))
+
+  def offset(self, i):
+    """ Returns the source offset of the i-th token. """
+    self.update(i + 1)
+    return self.offsets[i]
+
+  def linnum(self, i):
+    """ Returns the line number of the i-th token. """
+    self.update(i + 1)
+    return self.tokens[i].linnum
+
+  def token_at(self, offset):
+    """ Returns the index of the token whose span
+      (including its whitespace) contains offset. """
+    tokens, offsets = self.tokens, self.offsets
+    while self.valid < len(tokens) and \
+          (self.valid == 0 or offsets[self.valid-1] <= offset):
+      self.update(self.valid + self.update_step)
+    return max(bisect_right(offsets, offset) - 1, 0)
+
+  def relex(self, a, b, begin, end, text):
+    """ Re-lexes tokens[a:b] with the source range [begin, end)
+      replaced by text. Widens the window until the lexer is in sync
+      with the old tokens again. Returns (a, b, new token tuples). """
+    tokens = self.tokens
+    while True:
+      self.update(b)
+      start = self.offsets[a]
+      old_text = token_source(tokens[a:b])
+      new = list(self.lex(old_text[:begin-start] + text + old_text[end-start:]))
+      if b == len(tokens):
+        return a, b, new # The window includes the EOF token.
+      if new and new[-1][0] == TOK.EOF and not new[-1][1]:
+        new.pop()
+        last = tokens[b-1]
+        # The text after the window is lexed the same way,
+        # if the last token of the window wasn't changed by the edit.
+        if b - 1 > self.token_at(end) and new and \
+           new[-1] == (last.kind, last.ws, last.text):
+          return a, b, new
+      grow = max(b - a, 1)
+      a, b = max(a - grow, 0), min(b + grow, len(tokens))
+
+  def edit(self, begin, end, text):
+    """ Replaces the source characters [begin, end) with text.
+      Returns (index, removed, inserted), where removed and inserted are
+      the lists of old and new Tokens at tokens[index:]. """
+    if begin > end:
+      raise Exception("invalid edit range [%d, %d)" % (begin, end))
+    tokens = self.tokens
+    # Start with the tokens touched by the edit and one more on each side.
+    a = max(self.token_at(begin) - 1, 0)
+    b = min(self.token_at(end) + 2, len(tokens))
+    a, b, new = self.relex(a, b, begin, end, text)
+    # Keep the tokens at the edges of the window which didn't change.
+    old = tokens[a:b]
+    p, q = 0, 0
+    n = min(len(old), len(new))
+    while p < n and new[p] == (old[p].kind, old[p].ws, old[p].text):
+      p += 1
+    while q < n - p and \
+          new[-1-q] == (old[-1-q].kind, old[-1-q].ws, old[-1-q].text):
+      q += 1
+    lo, hi = a + p, b - q
+    removed = tokens[lo:hi]
+    inserted = []
+    for kind, ws, text in new[p:len(new)-q]:
+      if self.interned:
+        tid = string_table.id(text)
+        token = Token(kind, ws, string_table[tid])
+        token.text_id = tid
+      else:
+        token = Token(kind, ws, text)
+      inserted.append(token)
+    # Re-link the new tokens with their neighbours.
+    prev = tokens[lo-1] if lo else (tokens[0].prev if tokens else None)
+    next = tokens[hi] if hi < len(tokens) else None
+    for token in inserted:
+      token.prev = prev
+      if prev != None:
+        prev.next = token
+      prev = token
+    if prev != None:
+      prev.next = next
+    if next != None:
+      next.prev = prev
+    for token in removed: # Detach the old tokens.
+      token.prev = token.next = None
+    tokens[lo:hi] = inserted
+    self.valid = min(self.valid, lo)
+    return lo, removed, inserted
@@ -0,0 +1,200 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+from dil.token import TOK, TokenArray, rx_newline
+from dil.visitor import iter_subnodes
+from dil.flatast import FlatTree
+from dil.nodes import NodeClasses
+from array import array
+from bisect import bisect_left, bisect_right
+import re
+
+# The token kinds as counted by the command 'dil stats'.
+number_kinds = tuple(range(TOK.Int32, TOK.Imaginary80 + 1))
+keyword_kinds = tuple(range(TOK.Abstract, TOK.Void + 1))
+# Whitespace tokens other than comments and newlines.
+ws_token_kinds = (TOK.Shebang, TOK.HashLine, TOK.Filespec, TOK.Empty)
+# Tokens whose texts are stored in the string list of a module.
+literal_kinds = (TOK.Illegal, TOK.Comment, TOK.Shebang, TOK.HashLine,
+  TOK.Identifier, TOK.String, TOK.CharLiteral) + number_kinds
+# The lengths of the fixed token texts. (HEAD and EOF aren't in the source.)
+fixed_text_lengths = [0 if k in literal_kinds or k in (TOK.HEAD, TOK.EOF)
+                      else len(TOK.str[k]) for k in xrange(TOK.MAX)]
+
+def bincount(a, size):
+  """ Returns the number of occurrences of each integer from 0 to size-1
+    in an array. Other values are ignored. The elements are counted
+    by C code, not in a Python loop. """
+  if not a:
+    return [0] * size
+  if size <= 256 and 0 <= min(a) and max(a) < 256:
+    data = array(b'B', a).tostring()
+    return [data.count(chr(i)) for i in xrange(size)]
+  a = sorted(a)
+  return [bisect_right(a, i) - bisect_left(a, i) for i in xrange(size)]
+
+def weighted_sum(counts, values):
+  return sum(c * v for c, v in zip(counts, values) if c)
+
+def node_kinds(root):
+  """ Returns the kinds of all nodes of a syntax tree in an array. """
+  kinds = array(b'H')
+  stack = [root] if root else []
+  while stack:
+    node = stack.pop()
+    kinds.append(node.kind)
+    stack.extend(iter_subnodes(node))
+  return kinds
+
+class Statistics(object):
+  """ Token and node statistics of a group of modules,
+    like those printed by 'dil stats'. """
+  def __init__(self):
+    self.module_count = 0
+    self.char_count = 0 # All characters.
+    self.whitespace_count = 0 # Whitespace characters.
+    self.comment_char_count = 0 # Characters in comments.
+    self.ws_token_count = 0
+    self.keyword_count = 0
+    self.ident_count = 0
+    self.number_count = 0
+    self.comment_count = 0
+    self.token_count = 0
+    self.lines_of_code = 0
+    self.tokens_table = [0] * TOK.MAX # The counts of all token kinds.
+    self.nodes_table = [0] * len(NodeClasses) # The counts of all node kinds.
+    self.module_lines = {} # Maps module FQNs to their line counts.
+
+  def __iadd__(self, other):
+    for name in ("module_count", "char_count", "whitespace_count",
+                 "comment_char_count", "ws_token_count", "keyword_count",
+                 "ident_count", "number_count", "comment_count",
+                 "token_count", "lines_of_code"):
+      setattr(self, name, getattr(self, name) + getattr(other, name))
+    self.tokens_table = map(sum, zip(self.tokens_table, other.tokens_table))
+    self.nodes_table = map(sum, zip(self.nodes_table, other.nodes_table))
+    self.module_lines.update(other.module_lines)
+    return self
+
+  @property
+  def whitespace_ratio(self):
+    return self.whitespace_count / float(self.char_count or 1)
+
+  @property
+  def comment_ratio(self):
+    return self.comment_char_count / float(self.char_count or 1)
+
+  def add_tokens(self, tokens, fqn=None):
+    """ Counts a list of Tokens or a TokenArray. """
+    if not isinstance(tokens, TokenArray):
+      tokens = TokenArray.from_tokens(tokens)
+    str_list, ws_list = tokens.str_list, tokens.ws_list
+    kind_counts = bincount(tokens.kinds, TOK.MAX)
+    # str_list may be the string table shared by all modules,
+    # so only the indices that occur are counted. (-1 = fixed text.)
+    idx = sorted(tokens.text_idx)
+    text_counts = [(i, bisect_right(idx, i) - bisect_left(idx, i))
+                   for i in set(idx) if i >= 0]
+    ws_counts = bincount(tokens.ws_idx, len(ws_list))
+    whitespace = weighted_sum(ws_counts, map(len, ws_list))
+    chars = whitespace + weighted_sum(kind_counts, fixed_text_lengths) + \
+      sum(c * len(str_list[i]) for i, c in text_counts)
+    # Find the comments by searching the kinds as a byte string.
+    kinds = array(b'B', tokens.kinds).tostring()
+    text_idx = tokens.text_idx
+    comment_chars = sum(len(str_list[text_idx[m.start()]])
+      for m in re.finditer(re.escape(chr(TOK.Comment)), kinds))
+    # Lines are ended by Newline tokens and by line breaks in literals.
+    lines = 1 + kind_counts[TOK.Newline] + sum(
+      c * len(rx_newline.findall(str_list[i])) for i, c in text_counts
+      if "\n" in str_list[i] or "\r" in str_list[i])
+
+    self.module_count += 1
+    self.char_count += chars
+    self.whitespace_count += whitespace
+    self.comment_char_count += comment_chars
+    self.ws_token_count += sum(kind_counts[k] for k in ws_token_kinds)
+    self.keyword_count += sum(kind_counts[k] for k in keyword_kinds)
+    self.ident_count += kind_counts[TOK.Identifier]
+    self.number_count += sum(kind_counts[k] for k in number_kinds)
+    self.comment_count += kind_counts[TOK.Comment]
+    self.token_count += len(tokens)
+    self.lines_of_code += lines
+    self.tokens_table = map(sum, zip(self.tokens_table, kind_counts))
+    if fqn != None:
+      self.module_lines[fqn] = lines
+
+  def add_nodes(self, tree):
+    """ Counts the nodes of a syntax tree or a FlatTree. """
+    if isinstance(tree, FlatTree):
+      counts = tree.kind_counts()
+    else:
+      counts = bincount(node_kinds(tree), len(NodeClasses))
+    self.nodes_table = map(sum, zip(self.nodes_table, counts))
+
+  def add_module(self, module, nodes=True):
+    """ Counts the tokens and, if nodes is True, the nodes of a module. """
+    self.add_tokens(module.tokens, module.fqn)
+    if nodes and module.root:
+      self.add_nodes(module.root)
+
+def module_statistics(modules, nodes=True):
+  """ Returns the Statistics of a list of dil.module.Module objects. """
+  stats = Statistics()
+  for module in modules:
+    stats.add_module(module, nodes)
+  return stats
+
+def main():
+  from optparse import OptionParser
+  from common import load_pymodules_parallel
+  from path import Path
+
+  usage = "Usage: python -m dil.stats PYMODULES_DIR [Options]"
+  parser = OptionParser(usage=usage)
+  parser.add_option("--toktable", dest="toktable", action="store_true",
+    default=False, help="print the count of all token kinds")
+  parser.add_option("--asttable", dest="asttable", action="store_true",
+    default=False, help="print the count of all node kinds")
+  parser.add_option("-m", "--modules", dest="modules", action="store_true",
+    default=False, help="print the line count of every module")
+
+  (options, args) = parser.parse_args()
+  if len(args) < 1:
+    return parser.print_help()
+
+  modules = load_pymodules_parallel(Path(args[0]), nodes=options.asttable)
+  stats = module_statistics(modules, options.asttable)
+  if options.modules:
+    for fqn in sorted(stats.module_lines):
+      print("%8d %s" % (stats.module_lines[fqn], fqn))
+  print("Total of %d files:\n"
+        "Whitespace character count: %d (%.1f%%)\n"
+        "Whitespace token count: %d\n"
+        "Keyword count: %d\n"
+        "Identifier count: %d\n"
+        "Number count: %d\n"
+        "Comment count: %d (%.1f%% of all characters)\n"
+        "All tokens count: %d\n"
+        "Lines of code: %d" % (stats.module_count,
+    stats.whitespace_count, 100 * stats.whitespace_ratio,
+    stats.ws_token_count, stats.keyword_count, stats.ident_count,
+    stats.number_count, stats.comment_count, 100 * stats.comment_ratio,
+    stats.token_count, stats.lines_of_code))
+  if options.toktable:
+    print("Table of tokens:")
+    print(" %10s | %s" % ("Count", "Token kind"))
+    print("-----------------------------")
+    for kind, count in enumerate(stats.tokens_table):
+      print(" %10d | %s" % (count, TOK.str[kind]))
+    print("// End of tokens table.")
+  if options.asttable:
+    print("Table of nodes:")
+    print(" %10s | %s" % ("Count", "Node kind"))
+    print("-----------------------------")
+    for cls, count in zip(NodeClasses, stats.nodes_table):
+      print(" %10d | %s" % (count, cls.__name__))
+    print("// End of nodes table.")
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from dil.token import TOK, create_tokens
+from dil.lines import LineIndex
+import unittest
+
+# Run with: python -m unittest dil.test_lines
+
+class LineIndexTest(unittest.TestCase):
+  def setUp(self):
+    # "module a;\n  int b;\n" as a token list of 'dil py'.
+    # The 2nd element of a tuple is the number of preceding spaces.
+    token_list = (["a", "b"], [
+      (TOK.Module, 0), (TOK.Identifier, 1, 0), (TOK.Semicolon, 0),
+      (TOK.Newline, 0),
+      (TOK.Int, 2), (TOK.Identifier, 1, 1), (TOK.Semicolon, 0),
+      (TOK.Newline, 0), (TOK.EOF, 0)])
+    self.tokens = create_tokens(token_list, compact=False)
+    self.index = LineIndex(self.tokens)
+
+  def test_columns_at_line_start(self):
+    self.assertEqual(self.index.token_location(0), (1, 1)) # module
+    self.assertEqual(self.index.token_location(1), (1, 8)) # a
+    self.assertEqual(self.index.token_location(4), (2, 3)) # int
+
+  def test_offsets(self):
+    self.assertEqual(list(self.index.line_starts), [0, 10, 19])
+    self.assertEqual(self.index.length, 19)
+    self.assertEqual(self.index.offset_of(2, 3), 12)
+
+  def test_newline_lines(self):
+    # A Newline token is on the line it ends; Token.linnum counts
+    # it to the next line.
+    self.assertEqual(self.index.token_line(3), 1)
+    self.assertEqual(self.tokens[3].linnum, 2)
+    self.assertEqual(self.index.token_line(4), self.tokens[4].linnum)
+
+if __name__ == '__main__':
+  unittest.main()
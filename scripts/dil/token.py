@@ -2,6 +2,9 @@
 # Author: Aziz Köksal
 from __future__ import unicode_literals
 from dil.token_list import TOK
+from array import array
+from fractions import Fraction
+from htmlentitydefs import name2codepoint
 import re
 
 class Token:
@@ -10,7 +13,8 @@ class Token:
   is_ws = Is this a whitespace token?
   ws = Preceding whitespace characters.
   text = The text of the token.
-  value = The value (str,int,float etc.) of the token.
+  text_id = The ID of the text in string_table. (Only if interned.)
+  value = The value (str,int,float etc.) of the token. Decoded on first access.
   next = Next token in the list.
   prev = Previous token in the list.
   """
@@ -19,19 +23,88 @@ class Token:
     self.is_ws = (2 <= kind <= 7) #kind in (2, 3, 4, 5, 6, 7)
     self.ws = ws
     self.text = text
-    self.value = None
     self.next = self.prev = None
     self.linnum = None
 
+  def __getattr__(self, name):
+    """ Decodes the value lazily and caches it as an instance attribute. """
+    if name == "value":
+      self.value = value = parse_funcs[self.kind](self, None)
+      return value
+    raise AttributeError(name)
+
   def __unicode__(self):
     return self.text
   __str__ = __unicode__
 
 # Create a table of whitespace strings.
-ws_table = " "*20
-ws_table = [ws_table[:i] for i in range(1,21)]
+# The whitespace strings of the counts 0 to 19.
+ws_table = [" "*i for i in range(20)]
+
+def get_ws(ws):
+  """ Returns the whitespace string of a token tuple's 2nd element. """
+  if type(ws) == int:
+    # Get ws from the table if short enough, otherwise create it.
+    ws = ws_table[ws] if ws < 20 else " "*ws
+  return ws
+
+def get_text(tup, str_list):
+  """ Returns the text of a token tuple. """
+  if len(tup) < 3: # No 3rd element: get the text from the table TOK.str.
+    return TOK.str[tup[0]]
+  text = tup[2]
+  if type(text) == int: # An index into str_list.
+    return str_list[text]
+  return "".join(tup[2:]) # Shebang, HashLine or Illegal token.
+
+class StringTable:
+  """ Maps distinct strings to integer IDs. """
+  def __init__(self):
+    self.strings = [] # The strings by ID.
+    self.ids = {} # Maps strings to IDs.
+
+  def id(self, s):
+    """ Returns the ID of a string, adding it if necessary. """
+    i = self.ids.get(s)
+    if i == None:
+      i = self.ids[s] = len(self.strings)
+      self.strings.append(s)
+    return i
 
-def create_tokens(token_list):
+  def __len__(self):
+    return len(self.strings)
+
+  def __getitem__(self, i):
+    return self.strings[i]
+
+# The process-wide table that interned token texts are shared in.
+string_table = StringTable()
+
+# Set to True to make create_tokens() return TokenArray objects by default.
+# The generated d_*.py modules call create_tokens() without arguments.
+compact_tokens = False
+# Set to False to make create_tokens() skip value decoding by default.
+decode_values = True
+# Set to True to make create_tokens() intern texts in string_table by default.
+intern_strings = False
+
+def create_tokens(token_list, compact=None, values=None, interned=None):
+  """ Creates a doubly-linked list of Token objects.
+    Returns a TokenArray instead if compact is True.
+    Token.value is decoded lazily; it is always None if values is False.
+    If interned is True, equal texts of all modules share one object
+    and one ID in string_table, so they can be compared as integers. """
+  if values == None:
+    values = decode_values
+  if interned == None:
+    interned = intern_strings
+  if compact or (compact == None and compact_tokens):
+    tokens = TokenArray.from_token_list(token_list)
+    tokens.decode_values = values
+    if interned:
+      tokens.intern()
+    return tokens
+  strings, text_id = string_table.strings, string_table.id
   str_list = token_list[0] # The first element must be the string list.
   token_list = token_list[1]
   head = Token(TOK.HEAD, "", "")
@@ -43,24 +116,277 @@ def create_tokens(token_list):
     kind = tup[0]
     if kind == TOK.Newline:
       line_num += 1
-    ws = tup[1]
-    if type(ws) == int:
-      # Get ws from the table if short enough, otherwise create it.
-      ws = ws_table[ws] if ws < 20 else " "*ws
+    ws = get_ws(tup[1])
     # Get the text of the token from str_list if there's a 3rd element,
     # otherwise get it from the table TOK.str.
-    text = str_list[tup[2]] if len(tup) >= 3 else TOK.str[kind]
+    text = get_text(tup, str_list)
+    if interned:
+      tid = text_id(text)
+      text = strings[tid] # Use the shared string object.
     # Create the token.
     token = Token(kind, ws, text)
+    if interned:
+      token.text_id = tid
     token.linnum = line_num
     token.prev = prev # Link to the previous token.
     prev.next = token # Link to this token from the previous one.
     prev = token
     result[i] = token
-    token.value = parse_funcs[kind](token, (tup, str_list))
+    if not values:
+      token.value = None
     i += 1
   return result
 
+def iter_tokens(token_list, tuples=False, kinds=None):
+  """ Yields the tokens of a token list one at a time,
+    without linking them or building a list.
+    Yields (kind, ws, text) tuples instead of Tokens if tuples is True.
+    Only tokens with a kind in kinds are yielded, if given. """
+  str_list = token_list[0] # The first element must be the string list.
+  line_num = 1
+  for tup in token_list[1]:
+    kind = tup[0]
+    if kind == TOK.Newline:
+      line_num += 1
+    if kinds != None and kind not in kinds:
+      continue
+    ws = get_ws(tup[1])
+    text = get_text(tup, str_list)
+    if tuples:
+      yield (kind, ws, text)
+    else:
+      token = Token(kind, ws, text)
+      token.linnum = line_num
+      yield token
+
+def token_index_func(tokens):
+  """ Returns a function that maps the tokens of a token list
+    (a list of Tokens or a TokenArray) to their indices. """
+  if isinstance(tokens, TokenArray):
+    return lambda t: t.index
+  index_map = dict((id(t), i) for i, t in enumerate(tokens))
+  return lambda t: index_map[id(t)]
+
+
+class TokenView(object):
+  """ A lightweight facade that implements the Token API
+    on top of an index into a TokenArray. """
+  __slots__ = ("array", "index")
+  def __init__(self, array, index):
+    self.array = array
+    self.index = index
+
+  kind = property(lambda self: self.array.kinds[self.index])
+  ws = property(lambda self: self.array.ws_list[self.array.ws_idx[self.index]])
+  text = property(lambda self: self.array.text(self.index))
+  linnum = property(lambda self: self.array.linnums[self.index])
+  text_id = property(lambda self: self.array.text_id(self.index))
+
+  @property
+  def is_ws(self):
+    return 2 <= self.array.kinds[self.index] <= 7
+
+  @property
+  def value(self):
+    return self.array.value(self.index)
+
+  @property
+  def next(self):
+    i = self.index + 1
+    return TokenView(self.array, i) if i < len(self.array) else None
+
+  @property
+  def prev(self):
+    i = self.index
+    return TokenView(self.array, i - 1) if i else None
+
+  def __eq__(self, other):
+    return isinstance(other, TokenView) and \
+      self.index == other.index and self.array is other.array
+  def __ne__(self, other):
+    return not self.__eq__(other)
+  def __hash__(self):
+    return hash((id(self.array), self.index))
+
+  def __unicode__(self):
+    return self.text
+  __str__ = __unicode__
+
+  def __repr__(self):
+    return "TokenView(%d, %s)" % (self.index, TOK.str[self.kind])
+
+class TokenArray(object):
+  """ Stores the tokens of a module in parallel array columns,
+    instead of creating one Token object per lexeme.
+  kinds = The kinds of the tokens.
+  linnums = The line numbers of the tokens.
+  ws_idx = Indices into ws_list (the distinct whitespace strings.)
+  text_idx = Indices into str_list. -1 means the text is TOK.str[kind].
+  values = Cache of the decoded values by token index.
+  """
+  decode_values = True
+
+  def __init__(self, str_list=()):
+    self.kinds = array(b'H')
+    self.linnums = array(b'I')
+    self.ws_idx = array(b'I')
+    self.text_idx = array(b'i')
+    self.str_list = list(str_list)
+    self.ws_list = [] # The distinct whitespace strings.
+    self.ws_dict = {} # Maps whitespace strings to indices in ws_list.
+    self.values = {}
+
+  @classmethod
+  def from_token_list(cls, token_list):
+    """ Fills the columns from a token list of a d_*.py module. """
+    str_list = token_list[0] # The first element must be the string list.
+    self = cls(str_list)
+    kinds, linnums, ws_idx, text_idx = \
+      self.kinds, self.linnums, self.ws_idx, self.text_idx
+    ws_cache = {} # Maps the 2nd tuple elements to indices in ws_list.
+    line_num = 1
+    for tup in token_list[1]:
+      kind = tup[0]
+      if kind == TOK.Newline:
+        line_num += 1
+      ws = tup[1]
+      i = ws_cache.get(ws)
+      if i == None:
+        i = ws_cache[ws] = self.add_ws(get_ws(ws))
+      if len(tup) < 3:
+        t = -1
+      elif type(tup[2]) == int:
+        t = tup[2]
+      else: # Append literal texts to the string list.
+        t = len(self.str_list)
+        self.str_list.append(get_text(tup, str_list))
+      kinds.append(kind)
+      linnums.append(line_num)
+      ws_idx.append(i)
+      text_idx.append(t)
+    return self
+
+  @classmethod
+  def from_tokens(cls, tokens):
+    """ Fills the columns from a sequence of Token objects. """
+    self = cls()
+    str_dict = {} # Maps texts to indices in str_list.
+    for token in tokens:
+      kind, text = token.kind, token.text
+      if text == TOK.str[kind]:
+        t = -1
+      else:
+        t = str_dict.get(text)
+        if t == None:
+          t = str_dict[text] = len(self.str_list)
+          self.str_list.append(text)
+      self.kinds.append(kind)
+      self.linnums.append(token.linnum)
+      self.ws_idx.append(self.add_ws(token.ws))
+      self.text_idx.append(t)
+    return self
+
+  def to_list(self):
+    """ Creates a doubly-linked list of Token objects from the columns. """
+    prev = Token(TOK.HEAD, "", "")
+    result = [None]*len(self) # Reserve space.
+    interned = self.is_interned
+    for i in xrange(len(self)):
+      token = Token(self.kinds[i], self.ws_list[self.ws_idx[i]], self.text(i))
+      token.linnum = self.linnums[i]
+      if interned:
+        token.text_id = self.text_id(i)
+      if not self.decode_values:
+        token.value = None
+      token.prev = prev
+      prev.next = token
+      prev = result[i] = token
+    return result
+
+  def add_ws(self, ws):
+    """ Returns the index of a whitespace string in ws_list. """
+    i = self.ws_dict.get(ws)
+    if i == None:
+      i = self.ws_dict[ws] = len(self.ws_list)
+      self.ws_list.append(ws)
+    return i
+
+  def text(self, i):
+    """ Returns the text of the i-th token. """
+    t = self.text_idx[i]
+    return self.str_list[t] if t >= 0 else TOK.str[self.kinds[i]]
+
+  @property
+  def is_interned(self):
+    return self.str_list is string_table.strings
+
+  def intern(self):
+    """ Moves the texts to the shared string_table.
+      text_idx then holds the IDs of the texts in string_table. """
+    if self.is_interned:
+      return self
+    ids = [string_table.id(s) for s in self.str_list]
+    self.text_idx = array(b'i', [ids[t] if t >= 0 else -1
+                                 for t in self.text_idx])
+    self.str_list = string_table.strings
+    return self
+
+  def local_copy(self):
+    """ Returns a copy whose str_list contains only the texts
+      used by its own tokens, e.g. to pack an interned array. """
+    copy = TokenArray()
+    copy.kinds, copy.linnums, copy.ws_idx = \
+      array(b'H', self.kinds), array(b'I', self.linnums), \
+      array(b'I', self.ws_idx)
+    copy.ws_list, copy.ws_dict = list(self.ws_list), dict(self.ws_dict)
+    copy.decode_values = self.decode_values
+    local = {} # Maps indices in self.str_list to indices in copy.str_list.
+    text_idx = copy.text_idx
+    for t in self.text_idx:
+      if t >= 0:
+        i = local.get(t)
+        if i == None:
+          i = local[t] = len(copy.str_list)
+          copy.str_list.append(self.str_list[t])
+        t = i
+      text_idx.append(t)
+    return copy
+
+  def text_id(self, i):
+    """ Returns the ID of the i-th token's text in string_table. """
+    t = self.text_idx[i]
+    if t < 0 or not self.is_interned:
+      return string_table.id(self.text(i))
+    return t
+
+  def value(self, i):
+    """ Returns the decoded value of the i-th token. """
+    if not self.decode_values:
+      return None
+    try:
+      return self.values[i]
+    except KeyError:
+      value = self.values[i] = \
+        parse_funcs[self.kinds[i]](TokenView(self, i), None)
+      return value
+
+  def __len__(self):
+    return len(self.kinds)
+
+  def __getitem__(self, i):
+    """ Creates token views on demand. """
+    if isinstance(i, slice):
+      return [TokenView(self, j) for j in xrange(*i.indices(len(self)))]
+    if i < 0:
+      i += len(self)
+    if not 0 <= i < len(self):
+      raise IndexError("token index out of range")
+    return TokenView(self, i)
+
+  def __iter__(self):
+    for i in xrange(len(self)):
+      yield TokenView(self, i)
+
 
 escape_table = {
   "'":39,'"':34,'?':63,'\\':92,'a':7,'b':8,'f':12,'n':10,'r':13,'t':9,'v':11
@@ -69,16 +395,66 @@ rx_newline = re.compile("\r\n?|\n|\u2028|\u2029")
 rx_escape = re.compile(
   r"\\(?:u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|[0-7]{1,3}|&\w+;|.)"
 )
+rx_entity = re.compile(r"&(\w+);")
+# Named HTML entities (\&name;) are looked up in this table.
+entity_table = name2codepoint
+hex_escape_len = {'x':2, 'u':4, 'U':8} # The number of hex digits.
+octal_digits = "01234567"
+hex_digits = "0123456789abcdefABCDEF"
+
+def codepoint2char(c):
+  """ Like unichr(), but also works for c > 0xFFFF on narrow builds. """
+  try:
+    return unichr(c)
+  except ValueError:
+    if c > 0x10FFFF:
+      return "\uFFFD"
+    return ("\\U%08x" % c).decode("unicode-escape")
+
+def decode_escape(s, i):
+  """ Decodes the escape sequence that starts at s[i] (a backslash.)
+    Returns the character and the index after the sequence. """
+  c = s[i+1:i+2]
+  if c in hex_escape_len:
+    end = i + 2 + hex_escape_len[c]
+    digits = s[i+2:end]
+    if len(digits) == end - i - 2 and not digits.strip(hex_digits):
+      return codepoint2char(int(digits, 16)), end
+    return "\uFFFD", i + 2
+  if c and c in octal_digits:
+    end = i + 2
+    while end < i + 4 and end < len(s) and s[end] in octal_digits:
+      end += 1
+    return unichr(int(s[i+1:end], 8)), end
+  if c == '&':
+    m = rx_entity.match(s, i + 1)
+    if m:
+      return codepoint2char(entity_table.get(m.group(1), 0xFFFD)), m.end()
+    return "\uFFFD", i + 2
+  if c == "" or c == "\n": # Not an escape sequence.
+    return "\\", i + 1
+  return unichr(escape_table.get(c, 0xFFFD)), i + 2
+
+def decode_escapes(s):
+  """ Replaces the escape sequences in s in a single pass.
+    Strings without a backslash are returned as they are. """
+  i = s.find("\\")
+  if i == -1:
+    return s
+  result = []
+  append = result.append
+  start = 0
+  while i != -1:
+    append(s[start:i])
+    c, start = decode_escape(s, i)
+    append(c)
+    i = s.find("\\", start)
+  append(s[start:])
+  return "".join(result)
 
 def escape2char(s):
   """ E.g. "\\u0041" -> 'A' """
-  from htmlentitydefs import name2codepoint
-  c = s[1]
-  if c in 'xuU':    c = int(s[2:], 16)
-  elif c.isdigit(): c = int(s[1:], 8)
-  elif c == '&':    c = name2codepoint.get(s[2:-1], 0xFFFD)
-  else:             c = escape_table.get(c, 0xFFFD)
-  return unichr(c)
+  return decode_escape(s, 0)[0]
 
 def parse_str(t, more):
   s = t.text.rstrip("cwd") # Strip suffix.
@@ -88,9 +464,9 @@ def parse_str(t, more):
   elif c == '`': # Raw string.
     s = s[1:-1]
   elif c == '\\': # Escape string.
-    return rx_escape.sub(lambda m: escape2char(m.group()), s) + "\0"
+    return decode_escapes(s) + "\0"
   elif c == '"': # Normal string with escape sequences.
-    s = rx_escape.sub(lambda m: escape2char(m.group()), s[1:-1])
+    s = decode_escapes(s[1:-1])
   elif c == 'q': # Delimited or token string.
     if s[1] == '"': # Delimited string.
       if s[2] in "[({<":
@@ -139,13 +515,140 @@ def parse_int(t, more):
   return int(s.rstrip("uUL"), base)
 
 def parse_float(t, more):
-  # TODO: use mpmath for multiprecission floats. Python has no long doubles.
-  # (http://code.google.com/p/mpmath/)
+  # NB: Python has no long doubles. See exact_real() for Float80 literals.
   s = t.text.replace("_", "") # Strip underscore separators.
   imag_or_real = 1j if s[-1] == 'i' else 1.
   float_ = float.fromhex if s[1:2] in 'xX' else float
   return float_(s.rstrip("fFLi")) * imag_or_real
 
+# Set to True to decode Float80 and Imaginary80 literals exactly,
+# as Fraction objects instead of (rounded) Python floats.
+exact_reals = False
+# Maps literal texts to their exact values.
+exact_real_cache = {}
+
+class ExactComplex(object):
+  """ A complex number with exact (Fraction) parts, e.g. the value
+    of the imaginary literal 1.5Li. Arithmetic with integers and Fractions
+    stays exact; with floats and complex numbers it falls back to complex.
+  """
+  __slots__ = ('real', 'imag')
+
+  def __init__(self, real=0, imag=0):
+    self.real, self.imag = Fraction(real), Fraction(imag)
+
+  def __repr__(self):
+    return "ExactComplex(%r, %r)" % (self.real, self.imag)
+
+  def __complex__(self):
+    return complex(float(self.real), float(self.imag))
+
+  def __nonzero__(self):
+    return bool(self.real or self.imag)
+
+  def __hash__(self):
+    return hash(self.real) if not self.imag else hash((self.real, self.imag))
+
+  def conjugate(self):
+    return ExactComplex(self.real, -self.imag)
+
+  @staticmethod
+  def _exact(x):
+    """ Returns x as an ExactComplex, or None if x isn't exact. """
+    if isinstance(x, ExactComplex):
+      return x
+    if isinstance(x, (int, long, Fraction)):
+      return ExactComplex(x)
+    return None
+
+  def __eq__(self, other):
+    o = self._exact(other)
+    if o == None:
+      return complex(self) == other
+    return self.real == o.real and self.imag == o.imag
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __lt__(self, other):
+    raise TypeError("no ordering relation is defined for complex numbers")
+  __le__ = __gt__ = __ge__ = __lt__
+
+  def __neg__(self):
+    return ExactComplex(-self.real, -self.imag)
+
+  def __pos__(self):
+    return self
+
+  def __abs__(self):
+    return abs(complex(self))
+
+  def __add__(self, other):
+    o = self._exact(other)
+    if o == None:
+      return complex(self) + other
+    return ExactComplex(self.real + o.real, self.imag + o.imag)
+  __radd__ = __add__
+
+  def __sub__(self, other):
+    return self + -other
+
+  def __rsub__(self, other):
+    return -self + other
+
+  def __mul__(self, other):
+    o = self._exact(other)
+    if o == None:
+      return complex(self) * other
+    return ExactComplex(self.real * o.real - self.imag * o.imag,
+                        self.real * o.imag + self.imag * o.real)
+  __rmul__ = __mul__
+
+  def __div__(self, other):
+    o = self._exact(other)
+    if o == None:
+      return complex(self) / other
+    d = o.real * o.real + o.imag * o.imag
+    return ExactComplex((self.real * o.real + self.imag * o.imag) / d,
+                        (self.imag * o.real - self.real * o.imag) / d)
+  __truediv__ = __div__
+
+  def __rdiv__(self, other):
+    o = self._exact(other)
+    if o == None:
+      return other / complex(self)
+    return o / self
+  __rtruediv__ = __rdiv__
+
+def exact_real(text):
+  """ Returns the exact value of a float literal as a Fraction,
+    or an ExactComplex if it ends with 'i'. The result is
+    computed once per distinct literal text. """
+  value = exact_real_cache.get(text)
+  if value != None:
+    return value
+  s = text.replace("_", "")
+  imaginary = s[-1] == 'i'
+  s = s.rstrip("fFLi")
+  if s[1:2] in ('x', 'X'): # E.g.: 0x1.8p-3
+    mantissa, _, exp = s[2:].lower().partition('p')
+    int_part, _, frac_part = mantissa.partition('.')
+    value = Fraction(int(int_part + frac_part or "0", 16), 16**len(frac_part))
+    exp = int(exp or 0)
+    value = value * 2**exp if exp >= 0 else value / 2**-exp
+  else:
+    value = Fraction(s)
+  if imaginary:
+    value = ExactComplex(0, value)
+  exact_real_cache[text] = value
+  return value
+
+def parse_real(t, more):
+  """ Parses a Float80 or Imaginary80 literal. """
+  if exact_reals:
+    return exact_real(t.text)
+  return parse_float(t, more)
+
 def get_time(t, more):
   return 0 # TODO:
 def get_timestamp(t, more):
@@ -171,9 +674,9 @@ def get_parse_funcs():
       (TOK.VENDOR, get_vendor),(TOK.VERSION, get_version),
       (TOK.Int32, parse_int),(TOK.Int64, parse_int),(TOK.Uint32, parse_int),
       (TOK.Uint64, parse_int),(TOK.Float32, parse_float),
-      (TOK.Float64, parse_float),(TOK.Float80, parse_float),
+      (TOK.Float64, parse_float),(TOK.Float80, parse_real),
       (TOK.Imaginary32, parse_float),(TOK.Imaginary64, parse_float),
-      (TOK.Imaginary80, parse_float)
+      (TOK.Imaginary80, parse_real)
     ):
     func_list[kind] = func
   return tuple(func_list)
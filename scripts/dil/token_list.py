@@ -22,6 +22,7 @@ class TOK:
   Version,Volatile,While,With,Char,Wchar,Dchar,Bool,Byte,Ubyte,Short,Ushort,\
   Int,Uint,Long,Ulong,Cent,Ucent,Float,Double,Real,Ifloat,Idouble,Ireal,\
   Cfloat,Cdouble,Creal,Void,HEAD,EOF = range(0,194)
+  MAX = 194
   str = (
     'Invalid','Illegal','Comment','#! /shebang/','#line','"filespec"','\n',
     'Empty','Identifier','String','CharLiteral','__FILE__','__LINE__',
@@ -1,13 +1,59 @@
 # -*- coding: utf-8 -*-
 # Author: Aziz Köksal
+from dil.nodes import Node, NodeClasses
+
+def iter_subnodes(node):
+  """ Yields the direct sub-nodes of a node, looking into tuples. """
+  for value in node.m:
+    if isinstance(value, Node):
+      yield value
+    elif isinstance(value, tuple):
+      stack = [iter(value)]
+      while stack:
+        for v in stack[-1]:
+          if isinstance(v, Node):
+            yield v
+          elif isinstance(v, tuple):
+            stack.append(iter(v))
+            break
+        else:
+          stack.pop()
+
+class VisitorMeta(type):
+  """ Builds the dispatch tables of a NodeVisitor subclass
+    once, when the class is created. """
+  def __init__(cls, name, bases, dict_):
+    type.__init__(cls, name, bases, dict_)
+    def method(name):
+      m = getattr(cls, name, None)
+      return getattr(m, "im_func", m) # Unbound method -> function.
+    # The visit_* methods by node kind, or None if not defined.
+    cls.methods = tuple([method("visit_" + n.__name__) for n in NodeClasses])
+    default_visit = method("default_visit")
+    cls.dispatch = tuple([m or default_visit for m in cls.methods])
+
+class NodeVisitor(object):
+  """ Calls the method visit_<ClassName>() for a node
+    (e.g. visit_FunctionDeclaration), or default_visit() if there is none. """
+  __metaclass__ = VisitorMeta
 
-class NodeVisitor:
   def visit(self, node):
     """ Calls a visit method for this node. """
-    method = getattr(self, node.__class__.visit_name, self.default_visit)
-    return method(node)
+    return self.dispatch[node.kind](self, node)
 
   def default_visit(self, node):
     """ Calls visit() on the subnodes of this node. """
-    for n in node:
+    for n in iter_subnodes(node):
       self.visit(n)
+
+  def traverse(self, node):
+    """ Visits a tree in pre-order without recursion, so that deep trees
+      don't exceed the recursion limit. The visit methods must not call
+      visit() on the subnodes; returning False skips them. """
+    methods = self.methods
+    stack = [node]
+    while stack:
+      node = stack.pop()
+      method = methods[node.kind]
+      if method == None or method(self, node) != False:
+        stack.extend(reversed(list(iter_subnodes(node))))
@@ -63,22 +63,12 @@ Title=%(title)s
   hpp_file.close()
 
   # Extract symbols and build the package tree.
-  package_tree = PackageTree()
-  cat_dict_all = {} # Group symbols by their kind, e.g. class, struct etc.
-  for html_file in module_files:
-    # Get module FQN.
-    module_fqn = Path(html_file).namebase.uni
-    # Load the module from a JSON file.
-    m = ModuleJSON(jsons, module_fqn)
-    package_tree.addModule(m)
-    # Group the symbols in this module.
-    for kind, symbol_list in m.cat_dict.iteritems():
-      cat_dict_all.setdefault(kind, []).extend(symbol_list)
-
-  # Sort the list of packages and modules.
-  package_tree.sortTree()
-  # Sort the list of symbols.
-  map(list.sort, cat_dict_all.itervalues())
+  # Pack the symbols of all modules into one index file.
+  module_fqns = [Path(html_file).namebase.uni for html_file in module_files]
+  symbol_index = SymbolIndex.build(jsons, module_fqns, tmp/"symbols.idx")
+  # Each module's symbols are loaded when its TOC entry is written.
+  package_tree = PackageTree.from_modules(
+    symbol_index.module(module_fqn) for module_fqn in module_fqns)
 
   # CHM files don't support UTF-8. Therefore Unicode characters
   # are encoded with numerical HTML entities.
@@ -130,6 +120,7 @@ Title=%(title)s
     for m in pckg.modules:
       write("<li>" + objtag(('name',m.name), ('link',m.fqn+".html")))
       write_symbol_tree(m.symbolTree)
+      m.unload() # Free the symbols again.
       write("</li>\n")
     write("</ul>\n")
 
@@ -154,6 +145,8 @@ Title=%(title)s
   write(doc_end)
   f.close()
 
+  symbol_index.close()
+
   # Finally write the CHM file.
   print("Writing CHM file to '%s'." % dest)
   call_hhc(win_path(hhp))
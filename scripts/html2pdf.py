@@ -18,14 +18,36 @@ def write_bookmarks(write, package_tree, all_symbols, index):
 
   def li(link, label): return '<li link="%s" label="%s">' % (link, label)
 
-  def write_symbol_tree(symbol):
+  def write_symbol_tree(symbol, write=write):
     write('<ul>\n')
     for s in symbol.sub:
       write(li(s.link, s.name))
-      if len(s.sub): write_symbol_tree(s)
+      if len(s.sub): write_symbol_tree(s, write)
       write('</li>\n')
     write('</ul>\n')
 
+  # The symbols in all_symbols may have no members (see IndexedModule),
+  # so their member trees are kept while their module is loaded.
+  member_trees = dict(((s.modfqn, s.fqn), None) for s in all_symbols)
+  symbol_trees = {} # The symbol tree of each module by FQN.
+
+  def module_symbol_tree(m):
+    """ Returns the symbol tree of a module. Loads the module only once
+      and frees its symbols again. """
+    tree = symbol_trees.get(m.fqn)
+    if tree == None:
+      tree = []
+      write_symbol_tree(m.symbolTree, tree.append)
+      symbol_trees[m.fqn] = tree = "".join(tree)
+      for fqn, s in m.sym_dict.iteritems():
+        if (m.fqn, fqn) in member_trees:
+          members = []
+          write_symbol_tree(s, members.append)
+          member_trees[(m.fqn, fqn)] = "".join(members)
+      if isinstance(m, IndexedModule):
+        m.unload()
+    return tree
+
   def write_module_tree(pckg):
     write('<ul>\n')
     for p in pckg.packages:
@@ -35,7 +57,7 @@ def write_bookmarks(write, package_tree, all_symbols, index):
       write('</li>\n')
     for m in pckg.modules:
       write(li(m.link, m.name))
-      write_symbol_tree(m.symbolTree)
+      write(module_symbol_tree(m))
       write('</li>\n')
     write('</ul>\n')
 
@@ -48,7 +70,7 @@ def write_bookmarks(write, package_tree, all_symbols, index):
   write('<li link="#module-pages" label="Module List"><ul>')
   for m in package_tree.modules:
     write(li(m.link, m.name))
-    write_symbol_tree(m.symbolTree)
+    write(module_symbol_tree(m))
     write('</li>\n')
   write('</ul></li>') # Close Module List.
 
@@ -65,7 +87,7 @@ def write_bookmarks(write, package_tree, all_symbols, index):
       write('<li link="#index-syms-%s" label="(%s)"></li>' %
             ((current_letter,)*2))
     write(li(s.link, s.name))
-    write_symbol_tree(s)
+    write(member_trees[(s.modfqn, s.fqn)] or '<ul>\n</ul>\n')
     write('</li>')
   write('</ul>')
   write('</li>') # Close Symbols li.
@@ -160,8 +182,8 @@ def generate_pdf(module_files, dest, tmp, params, jsons):
               if module:
                 href = module.link
                 if sym_name:
-                  symbol = module.sym_dict.get(sym_name)
-                  if symbol: href = symbol.link
+                  if module.hasSymbol(sym_name):
+                    href = module.symbolLink(sym_name)
                   else: href += sym_name # Link to anchor in another module.
           if not m: # Other URLs.
             href = sym_url.format(href)
@@ -188,16 +210,16 @@ def generate_pdf(module_files, dest, tmp, params, jsons):
   # ---------------------------
   print("Preparing HTML fragments.")
   # For Table of Contents, bookmarks and indices.
-  package_tree = PackageTree()
-  # First load all modules and symbols.
-  for html_file in module_files:
-    # Get module FQN from the file name.
-    module_fqn = Path(html_file).namebase.uni
-    # Load the module from a JSON file.
-    m = ModuleJSON(jsons, module_fqn)
-    package_tree.addModule(m) # Add the new module to the tree.
+  # Pack the symbols of all modules into one index file.
+  module_fqns = [Path(html_file).namebase.uni for html_file in module_files]
+  symbol_index = SymbolIndex.build(jsons, module_fqns, tmp/"symbols.idx")
+  # First build the sorted tree of all modules.
+  # Their symbols are loaded when accessed.
+  package_tree = PackageTree.from_modules(
+    symbol_index.module(module_fqn) for module_fqn in module_fqns)
 
   # Then patch the HTML files.
+  html_texts = {} # The HTML content of each module by FQN.
   for html_file in module_files:
     html_txt = html_file.open().read()
     module_fqn = Path(html_file).namebase.uni
@@ -208,12 +230,7 @@ def generate_pdf(module_files, dest, tmp, params, jsons):
     end = html_txt.rfind('<div id="kandil-footer">')
     content = html_txt[start:end]
 
-    m = package_tree.mod_dict[module_fqn]
-    m.html_txt = content # Define an extra property.
-
-  # Sort the list of packages and modules.
-  package_tree.sortTree()
-  package_tree.sortCatDict()
+    html_texts[module_fqn] = content
 
   # Join the HTML fragments.
   # ------------------------
@@ -309,7 +326,7 @@ def generate_pdf(module_files, dest, tmp, params, jsons):
       write('</div>')
       write_nested_fragments(p)
     for m in pckg.modules:
-      write(m.html_txt)
+      write(html_texts[m.fqn])
 
   if before_files:
     write('<div class="before_pages">')
@@ -322,7 +339,7 @@ def generate_pdf(module_files, dest, tmp, params, jsons):
     write_nested_fragments(package_tree.root)
   else:
     for m in package_tree.modules:
-      write(m.html_fragment)
+      write(html_texts[m.fqn])
   write('</div>\n')
 
   if after_files:
@@ -358,6 +375,7 @@ def generate_pdf(module_files, dest, tmp, params, jsons):
   write('</body></html>')
   html_doc.flush()
   html_doc.close()
+  symbol_index.close()
 
   # Finally write the PDF document.
   print("Writing PDF document to '%s'." % dest)
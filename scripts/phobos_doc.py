@@ -145,6 +145,10 @@ def main():
     help="create a PDF document")
   parser.add_option("--kandil", dest="use_kandil", action="store_true",
     default=False, help="use kandil as the documentation front-end")
+  parser.add_option("-j", "--jobs", dest="jobs", metavar="N", default=1,
+    type="int", help="run N dil processes in parallel (0 = one per CPU)")
+  parser.add_option("--incremental", dest="incremental", default=False,
+    action="store_true", help="only regenerate the docs of changed modules")
 
   (options, args) = parser.parse_args(sys.uargv[1:])
 
@@ -219,9 +223,18 @@ def main():
       TMP//("index.d", "phobos.ddoc", "missing.ddoc", "overrides.ddoc")
     doc_options = ['-v', '-i', '-hl']
 
-  dil_retcode = generate_docs(DIL.EXE, DEST, MODLIST, DOC_FILES,
-    versions, options=doc_options)
+  if options.jobs == 1 and not options.incremental:
+    dil_retcode = generate_docs(DIL.EXE, DEST, MODLIST, DOC_FILES,
+      versions, options=doc_options)
+  else:
+    # The manifest is kept next to DEST, so that it isn't archived.
+    manifest = (DEST.abspath + ".manifest.json") \
+      if options.incremental else None
+    dil_retcode = generate_docs_parallel(DIL.EXE, DEST, MODLIST, DOC_FILES,
+      versions, options=doc_options, jobs=options.jobs, manifest=manifest)[0]
 
+  if use_kandil:
+    generate_search_index(DEST, read_modules_list(MODLIST))
   modify_phobos_html(DEST/"phobos.html", D_VERSION)
   copy_files(DIL, PHOBOS_SRC, DEST, use_kandil)
   if options.pdf:
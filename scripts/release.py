@@ -30,11 +30,23 @@ def writeMakefile():
   pass
 
 def build_dil(COMPILER, *args, **kwargs):
+  """ Calls the compiler and returns its exit code.
+    The output is written to the file kwargs["log"] if given. """
+  log = kwargs.pop("log", None)
+  use_wine = kwargs.pop("use_wine", COMPILER.use_wine)
   kwargs.update(exe=COMPILER)
   cmd = COMPILER.cmd(*args, **kwargs)
-  cmd.use_wine = COMPILER.use_wine
+  cmd.use_wine = use_wine
   print(cmd)
-  cmd.call()
+  if log == None:
+    return cmd.call()
+  f = open(log, "w")
+  f.write("%s\n\n" % cmd)
+  f.flush()
+  try:
+    return cmd.call(stdout=f, stderr=subprocess.STDOUT)
+  finally:
+    f.close()
 
 def update_version(path, major, minor, suffix):
   """ Updates the version info in the compiler's source code. """
@@ -106,6 +118,8 @@ def main():
   add_option("--ldc", dest="ldc", help="use ldc instead of dmd")
   parser.add_option("--builddir", dest="builddir", metavar="DIR", default=None,
     help="where to build the release and archives (default is build/)")
+  parser.add_option("-j", "--jobs", dest="jobs", metavar="N", default=None,
+    type="int", help="run N compilers in parallel (default: one per CPU)")
   parser.add_option("--winpath", dest="winpath", metavar="P", default=None,
     help="permanently append P to PATH in the Windows (or wine's) registry. "
          "Exits the script.")
@@ -154,11 +168,15 @@ def main():
   TMP       = DEST/"tmp"
   # The list of module files (with info) that have been processed.
   MODLIST   = TMP/"modules.txt"
+  # The compiler output of each binary. (Not part of the release.)
+  LOGS      = BUILD_DIR/("dil.%s.logs" % VERSION)
   # The files to generate documentation for.
   FILES     = []
 
   # Create the build directory.
   BUILD_DIR.makedirs()
+  LOGS.rmtree()
+  LOGS.mkdir()
   # Check out a new working copy.
   DEST.rmtree() # First remove the tree.
   if options.src != None:
@@ -204,17 +222,6 @@ def main():
   if options.docs:
     build_dil_if_inexistant(DIL.EXE)
 
-    print("***** Generating documentation *****")
-    DOC_FILES = DEST.DATA//("macros_dil.ddoc", "dilconf.d") + FILES
-    versions = ["DDoc"]
-    generate_docs(DIL.EXE, DEST.DOC, MODLIST, DOC_FILES,
-                  versions, options=['-v', '-i', '-hl', '--kandil'])
-
-  if options.pdf:
-    write_PDF(DEST, DEST.DOC, VERSION, TMP)
-  #if options.chm:
-    #write_CHM(DEST, DEST.DOC, VERSION, TMP)
-
   COMPILER.use_wine = False
   use_wine = False
   if is_win32:
@@ -237,34 +244,53 @@ def main():
   if options.no_binaries:
     build_linux_binaries = build_windows_binaries = False
 
-  # Create partial functions with common parameters (aka. currying).
+  # The parameters of the binaries.
   # Note: the -inline switch makes the binaries significantly larger on Linux.
-  linker_args = [None]
-  build_dil_rls = func_partial(build_dil, COMPILER, FILES,
-    release=True, optimize=True, inline=True, lnk_args=linker_args)
-  build_dil_dbg = func_partial(build_dil, COMPILER, FILES,
-    debug_info=options.debug_symbols, lnk_args=linker_args)
-
+  release = dict(release=True, optimize=True, inline=True)
+  debug = dict(debug_info=options.debug_symbols)
+  targets = [] # (name, kwargs) tuples.
+  def add_targets(ext, linker_arg, use_wine):
+    for name, kwargs in (
+        ("dil_d", debug), ("dil2_d", dict(debug, versions=["D2"])),
+        ("dil", release), ("dil2", dict(release, versions=["D2"]))):
+      name += ext
+      # Every binary needs its own folder for the object files.
+      objdir = TMP/"obj"/name
+      if use_wine:
+        objdir = objdir.replace("/", "\\")
+      targets.append((name, dict(kwargs, lnk_args=[linker_arg],
+        use_wine=use_wine, objdir=objdir, log=LOGS/(name + ".log"))))
   if build_linux_binaries:
-    print("\n***** Building Linux binaries *****\n")
-    linker_args[0] = "-lmpfr"
-    # Linux Debug Binaries
-    build_dil_dbg(BIN/"dil_d")
-    build_dil_dbg(BIN/"dil2_d", versions=["D2"])
-    # Linux Release Binaries
-    build_dil_rls(BIN/"dil")
-    build_dil_rls(BIN/"dil2", versions=["D2"])
-
+    add_targets("", "-lmpfr", False)
   if build_windows_binaries:
-    print("\n***** Building Windows binaries *****\n")
-    COMPILER.use_wine = use_wine
-    linker_args[0] = "+mpfr.lib"
-    # Windows Debug Binaries
-    build_dil_dbg(BIN/"dil_d.exe")
-    build_dil_dbg(BIN/"dil2_d.exe", versions=["D2"])
-    # Windows Release Binaries
-    build_dil_rls(BIN/"dil.exe")
-    build_dil_rls(BIN/"dil2.exe", versions=["D2"])
+    add_targets(".exe", "+mpfr.lib", use_wine)
+
+  # Compile the binaries on a pool of threads, each waiting for a compiler
+  # process, while the documentation is generated in this thread.
+  from multiprocessing.pool import ThreadPool
+  pool = ThreadPool(options.jobs or None)
+  if targets:
+    print("\n***** Building binaries (logs in %s) *****\n" % LOGS)
+  results = [(name, pool.apply_async(build_dil,
+    (COMPILER, FILES, BIN/name), kwargs)) for name, kwargs in targets]
+  pool.close()
+
+  if options.docs:
+    print("***** Generating documentation *****")
+    DOC_FILES = DEST.DATA//("macros_dil.ddoc", "dilconf.d") + FILES
+    versions = ["DDoc"]
+    generate_docs(DIL.EXE, DEST.DOC, MODLIST, DOC_FILES,
+                  versions, options=['-v', '-i', '-hl', '--kandil'])
+
+  if options.pdf:
+    write_PDF(DEST, DEST.DOC, VERSION, TMP)
+  #if options.chm:
+    #write_CHM(DEST, DEST.DOC, VERSION, TMP)
+
+  pool.join()
+  failed = [name for name, result in results if result.get() != 0]
+  for name in failed:
+    print("Error: building %s failed; see %s" % (name, LOGS/(name + ".log")))
 
   options.docs or DEST.DOC.rmtree()
   TMP.rmtree()
@@ -0,0 +1,296 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+from symbols import sym_kinds
+from path import Path
+from bisect import bisect_left
+import json, re
+
+def levenshtein(a, b, limit=None):
+  """ Returns the edit distance of two strings.
+    Stops early and returns limit+1 if the distance exceeds limit. """
+  if len(a) < len(b):
+    a, b = b, a
+  if limit != None and len(a) - len(b) > limit:
+    return limit + 1
+  row = range(len(b) + 1)
+  for i, ca in enumerate(a, 1):
+    prev, row = row, [i]
+    for j, cb in enumerate(b, 1):
+      row.append(min(prev[j] + 1, row[j-1] + 1, prev[j-1] + (ca != cb)))
+    if limit != None and min(row) > limit:
+      return limit + 1
+  return row[-1]
+
+def ngrams(text, n):
+  """ Returns the set of substrings of length n of a text. """
+  return set(text[i:i+n] for i in xrange(len(text) - n + 1))
+
+def padded_ngrams(text, n):
+  """ Returns the n-grams of a text with n-1 "^" and "$" characters
+    at its start and end. Short texts get n-grams as well, and
+    the n-grams of the text itself are a subset of them. """
+  return ngrams("^" * (n-1) + text + "$" * (n-1), n)
+
+def shard_id(key):
+  """ Returns the name of the shard of a lower-case name or n-gram,
+    which is the hex code of its first character (ignoring "^".) """
+  key = key.lstrip("^")
+  return "%x" % ord(key[0]) if key else "0"
+
+def delta_encode(numbers):
+  """ Encodes a sorted list of integers as differences. """
+  return [b - a for a, b in zip([0] + numbers, numbers)]
+
+def delta_decode(deltas):
+  numbers, n = [], 0
+  for d in deltas:
+    n += d
+    numbers.append(n)
+  return numbers
+
+class SearchIndex(object):
+  """ An index of the packages, modules and symbols of a documentation build.
+    The entries are sorted by their lower-case names, so that prefixes
+    are found with binary searches. An n-gram index maps each n-character
+    substring of the padded names (see padded_ngrams()) to the entries
+    that contain it, and narrows down the candidates of substring and
+    fuzzy searches.
+  entries = A list of (name, fqn, kind, module_fqn) tuples. The fqn of
+    a symbol is relative to its module, like in Symbol.fqn.
+  keys = The lower-case names of the entries.
+  grams = Maps n-grams to the sorted indices of the entries containing them.
+  """
+  version = 1
+  ngram_size = 3
+
+  def __init__(self, entries=()):
+    self.entries = sorted(entries, key=lambda e: (e[0].lower(), e[3], e[1]))
+    self.keys = [e[0].lower() for e in self.entries]
+    self.grams = {}
+    n = self.ngram_size
+    for i, key in enumerate(self.keys):
+      for gram in padded_ngrams(key, n):
+        self.grams.setdefault(gram, []).append(i)
+    self.fqn_dict = None
+
+  @classmethod
+  def from_tree(cls, package_tree):
+    """ Builds the index from the sym_dicts of the modules
+      of a symbols.PackageTree. """
+    entries = []
+    for fqn, package in package_tree.packages.iteritems():
+      if fqn:
+        entries.append((package.name, fqn, "package", fqn))
+    for module in package_tree.modules:
+      entries.append((module.name, module.fqn, "module", module.fqn))
+      for fqn, symbol in module.sym_dict.iteritems():
+        if fqn: # Skip the module's root symbol.
+          name = symbol.name.partition(":")[0] # Strip the ":N" suffix.
+          entries.append((name, fqn, symbol.kind, module.fqn))
+    return cls(entries)
+
+  def __len__(self):
+    return len(self.entries)
+
+  def lookup(self, module_fqn, fqn=None):
+    """ Returns the entry of a module or package,
+      or of the symbol fqn in module_fqn, or None. """
+    if self.fqn_dict == None:
+      self.fqn_dict = dict(((e[3], e[1]), e) for e in self.entries)
+    return self.fqn_dict.get((module_fqn, fqn or module_fqn))
+
+  def prefix(self, text):
+    """ Returns the entries whose names start with text. """
+    text = text.lower()
+    keys = self.keys
+    i = j = bisect_left(keys, text)
+    while j < len(keys) and keys[j].startswith(text):
+      j += 1
+    return self.entries[i:j]
+
+  def candidates(self, text):
+    """ Returns the indices of the entries which contain
+      all n-grams of text, or None if text is too short. """
+    grams = ngrams(text, self.ngram_size)
+    if not grams:
+      return None
+    lists = sorted((self.grams.get(g, []) for g in grams), key=len)
+    result = set(lists[0])
+    for l in lists[1:]:
+      if not result:
+        break
+      result.intersection_update(l)
+    return sorted(result)
+
+  def contains(self, text):
+    """ Returns the entries whose names contain text. """
+    text = text.lower()
+    keys = self.keys
+    indices = self.candidates(text)
+    if indices == None:
+      indices = xrange(len(keys))
+    return [self.entries[i] for i in indices if text in keys[i]]
+
+  def fuzzy(self, text, max_distance=1):
+    """ Returns the entries whose names are at most max_distance
+      edits away from text, ordered by their distance. """
+    text = text.lower()
+    keys, n = self.keys, self.ngram_size
+    grams = padded_ngrams(text, n)
+    # An edit removes at most n of the n-grams of a text.
+    min_shared = len(grams) - max_distance * n
+    if min_shared > 0:
+      shared = {}
+      for gram in grams:
+        for i in self.grams.get(gram, ()):
+          shared[i] = shared.get(i, 0) + 1
+      indices = sorted(i for i, c in shared.iteritems() if c >= min_shared)
+    else:
+      indices = xrange(len(keys))
+    matches = []
+    for i in indices:
+      d = levenshtein(text, keys[i], max_distance)
+      if d <= max_distance:
+        matches.append((d, i))
+    matches.sort()
+    return [self.entries[i] for d, i in matches]
+
+  def search(self, term):
+    """ Interprets a term like kandil's quick search does:
+      "name.." is a fuzzy search with one edit per dot (two at least),
+      "a.b" and "a." match the FQNs, "*" and "?" are wildcards,
+      and anything else matches a part of the names. """
+    m = re.match(r"(.+?)(\.\.+)$", term)
+    if m:
+      return self.fuzzy(m.group(1), len(m.group(2)))
+    if "." in term or "*" in term or "?" in term:
+      rx = re.escape(term).replace(r"\?", ".").replace(r"\*", ".*?")
+      rx = re.compile(rx, re.I)
+      if "." in term:
+        return [e for e in self.entries if rx.search(e[1])]
+      return [e for e in self.entries if rx.search(e[0])]
+    return self.contains(term)
+
+  def to_json(self):
+    """ Returns the index as a compact JSON object. The entries are stored
+      as [name, fqn, kind ID, module index] and the n-gram lists as the
+      differences between consecutive indices. """
+    modules = sorted(set(e[3] for e in self.entries))
+    mod_index = dict((fqn, i) for i, fqn in enumerate(modules))
+    kind_ids = dict((kind, i) for i, kind in enumerate(sym_kinds))
+    return {
+      "version": self.version,
+      "ngram_size": self.ngram_size,
+      "modules": modules,
+      "entries": [[name, fqn, kind_ids[kind], mod_index[modfqn]]
+                  for name, fqn, kind, modfqn in self.entries],
+      "grams": dict((g, delta_encode(l)) for g, l in self.grams.iteritems()),
+    }
+
+  @classmethod
+  def from_json(cls, obj):
+    if obj.get("version") != cls.version:
+      raise Exception("unsupported search index version: %s" %
+                      obj.get("version"))
+    modules = obj["modules"]
+    index = cls.__new__(cls)
+    # The entries were stored in sorted order.
+    index.entries = [(name, fqn, sym_kinds[kind], modules[mod])
+                     for name, fqn, kind, mod in obj["entries"]]
+    index.keys = [e[0].lower() for e in index.entries]
+    index.ngram_size = obj["ngram_size"]
+    index.grams = dict((g, delta_decode(l))
+                       for g, l in obj["grams"].iteritems())
+    index.fqn_dict = None
+    return index
+
+  def save(self, path):
+    f = open(path, "w")
+    json.dump(self.to_json(), f, separators=(',', ':'))
+    f.close()
+
+  @classmethod
+  def load(cls, path):
+    return cls.from_json(json.load(open(path)))
+
+  def save_shards(self, dest):
+    """ Writes the index into the folder dest, split by the first character
+      of the names and n-grams, so that kandil loads only the shards
+      a search needs. index.json maps the shard names to the [start, count]
+      of their entries and lists the n-gram shards. s_<shard>.json holds
+      the entries and g_<shard>.json the n-gram lists. """
+    obj = self.to_json()
+    entries, grams = obj.pop("entries"), obj.pop("grams")
+    dest = Path(dest)
+    if not dest.exists:
+      dest.makedirs()
+    def write(name, value):
+      f = open(dest/name, "w")
+      json.dump(value, f, separators=(',', ':'))
+      f.close()
+    # The entries are sorted, so each shard is a slice of them.
+    obj["shards"] = shards = {}
+    for i, key in enumerate(self.keys):
+      shard = shards.setdefault(shard_id(key), [i, 0])
+      shard[1] += 1
+    for shard, (start, count) in shards.iteritems():
+      write("s_%s.json" % shard, entries[start:start+count])
+    gram_shards = {}
+    for gram, l in grams.iteritems():
+      gram_shards.setdefault(shard_id(gram), {})[gram] = l
+    for shard, value in gram_shards.iteritems():
+      write("g_%s.json" % shard, value)
+    obj["gram_shards"] = sorted(gram_shards)
+    write("index.json", obj)
+
+  @classmethod
+  def load_shards(cls, folder):
+    """ Loads an index written by save_shards(). """
+    folder = Path(folder)
+    obj = json.load(open(folder/"index.json"))
+    obj["entries"], obj["grams"] = [], {}
+    for shard, (start, count) in sorted(obj["shards"].items(),
+                                        key=lambda x: x[1]):
+      obj["entries"] += json.load(open(folder/("s_%s.json" % shard)))
+    for shard in obj["gram_shards"]:
+      obj["grams"].update(json.load(open(folder/("g_%s.json" % shard))))
+    return cls.from_json(obj)
+
+def main():
+  from optparse import OptionParser
+  from symbols import ModuleJSON, PackageTree
+
+  usage = "Usage: python searchindex.py DOC_DIR|INDEX [TERM...] [Options]"
+  parser = OptionParser(usage=usage)
+  parser.add_option("-o", "--output", dest="output", metavar="FILE",
+    default=None, help="write the index to FILE")
+  parser.add_option("-s", "--shards", dest="shards", metavar="DIR",
+    default=None, help="write the index as shards into DIR")
+
+  (options, args) = parser.parse_args()
+  if len(args) < 1:
+    return parser.print_help()
+
+  src = Path(args[0])
+  jsons = src/"symbols"
+  if jsons.exists: # Build the index from the symbols of a documentation.
+    fqns = [p.namebase for p in jsons.glob("*.json")]
+    index = SearchIndex.from_tree(
+      PackageTree.from_modules(ModuleJSON(jsons, fqn) for fqn in fqns))
+  elif (src/"index.json").exists:
+    index = SearchIndex.load_shards(src)
+  else:
+    index = SearchIndex.load(src)
+  if options.output:
+    index.save(options.output)
+  if options.shards:
+    index.save_shards(options.shards)
+  for term in args[1:]:
+    for name, fqn, kind, modfqn in index.search(term.decode("utf-8")):
+      if fqn != modfqn:
+        fqn = modfqn + ":" + fqn
+      print("%-10s %s" % (kind, fqn))
+
+if __name__ == '__main__':
+  main()
@@ -3,7 +3,41 @@
 # License: zlib/libpng
 from __future__ import unicode_literals
 
-class Module:
+# The kinds and attributes of symbols, in the order of their IDs
+# in the JSON files.
+sym_kinds = tuple(("package module template class interface struct union "
+  "alias typedef enum enummem variable function invariant new delete "
+  "unittest ctor dtor sctor sdtor").split(" "))
+
+sym_attrs = tuple(("private protected package public export abstract auto "
+  "const deprecated extern final override scope static synchronized "
+  "in out ref lazy variadic immutable manifest nothrow pure "
+  "shared gshared thread wild disable property safe system trusted "
+  "C C++ D Windows Pascal System").split(" "))
+
+def attr_bits(attr_ids):
+  """ Returns the bitmask of a list of attribute IDs. """
+  bits = 0
+  for i in attr_ids:
+    bits |= 1 << i
+  return bits
+
+def module_key(module):
+  """ Sorts modules and packages by their names, then by their FQNs.
+    The case-sensitive FQN makes the order independent of insertion. """
+  return (module.name.lower(), module.fqn.lower(), module.fqn)
+
+def symbol_link(modfqn, fqn):
+  """ Returns the anchor of the symbol fqn in the module modfqn. """
+  return "#m-%s:%s" % (modfqn, fqn)
+
+def symbol_key(symbol):
+  """ Sorts symbols by their names. """
+  return symbol.name.lower()
+
+class Module(object):
+  __slots__ = ('pckg_fqn', 'name', 'pckg', 'fqn', 'sym_dict')
+
   def __init__(self, fqn):
     self.pckg_fqn, sep, self.name = fqn.rpartition('.')
     self.pckg = None
@@ -11,20 +45,26 @@ class Module:
     self.sym_dict = {}
 
   def __cmp__(self, other):
-    result = cmp(self.name.lower(), other.name.lower())
-    if result == 0: # Compare fqn if the names are equal.
-      result = cmp(self.fqn.lower(), other.fqn.lower())
-    return result
+    return cmp(module_key(self), module_key(other))
 
   @property
   def symbolTree(self):
     return self.sym_dict['']
 
+  def hasSymbol(self, fqn):
+    return fqn in self.sym_dict
+
+  def symbolLink(self, fqn):
+    """ Returns the anchor of the symbol fqn in this module. """
+    return symbol_link(self.fqn, fqn)
+
   @property
   def link(self):
     return "#m-" + self.fqn
 
 class Package(Module): # Inherit for convenience.
+  __slots__ = ('packages', 'modules')
+
   def __init__(self, fqn):
     Module.__init__(self, fqn)
     self.packages, self.modules = ([], [])
@@ -41,6 +81,19 @@ class Package(Module): # Inherit for convenience.
   def link(self):
     return "#p-" + self.fqn
 
+class KeyList(object):
+  """ A read-only view of the keys of a sorted list, e.g. for bisect. """
+  __slots__ = ('items', 'key')
+
+  def __init__(self, items, key):
+    self.items, self.key = items, key
+
+  def __len__(self):
+    return len(self.items)
+
+  def __getitem__(self, i):
+    return self.key(self.items[i])
+
 class PackageTree:
   """ Represents a tree of all packages and modules in a project. """
   from bisect import bisect_left
@@ -50,13 +103,36 @@ class PackageTree:
     self.modules = [] # Sorted list of all modules.
     self.mod_dict = {} # All modules by FQN.
     self.cat_dict = {} # All symbols by category.
+    self.indexed = [] # IndexedModules, categorized from their index.
+
+  @classmethod
+  def from_modules(cls, modules):
+    """ Builds a sorted tree from any number of modules.
+      Faster than calling addModule() for each module. """
+    tree = cls()
+    tree.modules = sorted(modules, key=module_key)
+    for module in tree.modules: # Sorted, so each package's modules are too.
+      tree.getPackage(module.pckg_fqn).addModule(module)
+      tree.mod_dict[module.fqn] = module
+      tree.addModuleSymbols(module)
+    for package in tree.packages.itervalues():
+      package.packages.sort(key=module_key)
+    return tree
 
   def addModule(self, module):
     self.getPackage(module.pckg_fqn).addModule(module)
-    insert_pos = self.bisect_left(self.modules, module)
+    keys = KeyList(self.modules, module_key)
+    insert_pos = self.bisect_left(keys, module_key(module))
     self.modules.insert(insert_pos, module)
     self.mod_dict[module.fqn] = module
-    if hasattr(module, 'cat_dict'):
+    self.addModuleSymbols(module)
+
+  def addModuleSymbols(self, module):
+    """ Adds the categorized symbols of a module to cat_dict.
+      An IndexedModule is only remembered, so that it isn't loaded. """
+    if isinstance(module, IndexedModule):
+      self.indexed.append(module)
+    elif isinstance(module, ModuleJSON) and module.categorize:
       self.addCatDict(module.cat_dict)
 
   def getPackage(self, fqn):
@@ -73,17 +149,19 @@ class PackageTree:
   def sortTree(self): self.sort(self.root)
 
   def sort(self, pckg):
-    pckg.packages.sort()
-    pckg.modules.sort()
-    for subpckg in pckg.packages:
-      self.sort(subpckg)
+    packages = [pckg]
+    for pckg in packages: # Sort all packages below pckg.
+      pckg.packages.sort(key=module_key)
+      pckg.modules.sort(key=module_key)
+      packages.extend(pckg.packages)
 
   def addCatDict(self, cat_dict):
     for kind, symbol_list in cat_dict.iteritems():
       self.cat_dict.setdefault(kind, []).extend(symbol_list)
 
   def sortCatDict(self):
-    map(list.sort, self.cat_dict.itervalues())
+    for symbol_list in self.cat_dict.itervalues():
+      symbol_list.sort(key=symbol_key)
 
   def listSymbols(self, kinds):
     """ Returns a list of all symbols of certain kinds in this tree. """
@@ -91,7 +169,15 @@ class PackageTree:
     for kind in kinds:
       if kind in self.cat_dict:
         syms.extend(self.cat_dict[kind])
-    syms.sort()
+    # Append the symbols of the indexed modules in the same order
+    # as the categorized ones: by kind, then by module.
+    by_kind = {}
+    for module in self.indexed:
+      for symbol in module.listSymbols(kinds):
+        by_kind.setdefault(symbol.kind, []).append(symbol)
+    for kind in kinds:
+      syms.extend(by_kind.get(kind, []))
+    syms.sort(key=symbol_key)
     return syms
 
   @classmethod
@@ -106,17 +192,34 @@ class PackageTree:
     letter_list.sort(key=unicode.lower)
     return letter_dict, letter_list
 
-class Symbol:
-  """ Represents a D symbol. E.g. a class, a function etc. """
-  def __init__(self, symdict):
-    for attr, val in symdict.items():
-      setattr(self, attr, val)
-    self.parent_fqn, sep, self.name = self.fqn.rpartition('.')
+class Symbol(object):
+  """ Represents a D symbol. E.g. a class, a function etc.
+    The kind is stored as an index into sym_kinds and the attributes
+    as a bitmask of indices into sym_attrs. """
+  __slots__ = ('fqn', 'parent_fqn', 'name', 'kind_id', 'attr_bits', 'loc',
+    'modfqn', 'sub', 'count')
+
+  def __init__(self, fqn, kind_id, attr_bits, loc, modfqn):
+    self.fqn = fqn
+    self.parent_fqn, sep, self.name = fqn.rpartition('.')
+    self.kind_id = kind_id
+    self.attr_bits = attr_bits
+    self.loc = loc
+    self.modfqn = modfqn
     self.sub = []
 
+  @property
+  def kind(self):
+    return sym_kinds[self.kind_id]
+
+  @property
+  def attrs(self):
+    bits = self.attr_bits
+    return [attr for i, attr in enumerate(sym_attrs) if bits >> i & 1]
+
   @property
   def link(self):
-    return "#m-%s:%s" % (self.modfqn, self.fqn)
+    return symbol_link(self.modfqn, self.fqn)
 
   @property
   def beg(self):
@@ -127,34 +230,29 @@ class Symbol:
     return self.loc[1]
 
   def __cmp__(self, other):
-    return cmp(self.name.lower(), other.name.lower())
+    return cmp(symbol_key(self), symbol_key(other))
 
   def __repr__(self):
     return "Symbol(%s)" % self.fqn
 
 class ModuleJSON(Module):
   """ Class for loading a module's symbols from a *.json file. """
+  __slots__ = ('module_fqn', 'categorize', 'cat_dict', 'root')
   import json
 
-  SymKind = ("package module template class interface struct union alias "
-    "typedef enum enummem variable function invariant new delete unittest "
-    "ctor dtor sctor sdtor").split(" ")
-  SymKind = tuple(SymKind).__getitem__
-
-  SymAttr = ("private protected package public export abstract auto const "
-    "deprecated extern final override scope static synchronized "
-    "in out ref lazy variadic immutable manifest nothrow pure "
-    "shared gshared thread wild disable property safe system trusted "
-    "C C++ D Windows Pascal System").split(" ")
-  SymAttr = tuple(SymAttr).__getitem__
+  SymKind = sym_kinds.__getitem__
+  SymAttr = sym_attrs.__getitem__
 
   def __init__(self, path, fqn, categorize=True):
     """ Loads the file and constructs the object. """
     Module.__init__(self, fqn)
     json_path = path/(fqn+".json")
     json_text = json_path.open().read()
-    arrayTree = self.json.loads(json_text)
+    self._load(self.json.loads(json_text), categorize)
 
+  def _load(self, arrayTree, categorize):
+    """ Creates the symbols from the array tree of a JSON file. """
+    fqn = self.fqn
     self.module_fqn = fqn
     self.categorize = categorize
     self.sym_dict = {} # Maps FQNs to symbols.
@@ -172,12 +270,6 @@ class ModuleJSON(Module):
 
   def _visit(self, s, fqn):
     name = s[0]
-    d = {
-      'name': name, 'kind': self.SymKind(s[1]),
-      'attrs': map(self.SymAttr, s[2]),
-      'loc': s[3], 'modfqn': self.module_fqn
-    }
-
     # E.g.: 'tango.core' + '.' + 'Thread'
     fqn += ("." if fqn != "" else "") + name
     # Add ":\d+" suffix if not unique.
@@ -187,9 +279,9 @@ class ModuleJSON(Module):
         sibling.count = 1
       sibling.count += 1
       fqn += ":" + str(sibling.count)
-    d['fqn'] = fqn
 
-    symbol = Symbol(d) # Create the symbol.
+    # Create the symbol.
+    symbol = Symbol(fqn, s[1], attr_bits(s[2]), s[3], self.module_fqn)
     self.sym_dict[fqn] = symbol # Add it to the dictionary.
 
     symbol.sub = members = s[4] # Visit the members of this symbol.
@@ -200,3 +292,145 @@ class ModuleJSON(Module):
       self.cat_dict.setdefault(symbol.kind, []).append(symbol)
 
     return symbol
+
+class IndexedModule(ModuleJSON):
+  """ A module whose symbols are loaded from a SymbolIndex
+    when one of sym_dict, cat_dict or root is accessed the first time.
+    listSymbols() and hasSymbol() use the index and don't load them. """
+  __slots__ = ('index', 'loaded')
+  lazy_attrs = ('sym_dict', 'cat_dict', 'root')
+
+  def __init__(self, index, fqn, categorize=True):
+    Module.__init__(self, fqn)
+    del self.sym_dict
+    self.index = index
+    self.categorize = categorize
+    self.loaded = False
+
+  def __getattr__(self, name): # Only called for unset attributes.
+    if name not in self.lazy_attrs or self.loaded:
+      raise AttributeError(name)
+    self._load(self.index.arrayTree(self.fqn), self.categorize)
+    self.loaded = True
+    return getattr(self, name)
+
+  def unload(self):
+    """ Drops the symbols. They are loaded again on the next access. """
+    if self.loaded:
+      del self.sym_dict, self.cat_dict, self.root
+      self.loaded = False
+
+  def listSymbols(self, kinds):
+    """ Returns new symbols of certain kinds, without their members. """
+    return self.index.symbols(self.fqn, kinds)
+
+  def hasSymbol(self, fqn):
+    return fqn in self.index.symbolFQNs(self.fqn)
+
+class SymbolIndex:
+  """ A packed file with the symbol arrays of all modules of a documentation
+    build, so that they don't have to be read from one JSON file per module.
+    The first line is a JSON object which maps the module FQNs to the
+    [offset, length, table offset, table length, kind mask] of their data
+    after the header. The arrays are copied from the JSON files as they are.
+    The table lists the [fqn, kind ID, attribute bits, loc] of the symbols
+    below the root, and the kind mask has a bit for each kind ID in it.
+    The arrays are parsed, and their Symbols created, only when a module
+    is accessed.
+  """
+  import json
+
+  def __init__(self, path):
+    self.path = path
+    self.file = open(path, "rb")
+    self.offsets = self.json.loads(self.file.readline())
+    self.data_start = self.file.tell()
+    self.fqn_sets = {} # The symbol FQNs of the modules, by module FQN.
+
+  @classmethod
+  def build(cls, json_dir, fqns, dest):
+    """ Packs the files json_dir/<fqn>.json into the index file dest. """
+    offsets, data, offset = {}, [], 0
+    for fqn in fqns:
+      text = (json_dir/(fqn+".json")).open().read()
+      table = cls.symbol_table(cls.json.loads(text))
+      kind_mask = 0
+      for row in table:
+        kind_mask |= 1 << row[1]
+      text = text.encode("utf-8")
+      table = cls.json.dumps(table, separators=(',', ':')).encode("utf-8")
+      offsets[fqn] = [offset, len(text), offset + len(text), len(table),
+                      kind_mask]
+      data += [text, table]
+      offset += len(text) + len(table)
+    f = open(dest, "wb")
+    f.write(cls.json.dumps(offsets, separators=(',', ':')) + "\n")
+    f.writelines(data)
+    f.close()
+    return cls(dest)
+
+  @staticmethod
+  def symbol_table(arrayTree):
+    """ Returns the table rows of the symbols below the root, in the order
+      in which ModuleJSON categorizes them. The FQNs get the same ":N"
+      suffixes as in ModuleJSON._visit(). """
+    rows, counts = [], {}
+    def visit(s, fqn):
+      fqn += ("." if fqn != "" else "") + s[0]
+      count = counts[fqn] = counts.get(fqn, 0) + 1
+      if count > 1:
+        fqn += ":" + str(count)
+      for m in s[4]:
+        visit(m, fqn)
+      rows.append([fqn, s[1], attr_bits(s[2]), s[3]])
+    for m in arrayTree[4]:
+      visit(m, "")
+    return rows
+
+  def __len__(self):
+    return len(self.offsets)
+
+  def __contains__(self, fqn):
+    return fqn in self.offsets
+
+  def fqns(self):
+    """ Returns the FQNs of the modules in the index. """
+    return self.offsets.keys()
+
+  def read(self, offset, length):
+    self.file.seek(self.data_start + offset)
+    return self.json.loads(self.file.read(length).decode("utf-8"))
+
+  def arrayTree(self, fqn):
+    """ Reads and parses the symbol arrays of a module. """
+    return self.read(*self.offsets[fqn][0:2])
+
+  def symbolTable(self, fqn):
+    """ Reads the symbol table of a module. """
+    return self.read(*self.offsets[fqn][2:4])
+
+  def symbolFQNs(self, fqn):
+    """ Returns the set of the symbol FQNs of a module. """
+    fqns = self.fqn_sets.get(fqn)
+    if fqns == None:
+      fqns = set(row[0] for row in self.symbolTable(fqn))
+      self.fqn_sets[fqn] = fqns
+    return fqns
+
+  def symbols(self, fqn, kinds):
+    """ Returns new symbols of certain kinds of a module, without members.
+      The table isn't read if the module has none of the kinds. """
+    kind_ids = set(sym_kinds.index(kind) for kind in kinds)
+    if not any(self.offsets[fqn][4] >> i & 1 for i in kind_ids):
+      return []
+    return [Symbol(row[0], row[1], row[2], row[3], fqn)
+            for row in self.symbolTable(fqn) if row[1] in kind_ids]
+
+  def module(self, fqn, categorize=True):
+    """ Returns a module whose symbols are loaded on demand. """
+    if fqn not in self.offsets:
+      raise Exception("module '%s' is not in the symbol index" % fqn)
+    return IndexedModule(self, fqn, categorize)
+
+  def close(self):
+    self.file.close()
@@ -128,6 +128,10 @@ def main():
     help="create a PDF document")
   parser.add_option("--pykandil", dest="pykandil", default=False, action="store_true",
     help="use Python code to handle kandil, don't pass --kandil to dil")
+  parser.add_option("-j", "--jobs", dest="jobs", metavar="N", default=1,
+    type="int", help="run N dil processes in parallel (0 = one per CPU)")
+  parser.add_option("--incremental", dest="incremental", default=False,
+    action="store_true", help="only regenerate the docs of changed modules")
 
   (options, args) = parser.parse_args(sys.uargv[1:])
 
@@ -188,24 +192,35 @@ def main():
       DOC_FILES.insert(0, DIL.KANDIL.ddoc)
 
     # 3. Generate the documentation.
-    dil_retcode = generate_docs(DIL.EXE, DEST.abspath, MODLIST,
-      DOC_FILES, versions, dil_options, cwd=DIL)
+    if options.jobs == 1 and not options.incremental:
+      dil_retcode = generate_docs(DIL.EXE, DEST.abspath, MODLIST,
+        DOC_FILES, versions, dil_options, cwd=DIL)
+    else:
+      # The manifest is kept next to DEST, so that it isn't archived.
+      manifest = (DEST.abspath + ".manifest.json") \
+        if options.incremental else None
+      dil_retcode, updated_files = generate_docs_parallel(DIL.EXE,
+        DEST.abspath, MODLIST, DOC_FILES, versions, dil_options, cwd=DIL,
+        jobs=options.jobs, manifest=manifest)
 
     if dil_retcode != 0:
       return print("Error: dil return code: %d" % dil_retcode)
 
     # 4. Post processing.
     processed_files = read_modules_list(MODLIST)
-    if TANGO.is_svn:
+    # Only the regenerated HTML files lack the SVN info.
+    svn_files = updated_files if options.incremental else processed_files
+    if TANGO.is_svn and svn_files:
       author_link = 'https://www.ohloh.net/p/dtango/contributors?query={0}'
       rev_link = 'http://www.dsource.org/projects/tango/browser/trunk/{0}?rev={1}'
-      insert_svn_info(processed_files, TANGO.SRC.ROOT, DEST,
+      insert_svn_info(svn_files, TANGO.SRC.ROOT, DEST,
         rev_link, author_link)
 
     # Use Python code to do some stuff for 'kandil'.
     if options.pykandil:
       MODULES_JS = (DEST/"js"/"modules.js").abspath
       generate_modules_js(processed_files, MODULES_JS)
+    generate_search_index(DEST, processed_files)
 
     copy_files(DIL, TANGO, DEST)
 
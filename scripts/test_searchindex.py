@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+from searchindex import SearchIndex
+import unittest
+
+# Run with: python -m unittest test_searchindex
+
+class SearchTest(unittest.TestCase):
+  def setUp(self):
+    self.index = SearchIndex([
+      ("lexer", "dil.lexer", "package", "dil.lexer"),
+      ("Lexer", "dil.lexer.Lexer", "module", "dil.lexer.Lexer"),
+      ("Lexer", "Lexer", "class", "dil.lexer.Lexer"),
+      ("Laxer", "Laxer", "class", "dil.lexer.Lexer"),
+    ])
+
+  def fqns(self, term):
+    return [e[1] for e in self.index.search(term)]
+
+  def test_fuzzy(self):
+    # Two dots allow two edits, like in kandil.
+    self.assertEqual(sorted(self.fqns("lexr..")),
+      ["Laxer", "Lexer", "dil.lexer", "dil.lexer.Lexer"])
+    self.assertEqual(sorted(self.fqns("lexr.")), [])
+
+  def test_single_dot_is_fqn(self):
+    # "lexer." matches the FQNs which contain it, and isn't fuzzy.
+    self.assertEqual(self.fqns("lexer."), ["dil.lexer.Lexer"])
+
+if __name__ == '__main__':
+  unittest.main()